@@ -0,0 +1,114 @@
+import hashlib
+import json
+import mmap
+import os
+import pygame
+
+ASSET_CACHE_DIR = ".asset_cache"   # Created next to main.py, safe to delete at any time
+INDEX_FILE = "index.json"
+CACHE_VERSION = 1                  # Bump to drop every entry when the raw file or index layout changes
+# How a surface was built is not covered by CACHE_VERSION: every op string carries the version of the
+# code that builds it (AssetManager.PROCESSING_VERSION, getProcessedImage's 'version'), bump that one
+# when decode/crop/scale/trim/pad code changes so the old pixels are not served again
+
+
+class AssetDiskCache:
+    """
+    Preprocessed surfaces stored as raw pixels (pygame.image.tobytes), so later launches
+    memory-map them and frombuffer() instead of decoding PNG/JPG and re-running trim/pad/scale.
+    Entries are keyed by (source path, operation) and remember the content hash of the source
+    file, an edited file under graphics/ gets a new hash and its old entries are rebuilt.
+    'op' names the processing and its version, new processing code gets new keys.
+    The index is a small json file: key -> {hash, file, size, format}. store() only marks it dirty,
+    flush() writes it once (main.py after the first states are built, and at exit).
+    """
+    def __init__(self, folder: str = ASSET_CACHE_DIR):
+        self.folder = folder
+        self.index = {}
+        self.sourceHashes = {}  # path -> content hash, each source file is hashed once per launch
+        self.hits = 0
+        self.stores = 0
+        self.enabled = True
+        self.dirty = False      # index has entries that are not on disk yet
+        try:
+            with open(os.path.join(folder, INDEX_FILE), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self.index = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+
+    # ---------- Helpers ----------
+    def _entryKey(self, path: str, op: str) -> str:
+        return path.replace("\\", "/").lower() + "|" + op
+
+    def sourceHash(self, path: str) -> str | None:
+        digest = self.sourceHashes.get(path)
+        if digest is None:
+            try:
+                with open(path, "rb") as f:
+                    digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+            except OSError:
+                return None
+            self.sourceHashes[path] = digest
+        return digest
+
+    def _saveIndex(self):
+        tmp = os.path.join(self.folder, INDEX_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "entries": self.index}, f)
+        os.replace(tmp, os.path.join(self.folder, INDEX_FILE))
+
+    # ---------- Load / Store ----------
+    def load(self, path: str, op: str, alpha: bool = True) -> pygame.Surface | None:
+        """
+        Cached surface for 'op' applied to the file at 'path', None if missing or stale.
+        Returned already converted to the display format (needs a display), alpha like AssetManager.getImage.
+        """
+        if not self.enabled:
+            return None
+        entry = self.index.get(self._entryKey(path, op))
+        if entry is None or entry["hash"] != self.sourceHash(path):
+            return None
+        try:
+            with open(os.path.join(self.folder, entry["file"]), "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = pygame.image.frombuffer(mapped, tuple(entry["size"]), entry["format"])
+                    # frombuffer shares the mapping: converting it is the one copy into a surface we own
+                    surface = view.convert_alpha() if alpha else view.convert()
+                    del view
+        except (OSError, ValueError, pygame.error):
+            return None
+        self.hits += 1
+        return surface
+
+    def store(self, path: str, op: str, surface: pygame.Surface):
+        if not self.enabled:
+            return
+        digest = self.sourceHash(path)
+        if digest is None:
+            return
+        key = self._entryKey(path, op)
+        fmt = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+        fileName = hashlib.blake2b(key.encode("utf-8"), digest_size=12).hexdigest() + ".raw"
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(os.path.join(self.folder, fileName), "wb") as f:
+                f.write(pygame.image.tobytes(surface, fmt))
+            self.index[key] = {"hash": digest, "file": fileName, "size": list(surface.get_size()), "format": fmt}
+            self.dirty = True
+        except OSError:
+            # Read-only install: keep running without the disk cache
+            self.enabled = False
+            return
+        self.stores += 1
+
+    def flush(self):
+        """Writes the index if store() added entries since the last flush."""
+        if not (self.dirty and self.enabled):
+            return
+        try:
+            self._saveIndex()
+        except OSError:
+            self.enabled = False
+        self.dirty = False
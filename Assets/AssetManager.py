@@ -0,0 +1,151 @@
+import pygame
+from Assets.AssetDiskCache import AssetDiskCache
+
+PROCESSING_VERSION = 1  # Part of the disk cache key of decoded/scaled images, bump when _decode or getScaledImage's build changes
+
+
+class AssetManager:
+    """
+    Process-wide cache for images, scaled images, fonts and sounds.
+    Every asset is read from disk exactly once and the same object is handed out
+    after that, so steady-state frames never touch the file system.
+    hits/misses count cache lookups, diskLoads counts actual file reads (decodes).
+    Decoded and processed surfaces are also kept in an on-disk raw pixel cache between launches.
+    """
+    def __init__(self):
+        self.images = {}        # key : (path, alpha), value : pygame.Surface
+        self.scaledImages = {}  # key : (path, alpha, area, size), value : pygame.Surface
+        self.fonts = {}         # key : (path, size), value : pygame.font.Font
+        self.sounds = {}        # key : path, value : pygame.mixer.Sound
+        self.processedImages = {}  # key : (path, op), value : pygame.Surface
+        self.diskCache = AssetDiskCache()
+        self.hits = 0
+        self.misses = 0
+        self.diskLoads = 0
+
+    # ---------- Helpers ----------
+    def _key(self, path: str) -> str:
+        # Asset paths in this repo are written with mixed casing ('Graphics/Backgrounds' vs 'graphics/backgrounds'),
+        # lowercase the key so they all share one cache entry
+        return path.replace("\\", "/").lower()
+
+    def _hit(self, cache: dict, key):
+        value = cache.get(key)
+        if value is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return value
+
+    def _fromDiskCache(self, path: str, op: str, alpha: bool, build) -> pygame.Surface:
+        # Raw pixels are only cached once a display exists, so they are always stored converted
+        if pygame.display.get_surface() is None:
+            return build()
+        image = self.diskCache.load(path, op, alpha)
+        if image is not None:
+            return image
+        image = build()
+        self.diskCache.store(path, op, image)
+        return image
+
+    def _decode(self, path: str, alpha: bool) -> pygame.Surface:
+        image = pygame.image.load(path)
+        self.diskLoads += 1
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha() if alpha else image.convert()
+        return image
+
+    # ---------- Images ----------
+    def getImage(self, path: str, alpha: bool = True) -> pygame.Surface:
+        """
+        Load an image once. alpha=True keeps per-pixel transparency (convert_alpha),
+        alpha=False converts to the display format for fast opaque blits (backgrounds).
+        """
+        key = (self._key(path), alpha)
+        image = self._hit(self.images, key)
+        if image is None:
+            image = self._fromDiskCache(path, f"image:v{PROCESSING_VERSION}:{int(alpha)}", alpha, lambda: self._decode(path, alpha))
+            self.images[key] = image
+        return image
+
+    def getScaledImage(self, path: str, size: tuple[int, int], alpha: bool = True, area: pygame.Rect | None = None) -> pygame.Surface:
+        """
+        Scaled (and optionally cropped to 'area') variant of an image, built once per size.
+        The returned surface is shared, copy() it before mutating (set_alpha, fill...).
+        """
+        areaKey = tuple(area) if area is not None else None
+        key = (self._key(path), alpha, areaKey, tuple(size))
+        scaled = self._hit(self.scaledImages, key)
+        if scaled is None:
+            def build():
+                # Don't keep (or disk-cache) the full-size source just to scale it, some backgrounds are 5120x2880
+                image = self.images.get((self._key(path), alpha)) or self._decode(path, alpha)
+                if area is not None:
+                    image = image.subsurface(pygame.Rect(area))
+                return pygame.transform.scale(image, size)
+            # A cached scaled copy means the full-size source doesn't even get decoded
+            scaled = self._fromDiskCache(path, f"scale:v{PROCESSING_VERSION}:{int(alpha)}:{areaKey}:{tuple(size)}", alpha, build)
+            self.scaledImages[key] = scaled
+        return scaled
+
+    def getProcessedImage(self, path: str, op: str, version: int, build, alpha: bool = True) -> pygame.Surface:
+        """
+        Surface that build() derives from the file at 'path' (trimmed sprites, padded icons...).
+        'op' names the processing and its parameters, 'version' must be bumped whenever the code
+        behind build() changes (it is part of the disk cache key, like 'op').
+        Built once per launch and kept on disk until the source file, op or version changes.
+        """
+        key = (self._key(path), op)
+        image = self._hit(self.processedImages, key)
+        if image is None:
+            image = self._fromDiskCache(path, f"{op}:v{PROCESSING_VERSION}.{version}", alpha, build)
+            self.processedImages[key] = image
+        return image
+
+    # ---------- Fonts ----------
+    def getFont(self, path: str, size: int) -> pygame.font.Font:
+        # Font registry: each (face, size) is parsed once per process, every caller shares that instance
+        key = (self._key(path), size)
+        font = self._hit(self.fonts, key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self.diskLoads += 1
+            self.fonts[key] = font
+        return font
+
+    # ---------- Sounds ----------
+    def getSound(self, path: str) -> pygame.mixer.Sound:
+        # Sounds are shared, so every user of a path should set the same volume
+        key = self._key(path)
+        sound = self._hit(self.sounds, key)
+        if sound is None:
+            sound = pygame.mixer.Sound(path)
+            self.diskLoads += 1
+            self.sounds[key] = sound
+        return sound
+
+    def liveFonts(self) -> int:
+        return len(self.fonts)
+
+    # ---------- Stats ----------
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "diskLoads": self.diskLoads,
+            "images": len(self.images),
+            "scaledImages": len(self.scaledImages),
+            "processedImages": len(self.processedImages),
+            "diskCacheHits": self.diskCache.hits,
+            "fonts": len(self.fonts),
+            "sounds": len(self.sounds),
+        }
+
+    def resetStats(self):
+        self.hits = 0
+        self.misses = 0
+        self.diskLoads = 0
+
+
+# Shared instance used by every State, the DeckManager and the levels
+assetManager = AssetManager()
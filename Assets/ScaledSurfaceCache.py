@@ -0,0 +1,61 @@
+import weakref
+import pygame
+
+
+class ScaledSurfaceCache:
+    """
+    Scaled copies of in-memory surfaces, keyed by (source surface, target size).
+    Each size of a source is scaled once and shared by every object that shows it;
+    entries go away together with their source surface (weak keys).
+    Returned surfaces are shared, copy() them before mutating.
+    """
+    def __init__(self):
+        self.surfaces = weakref.WeakKeyDictionary()  # key : source surface, value : {size: scaled surface}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+        if source.get_size() == tuple(size):
+            # Never cached: a value referencing its own weak key would keep the source alive forever
+            return source
+        sizes = self.surfaces.get(source)
+        if sizes is None:
+            sizes = self.surfaces[source] = {}
+        scaled = sizes.get(size)
+        if scaled is None:
+            self.misses += 1
+            scaled = sizes[size] = pygame.transform.scale(source, size)
+        else:
+            self.hits += 1
+        return scaled
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sources": len(self.surfaces),
+        }
+
+    def resetStats(self):
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared instance used by the card, joker and consumable classes and the states
+scaledSurfaces = ScaledSurfaceCache()
+
+
+class ScaledImage:
+    """
+    Descriptor for 'scaled_image': the object only keeps a handle (its 'scaledSize'),
+    the surface is obj.image scaled to that size, looked up in the shared cache.
+    With no scaledSize set it is just obj.image.
+    """
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        image = obj.image
+        size = getattr(obj, "scaledSize", None)
+        if image is None or size is None:
+            return image
+        return scaledSurfaces.get(image, size)
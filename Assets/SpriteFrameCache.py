@@ -0,0 +1,76 @@
+import weakref
+import pygame
+
+ROTATION_STEP = 0.25  # degrees between cached rotation frames
+SCALE_STEP = 0.01     # scale factor between cached scale frames (1%)
+
+
+class SpriteFrameCache:
+    """
+    Frames of periodic sprite animations (wobble, breathing), keyed by source surface.
+    The animation phase is quantized (ROTATION_STEP degrees, SCALE_STEP scale) so a bounded
+    animation only ever needs a handful of distinct frames: each one is transformed once and
+    every later frame is a lookup + blit. precompute*() builds a whole range up front.
+    Entries go away together with their source surface (weak keys).
+    Returned surfaces are shared, copy() them before mutating.
+    """
+    def __init__(self, rotationStep: float = ROTATION_STEP, scaleStep: float = SCALE_STEP):
+        self.rotationStep = rotationStep
+        self.scaleStep = scaleStep
+        self.frames = weakref.WeakKeyDictionary()  # key : source surface, value : {frame key: surface}
+        self.hits = 0
+        self.misses = 0
+
+    def _frame(self, source: pygame.Surface, key, build) -> pygame.Surface:
+        frames = self.frames.get(source)
+        if frames is None:
+            frames = self.frames[source] = {}
+        frame = frames.get(key)
+        if frame is None:
+            self.misses += 1
+            frame = frames[key] = build()
+        else:
+            self.hits += 1
+        return frame
+
+    # ---------- Lookups ----------
+    def rotated(self, source: pygame.Surface, angle: float) -> pygame.Surface:
+        """source rotated by 'angle' degrees, rounded to the nearest rotation step."""
+        steps = round(angle / self.rotationStep)
+        return self._frame(source, ("rotate", steps),
+                           lambda: pygame.transform.rotate(source, steps * self.rotationStep))
+
+    def scaled(self, source: pygame.Surface, baseSize: tuple[int, int], scale: float) -> pygame.Surface:
+        """source scaled to baseSize * scale, with scale rounded to the nearest scale step."""
+        steps = round(scale / self.scaleStep)
+        size = (int(baseSize[0] * steps * self.scaleStep), int(baseSize[1] * steps * self.scaleStep))
+        return self._frame(source, ("scale", size), lambda: pygame.transform.scale(source, size))
+
+    # ---------- Precompute ----------
+    def precomputeRotation(self, source: pygame.Surface, maxAngle: float):
+        """Builds every rotation frame between -maxAngle and maxAngle."""
+        last = int(maxAngle / self.rotationStep) + 1
+        for steps in range(-last, last + 1):
+            self.rotated(source, steps * self.rotationStep)
+
+    def precomputeScale(self, source: pygame.Surface, baseSize: tuple[int, int], minScale: float, maxScale: float):
+        """Builds every scale frame between minScale and maxScale."""
+        for steps in range(round(minScale / self.scaleStep), round(maxScale / self.scaleStep) + 1):
+            self.scaled(source, baseSize, steps * self.scaleStep)
+
+    # ---------- Stats ----------
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sources": len(self.frames),
+            "frames": sum(len(frames) for frames in self.frames.values()),
+        }
+
+    def resetStats(self):
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared instance used by the wobbling blind image and the breathing title
+spriteFrames = SpriteFrameCache()
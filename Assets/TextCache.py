@@ -0,0 +1,67 @@
+from collections import OrderedDict
+import pygame
+
+MAX_TEXT_SURFACES = 512  # Enough for every label on screen plus a few hundred changing numbers
+
+
+class TextCache:
+    """
+    Shared cache of rendered text, keyed by (font, text, antialias, color, background).
+    Labels that don't change are rasterized once and the same surface is blitted every frame;
+    the least recently used entries are dropped once the cache is full.
+    Returned surfaces are shared, copy() them before drawing on them or changing their alpha.
+    """
+    def __init__(self, maxEntries: int = MAX_TEXT_SURFACES):
+        self.maxEntries = maxEntries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color, background=None) -> pygame.Surface:
+        # pygame.Color is not hashable, store colors as tuples
+        if isinstance(color, pygame.Color):
+            color = tuple(color)
+        if isinstance(background, pygame.Color):
+            background = tuple(background)
+        # The font object itself is part of the key (not id(font)) so a freed font's id can never be reused by mistake
+        key = (font, text, antialias, color, background)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.maxEntries:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    # ---------- Stats ----------
+    def hitRate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.surfaces),
+            "hitRate": self.hitRate(),
+        }
+
+    def resetStats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Shared instance, every State renders its text through it
+textCache = TextCache()
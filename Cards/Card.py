@@ -1,4 +1,5 @@
 from enum import Enum
+from Assets.ScaledSurfaceCache import ScaledImage
 
 class Suit(Enum): # Enumeration for the four card suits
     SPADES = "♠"
@@ -6,6 +7,10 @@ class Suit(Enum): # Enumeration for the four card suits
     DIAMONDS = "♦"
     CLUBS = "♣"
 
+    def __init__(self, symbol):
+        self.index = len(self.__class__.__members__)  # 0..3, used by the bitmask hand evaluator
+        self.lane = 1 << (8 * self.index)              # one byte per suit, so suit counts can be summed in a single int
+
 class Rank(Enum): # Enumeration for the thirteen card ranks
     TWO = 2
     THREE = 3
@@ -21,6 +26,10 @@ class Rank(Enum): # Enumeration for the thirteen card ranks
     KING = 13
     ACE = 14
 
+    def __init__(self, value):
+        self.bit = 1 << (value - 2)            # TWO = bit 0 ... ACE = bit 12, used by the bitmask hand evaluator
+        self.nibble = 1 << (4 * (value - 2))   # 4-bit counter per rank, so rank counts can be summed in a single int
+
 class Enhancement(Enum):
     BASIC = "Basic Card"
     BONUS = "Bonus Card"
@@ -33,10 +42,13 @@ class Enhancement(Enum):
     LUCKY = "Lucky Card"
 
 class Card:
+    scaled_image = ScaledImage()  # image at scaledSize, shared through the scaled-surface cache
+
     def __init__(self, suit: Suit, rank: Rank, image=None, enhancement=Enhancement.BASIC): # Represents a single playing card with suit, rank, and optional image
         self.suit = suit
         self.rank = rank
         self.image = image
+        self.scaledSize = None
         self.faceDown = False
         self.isSelected = False
         self.enhancement = enhancement
@@ -0,0 +1,57 @@
+class EntityRegistry:
+    """
+    Stable integer IDs for jokers, planets and tarots, one registry for the whole process.
+    An entity's ID comes from its name (the first registration of a name gets the next free ID),
+    so it stays the same for the whole run even when a new GameState builds a new joker deck.
+    Player inventories (playerJokers, playerConsumables) store these IDs.
+    get()/resolve() turn them back into the registered object, the last one register()ed under
+    that name. That only suits entities that exist once (planets and tarots are module-level
+    singletons); every joker deck has its own Jokers objects (isActive, scaledSize...), so
+    DeckManager only assign()s their IDs and each state resolves joker IDs against its own deck
+    (GameState.ownedJokers), like it did by name before.
+    """
+    def __init__(self):
+        self.ids: dict[str, int] = {}   # name -> id
+        self.names: list[str] = []      # id -> name
+        self.entities: dict[int, object] = {}  # id -> current object
+
+    def assign(self, entity) -> int:
+        """Sets entity.id from its name, without making it the object get() returns."""
+        entityId = self.ids.get(entity.name)
+        if entityId is None:
+            entityId = self.ids[entity.name] = len(self.names)
+            self.names.append(entity.name)
+        entity.id = entityId
+        return entityId
+
+    def register(self, entity) -> int:
+        """assign() + makes entity the shared object for its ID, replacing any earlier one."""
+        entityId = self.assign(entity)
+        self.entities[entityId] = entity
+        return entityId
+
+    def registerAll(self, entities):
+        for entity in entities:
+            self.register(entity)
+
+    # ---------- Lookups ----------
+    def get(self, entityId: int):
+        return self.entities.get(entityId)
+
+    def resolve(self, entityIds) -> list:
+        """Objects for 'entityIds' in the same order, unknown IDs are skipped."""
+        entities = self.entities
+        return [entities[i] for i in entityIds if i in entities]
+
+    def idOf(self, name: str) -> int | None:
+        return self.ids.get(name)
+
+    def nameOf(self, entityId: int) -> str | None:
+        return self.names[entityId] if 0 <= entityId < len(self.names) else None
+
+    def namesOf(self, entityIds) -> list[str]:
+        return [self.names[i] for i in entityIds]
+
+
+# Shared instance: Planets/Tarots register their cards on import, DeckManager assigns IDs to every joker it creates
+entityRegistry = EntityRegistry()
@@ -1,6 +1,9 @@
 import pygame
+from Assets.ScaledSurfaceCache import ScaledImage
 
 class Jokers:
+    scaled_image = ScaledImage()  # image at scaledSize, shared through the scaled-surface cache
+
     def __init__(self,name: str, description: str, price = 5, chips = 0, mult = 0, image = None, isActive = False):
         self.name = name
         self.description = description
@@ -8,7 +11,9 @@ class Jokers:
         self.chips = chips
         self.mult = mult
         self.image = image
+        self.scaledSize = None
         self.isActive = isActive
+        self.id = None  # stable ID, set by entityRegistry.register
 
     def __str__(self):
         return f"{self.name}: {self.description}"
@@ -1,4 +1,10 @@
+from Assets.ScaledSurfaceCache import ScaledImage
+from Cards.EntityRegistry import entityRegistry
+
+
 class PlanetCard:
+    scaled_image = ScaledImage()  # image at scaledSize, shared through the scaled-surface cache
+
     def __init__(self, name, description, price=6, chips=0, mult=0, image=None, isActive=False):
         self.name = name
         self.description = description
@@ -6,7 +12,9 @@ class PlanetCard:
         self.chips = chips
         self.mult = mult
         self.image = image
+        self.scaledSize = None
         self.isActive = isActive
+        self.id = None  # stable ID, set by entityRegistry.register
 
     def __str__(self):
         return f"{self.name}: {self.description}"
@@ -68,4 +76,6 @@ PLANETS = {
     "Uranus": PlanetCard("Uranus", "levels up Full House", 3, 35, 3),
     "Neptune": PlanetCard("Neptune", "levels up Four of a Kind", 3, 40, 4),
     "Sun": PlanetCard("Sun", "levels up all hands", 12, 30, 2)
-}
\ No newline at end of file
+}
+
+entityRegistry.registerAll(PLANETS.values())
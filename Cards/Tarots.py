@@ -1,15 +1,21 @@
 from Cards.Card import Card, Suit
 from Deck.HandEvaluator import Enhancments_fun, Enhancement
+from Assets.ScaledSurfaceCache import ScaledImage
+from Cards.EntityRegistry import entityRegistry
 
 
 
 class TarotCard:
+    scaled_image = ScaledImage()  # image at scaledSize, shared through the scaled-surface cache
+
     def __init__(self, name, description, price=6, image=None, isConsumed=False):
         self.name = name
         self.description = description
         self.price = price
         self.image = image
+        self.scaledSize = None
         self.isConsumed = isConsumed
+        self.id = None  # stable ID, set by entityRegistry.register
 
     def __str__(self):
         return f"{self.name}: {self.description}"
@@ -103,7 +109,9 @@ class TarotCard:
 
 
         if player_hand:
-            result = Enhancments_fun(player_hand)
+            # Preview of playing the selected cards with the rest of the hand held
+            held = [c for c in player_hand if c not in mutCardsSelected]
+            result = Enhancments_fun(mutCardsSelected, held)
             print("Hand evaluation result:", result)
             return result
 
@@ -120,4 +128,6 @@ TAROTS = {
     "The Hanged Man": TarotCard("The Hanged Man", "Destroys up to 2 selected cards", 3),
     "Death 13": TarotCard("Death 13", "Select 2 cards, convert the left card into the right card [Drag to rearrange]", 3),
     "The World": TarotCard("The World", "Converts up to 3 selected cards to Spades", 3)
-}
\ No newline at end of file
+}
+
+entityRegistry.registerAll(TAROTS.values())
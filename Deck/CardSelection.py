@@ -0,0 +1,56 @@
+from Cards.Card import Card
+
+
+class CardSelection:
+    """
+    Selected cards of the hand as an ordered set: selection order is kept (playHand lays the
+    played cards out in that order, tarots use the first ones) and membership is O(1).
+    It is the only thing that changes card.isSelected, so the flag (and the lifted card
+    position updateCards derives from it) always matches the selection.
+    Indexing and slicing work like on the old list (selection[0], selection[:2]).
+    """
+    def __init__(self, cards=()):
+        self.cards: dict[Card, None] = {}  # dict keys keep insertion order
+        for card in cards:
+            self.add(card)
+
+    def add(self, card: Card) -> bool:
+        """Selects card, returns False if it already was."""
+        if card in self.cards:
+            return False
+        self.cards[card] = None
+        card.isSelected = True
+        return True
+
+    def discard(self, card: Card) -> bool:
+        """Deselects card, returns False if it wasn't selected."""
+        if card not in self.cards:
+            return False
+        del self.cards[card]
+        card.isSelected = False
+        return True
+
+    def clear(self):
+        for card in self.cards:
+            card.isSelected = False
+        self.cards.clear()
+
+    # ---------- Container protocol ----------
+    def __len__(self):
+        return len(self.cards)
+
+    def __contains__(self, card):
+        return card in self.cards
+
+    def __iter__(self):
+        # Iterate over a snapshot so callers can deselect while looping
+        return iter(list(self.cards))
+
+    def __getitem__(self, index):
+        return list(self.cards)[index]
+
+    def toList(self) -> list[Card]:
+        return list(self.cards)
+
+    def copy(self) -> "CardSelection":
+        return CardSelection(self.cards)
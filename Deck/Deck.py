@@ -0,0 +1,88 @@
+import random
+from itertools import islice
+from Cards.Card import Card
+from Deck.DeckComposition import DeckComposition
+
+
+class Deck:
+    """
+    Draw pile with a cursor. cards[top:] are still in the pile (top of the pile = cards[top]),
+    cards[:top] were already drawn and are dropped lazily, so drawing from the top and
+    putting a card on the bottom are both O(1) and len() never scans the pile.
+    'composition' counts the whole run (deck, hand and used cards), drawn cards move to the hand zone.
+    """
+    def __init__(self, cards: list[Card] | None = None, rng=random, composition: DeckComposition | None = None):
+        self.cards = list(cards) if cards else []
+        self.top = 0
+        self.rng = rng
+        self.composition = composition if composition is not None else DeckComposition(self.cards)
+
+    # ---------- Helpers ----------
+    def _compact(self):
+        # Forget drawn cards once they are the bigger half of the list (amortized O(1) per draw)
+        if self.top > 32 and self.top * 2 > len(self.cards):
+            del self.cards[:self.top]
+            self.top = 0
+
+    # ---------- Drawing ----------
+    def draw(self) -> Card | None:
+        if self.top >= len(self.cards):
+            return None
+        card = self.cards[self.top]
+        self.top += 1
+        self._compact()
+        self.composition.move(card, "hand")
+        return card
+
+    def drawCards(self, numCards: int) -> list[Card]:
+        take = min(max(numCards, 0), len(self))
+        drawn = self.cards[self.top:self.top + take]
+        self.top += take
+        self._compact()
+        self.composition.moveAll(drawn, "hand")
+        return drawn
+
+    def putBottom(self, card: Card):
+        self.cards.append(card)
+        self.composition.move(card, "deck")
+
+    def remove(self, card: Card):
+        # Destroyed cards (Glass, The Hanged Man) are pulled out of the pile, O(n) like list.remove
+        index = self.cards.index(card, self.top)
+        del self.cards[index]
+        self.composition.remove(card)
+
+    # ---------- Shuffling ----------
+    def shuffle(self):
+        # Only the cards still in the pile are shuffled, in place
+        remaining = self.cards[self.top:]
+        self.rng.shuffle(remaining)
+        self.cards[self.top:] = remaining
+
+    def reshuffle(self, cards: list[Card]):
+        # Put cards back into the pile (hand/used at the end of a round) and shuffle everything in place
+        del self.cards[:self.top]
+        self.top = 0
+        self.cards.extend(cards)
+        self.composition.moveAll(cards, "deck")
+        self.rng.shuffle(self.cards)
+
+    # ---------- Container protocol ----------
+    def __len__(self):
+        return len(self.cards) - self.top
+
+    def __iter__(self):
+        return islice(self.cards, self.top, None)
+
+    def __contains__(self, card):
+        try:
+            self.cards.index(card, self.top)
+        except ValueError:
+            return False
+        return True
+
+    def toList(self) -> list[Card]:
+        return self.cards[self.top:]
+
+    def copy(self) -> "Deck":
+        return Deck(self.toList(), self.rng, self.composition.copy())
@@ -0,0 +1,130 @@
+from collections import Counter
+from Cards.Card import Card, Suit, Rank, Enhancement
+
+ZONES = ("deck", "hand", "used")
+
+
+class DeckComposition:
+    """
+    Running counts of the run's cards per zone (deck/hand/used) and per rank, suit and enhancement.
+    Every draw, discard, destroy and transform updates the counts, so the pile counter,
+    the deck view and draw odds read totals in O(1) instead of scanning the card lists.
+    Each tracked card remembers the (suit, rank, enhancement, zone) it was counted under,
+    which lets refresh() fix the counts after a tarot changed the card in place.
+    """
+    def __init__(self, cards: list[Card] = (), zone: str = "deck"):
+        self.entries: dict[Card, tuple[Suit, Rank, Enhancement, str]] = {}
+        self.zones = Counter()
+        self.ranks = {z: Counter() for z in ZONES}
+        self.suits = {z: Counter() for z in ZONES}
+        self.enhancements = {z: Counter() for z in ZONES}
+        self.version = 0    # bumped on every change, used to know when cached views are stale
+        self._rows = None
+        self._rowsVersion = -1
+        for card in cards:
+            self.add(card, zone)
+
+    # ---------- Helpers ----------
+    def _count(self, entry, delta: int):
+        suit, rank, enhancement, zone = entry
+        self.zones[zone] += delta
+        self.ranks[zone][rank] += delta
+        self.suits[zone][suit] += delta
+        self.enhancements[zone][enhancement] += delta
+        self.version += 1
+
+    # ---------- Updates ----------
+    def add(self, card: Card, zone: str = "deck"):
+        if card in self.entries:
+            self.move(card, zone)
+            return
+        entry = (card.suit, card.rank, card.enhancement, zone)
+        self.entries[card] = entry
+        self._count(entry, 1)
+
+    def remove(self, card: Card):
+        # Destroyed cards (Glass, The Hanged Man) leave the run
+        entry = self.entries.pop(card, None)
+        if entry is not None:
+            self._count(entry, -1)
+
+    def move(self, card: Card, zone: str):
+        entry = self.entries.get(card)
+        if entry is None:
+            self.add(card, zone)
+        elif entry[3] != zone:
+            self._count(entry, -1)
+            entry = entry[:3] + (zone,)
+            self.entries[card] = entry
+            self._count(entry, 1)
+
+    def moveAll(self, cards, zone: str):
+        for card in cards:
+            self.move(card, zone)
+
+    def refresh(self, card: Card):
+        # Re-count a card whose suit/rank/enhancement changed (Death 13, Star Platinum, The World, ...)
+        entry = self.entries.get(card)
+        if entry is None:
+            return
+        current = (card.suit, card.rank, card.enhancement, entry[3])
+        if current != entry:
+            self._count(entry, -1)
+            self.entries[card] = current
+            self._count(current, 1)
+
+    # ---------- Queries ----------
+    @property
+    def total(self) -> int:
+        return len(self.entries)
+
+    def zoneCount(self, zone: str) -> int:
+        return self.zones[zone]
+
+    def zoneOf(self, card: Card) -> str | None:
+        entry = self.entries.get(card)
+        return entry[3] if entry else None
+
+    def rankCount(self, rank: Rank, zone: str | None = None) -> int:
+        if zone:
+            return self.ranks[zone][rank]
+        return sum(self.ranks[z][rank] for z in ZONES)
+
+    def suitCount(self, suit: Suit, zone: str | None = None) -> int:
+        if zone:
+            return self.suits[zone][suit]
+        return sum(self.suits[z][suit] for z in ZONES)
+
+    def enhancementCount(self, enhancement: Enhancement, zone: str | None = None) -> int:
+        if zone:
+            return self.enhancements[zone][enhancement]
+        return sum(self.enhancements[z][enhancement] for z in ZONES)
+
+    def drawChance(self, rank: Rank | None = None, suit: Suit | None = None) -> float:
+        # Chance that the next card drawn has the given rank or suit
+        left = self.zones["deck"]
+        if not left:
+            return 0.0
+        if rank is not None:
+            return self.ranks["deck"][rank] / left
+        if suit is not None:
+            return self.suits["deck"][suit] / left
+        return 1.0
+
+    def suitRows(self, suits: list[Suit]) -> list[list[Card]]:
+        # Cards of each suit, highest rank first. Rebuilt only after the composition changed
+        if self._rows is None or self._rowsVersion != self.version or self._rows[0] != suits:
+            rows = {suit: [] for suit in suits}
+            for card in sorted(self.entries, key=lambda c: c.rank.value, reverse=True):
+                if card.suit in rows:
+                    rows[card.suit].append(card)
+            self._rows = (list(suits), [rows[suit] for suit in suits])
+            self._rowsVersion = self.version
+        return self._rows[1]
+
+    def copy(self) -> "DeckComposition":
+        clone = DeckComposition()
+        for card, entry in self.entries.items():
+            clone.entries[card] = entry
+            clone._count(entry, 1)
+        return clone
@@ -8,10 +8,21 @@ from Cards.Jokers import Jokers
 from Cards.Planets import PLANETS
 from Cards.Tarots import TAROTS
 from Levels.SubLevel import SubLevel
+from Deck.Deck import Deck
+from Assets.AssetManager import assetManager
+from Cards.EntityRegistry import entityRegistry
 
 import Cards.Planets as Planets
 import Cards.Tarots as Tarots
 
+JOKER_SHEET = 'Graphics/Cards/Joker_Sprites.png'
+JOKER_SPRITE_VERSION = 1  # Disk cache version of the processed joker sprites, bump when _buildJokerImage or its trim/pad/scale helpers change
+
+# Layout of the poker sheets: one row per suit, ranks from column 1 (column 0 is the card back)
+CARD_SHEET_SUITS = [Suit.HEARTS, Suit.CLUBS, Suit.DIAMONDS, Suit.SPADES]
+CARD_SHEET_RANKS = [Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE, Rank.SIX, Rank.SEVEN, Rank.EIGHT,
+                    Rank.NINE, Rank.TEN, Rank.JACK, Rank.QUEEN, Rank.KING, Rank.ACE]
+
 class DeckManager:
     def __init__(self):
         self.resetDeck = False
@@ -24,6 +35,9 @@ class DeckManager:
             "802", "Ogre", "Hog Rider", "Gauntlet", "The Joker"
         ]
         self.sheets = None
+        self.jokerImages = None  # trimmed + scaled joker sprites, built once and shared by every joker deck
+        self.cardAtlas = None  # (suit, rank, enhancement value) -> shared 70x94 subsurface of its sheet
+        self.cardBack = None   # column 0 of the basic sheet, used for The Mark faces and The House
     # ---------- Helpers ----------
     def _scaleToHeightIntegerish(self, surf: pygame.Surface, targetH: int) -> pygame.Surface:
         h = surf.get_height()
@@ -40,41 +54,49 @@ class DeckManager:
         """
         Remove fully-transparent rows/columns around a surface. Returns a new surface
         cropped to the minimal bounding box that contains non-transparent pixels.
+        get_bounding_rect(min_alpha=1) does the alpha scan in C, same box as checking alpha != 0 per pixel.
         """
-        w, h = surf.get_size()
-        pix = surf.copy()
-        # Find bounds
-        left, right = w, 0
-        top, bottom = h, 0
-        found = False
-        for y in range(h):
-            for x in range(w):
-                a = pix.get_at((x, y))[3]
-                if a != 0:
-                    found = True
-                    if x < left:
-                        left = x
-                    if x > right:
-                        right = x
-                    if y < top:
-                        top = y
-                    if y > bottom:
-                        bottom = y
-        if not found:
+        rect = surf.get_bounding_rect(min_alpha=1)
+        if rect.width == 0 or rect.height == 0:
             return surf.copy()
-        rect = pygame.Rect(left, top, right - left + 1, bottom - top + 1)
-        return pix.subsurface(rect).copy()
+        return surf.subsurface(rect).copy()
 
     # ---------- Loading ----------
     def preload_card_images(self):
         self.sheets = {
-            Enhancement.BASIC.value: pygame.image.load('Graphics/Cards/Poker_Sprites.png').convert_alpha(),
-            Enhancement.BONUS.value: pygame.image.load('Graphics/Cards/Poker_Sprites_Bonus.png').convert_alpha(),
-            Enhancement.GLASS.value: pygame.image.load('Graphics/Cards/Poker_Sprites_Glass.png').convert_alpha(),
-            Enhancement.STEEL.value: pygame.image.load('Graphics/Cards/Poker_Sprites_Steel.png').convert_alpha(),
-            Enhancement.LUCKY.value: pygame.image.load('Graphics/Cards/Poker_Sprites_Lucky.png').convert_alpha()
+            Enhancement.BASIC.value: assetManager.getImage('Graphics/Cards/Poker_Sprites.png'),
+            Enhancement.BONUS.value: assetManager.getImage('Graphics/Cards/Poker_Sprites_Bonus.png'),
+            Enhancement.GLASS.value: assetManager.getImage('Graphics/Cards/Poker_Sprites_Glass.png'),
+            Enhancement.STEEL.value: assetManager.getImage('Graphics/Cards/Poker_Sprites_Steel.png'),
+            Enhancement.LUCKY.value: assetManager.getImage('Graphics/Cards/Poker_Sprites_Lucky.png')
         }
 
+    def _buildCardAtlas(self):
+        """
+        Slice every card sheet once. The atlas holds subsurface views of the cached sheets,
+        no pixels are copied, so every card of the same face shares one surface.
+        """
+        if self.sheets is None:
+            self.preload_card_images()
+        self.cardAtlas = {}
+        for suitIdx, suit in enumerate(CARD_SHEET_SUITS):
+            for colIdx, rank in enumerate(CARD_SHEET_RANKS, start=1):
+                rect = pygame.Rect(colIdx * self.srcCardW, suitIdx * self.srcCardH, self.srcCardW, self.srcCardH)
+                for enhancement, sheet in self.sheets.items():
+                    self.cardAtlas[(suit, rank, enhancement)] = sheet.subsurface(rect)
+        self.cardBack = self.sheets[Enhancement.BASIC.value].subsurface(pygame.Rect(0, 0, self.srcCardW, self.srcCardH))
+
+    def getCardImage(self, suit: Suit, rank: Rank, enhancement: Enhancement = Enhancement.BASIC, subLevel: SubLevel = None) -> pygame.Surface:
+        # Shared face for (suit, rank, enhancement), basic face if there is no sheet for that enhancement
+        if self.cardAtlas is None:
+            self._buildCardAtlas()
+        if rank in (Rank.JACK, Rank.QUEEN, Rank.KING) and getattr(subLevel, "bossLevel", None) == "The Mark":
+            return self.cardBack
+        image = self.cardAtlas.get((suit, rank, enhancement.value))
+        if image is None:
+            image = self.cardAtlas[(suit, rank, Enhancement.BASIC.value)]
+        return image
+
     def load_card_images(self, subLevel: SubLevel = None, enhancedCards: list[tuple[Enhancement, Card]]|None = None):
         """
         Load 52 card faces at their original resolution (70x94),
@@ -83,44 +105,31 @@ class DeckManager:
             - Load all possible sprite groups
             - Check the enhancement of the card
                 > From that, decide which spritesheet to pull from
+        Faces come from the sprite atlas, so this is only dictionary lookups (no slicing or copying).
         """
-        # Sheet must be basic for faces drawn by the Mark, as that doesn't let you see your enhancements
-        sheet = self.sheets[Enhancement.BASIC.value]
+        if self.cardAtlas is None:
+            self._buildCardAtlas()
 
-        cardImages = {}
-        useMark = False
-
-        if subLevel is not None:
-            bossName = getattr(subLevel, "bossLevel", None)
-            if bossName == "The Mark":
-                useMark = True
-                markFace = sheet.subsurface(pygame.Rect(0, 0, self.srcCardW, self.srcCardH)).copy()
-
-        suits = [Suit.HEARTS, Suit.CLUBS, Suit.DIAMONDS, Suit.SPADES]
-
-        for suitIdx, suit in enumerate(suits):
-            for colIdx, rank in enumerate([
-                Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE, Rank.SIX,
-                Rank.SEVEN, Rank.EIGHT, Rank.NINE, Rank.TEN,
-                Rank.JACK, Rank.QUEEN, Rank.KING, Rank.ACE
-            ], start=1):
-                cell = {}
-                x = colIdx * self.srcCardW
-                y = suitIdx * self.srcCardH
+        # Group the enhancements by face once instead of scanning the list for each of the 52 cells
+        enhancedFaces = {}
+        if enhancedCards:
+            for enhancement, card in enhancedCards:
+                enhancedFaces.setdefault((card.suit, card.rank), []).append(enhancement)
 
-                if enhancedCards:
-                    for enhancement, card in enhancedCards:
-                        e_suit, e_rank = card.suit, card.rank
-                        if (suit, rank) == (e_suit, e_rank):
-                            sheet = self.sheets[enhancement.value]
-                            cell[enhancement.value] = sheet.subsurface(pygame.Rect(x, y, self.srcCardW, self.srcCardH)).copy()
+        # Faces drawn by the Mark don't let you see your enhancements
+        useMark = getattr(subLevel, "bossLevel", None) == "The Mark" if subLevel is not None else False
 
-                sheet = self.sheets[Enhancement.BASIC.value]
-                cell[Enhancement.BASIC.value] = sheet.subsurface(pygame.Rect(x, y, self.srcCardW, self.srcCardH)).copy()
+        cardImages = {}
+        for suit in CARD_SHEET_SUITS:
+            for rank in CARD_SHEET_RANKS:
+                cell = {}
+                for enhancement in enhancedFaces.get((suit, rank), ()):
+                    cell[enhancement.value] = self.cardAtlas[(suit, rank, enhancement.value)]
+                cell[Enhancement.BASIC.value] = self.cardAtlas[(suit, rank, Enhancement.BASIC.value)]
 
                 if useMark and rank in (Rank.JACK, Rank.QUEEN, Rank.KING):
                     for e in cell:
-                        cell[e] = markFace.copy()
+                        cell[e] = self.cardBack
 
                 cardImages[(suit, rank)] = cell
         return cardImages
@@ -130,8 +139,22 @@ class DeckManager:
         Load Joker sprites from the new 2x5 layout sheet and scale them
         uniformly to the target height. Automatically adjusts slicing
         to prevent out-of-bounds errors.
+        The processed sprites are kept in the on-disk asset cache, later launches skip the trim/pad/scale.
         """
-        sheet = pygame.image.load('Graphics/Cards/Joker_Sprites.png').convert_alpha()
+        if self.jokerImages is not None:
+            return self.jokerImages
+
+        jokers = {}
+        for index, name in enumerate(self.jokerNames):
+            jokers[name] = assetManager.getProcessedImage(
+                JOKER_SHEET, f"joker:{index}:{self.targetJokerH}", JOKER_SPRITE_VERSION,
+                lambda index=index: self._buildJokerImage(index))
+
+        self.jokerImages = jokers
+        return jokers
+
+    def _buildJokerImage(self, index: int) -> pygame.Surface:
+        sheet = assetManager.getImage(JOKER_SHEET)
         sheetW, sheetH = sheet.get_width(), sheet.get_height()
 
         # expected layout is 5 columns x 2 rows — compute cell size from sheet
@@ -139,36 +162,30 @@ class DeckManager:
         cellW = max(1, sheetW // cols)
         cellH = max(1, sheetH // rows)
 
-        jokers = {}
-        for index, name in enumerate(self.jokerNames):
-            row = index // cols
-            col = index % cols
-            x = col * cellW
-            y = row * cellH
-
-            # clamp width/height so we don't request out-of-bounds area
-            w = min(cellW, max(1, sheetW - x))
-            h = min(cellH, max(1, sheetH - y))
-            rect = pygame.Rect(x, y, w, h)
-            subImg = sheet.subsurface(rect).copy()
+        row = index // cols
+        col = index % cols
+        x = col * cellW
+        y = row * cellH
 
-            # Trim empty transparent border that often exists in sprite cells
-            subImg = self._trim_transparent_border(subImg)
+        # clamp width/height so we don't request out-of-bounds area
+        w = min(cellW, max(1, sheetW - x))
+        h = min(cellH, max(1, sheetH - y))
+        rect = pygame.Rect(x, y, w, h)
+        subImg = sheet.subsurface(rect).copy()
 
-            # Ensure a small uniform padding so the sprite isn't cut too tight
-            pad = 4
-            if subImg.get_width() > pad * 2 and subImg.get_height() > pad * 2:
-                padded = pygame.Surface(((subImg.get_width() + pad * 2) - 3, subImg.get_height() + pad * 2), pygame.SRCALPHA)
-                padded.fill((0, 0, 0, 0))
-                padded.blit(subImg, (pad, pad))
-                subImg = padded
+        # Trim empty transparent border that often exists in sprite cells
+        subImg = self._trim_transparent_border(subImg)
 
-            # Scale to target height while preserving crispness
-            subImg = self._scaleToHeightIntegerish(subImg, self.targetJokerH)
+        # Ensure a small uniform padding so the sprite isn't cut too tight
+        pad = 4
+        if subImg.get_width() > pad * 2 and subImg.get_height() > pad * 2:
+            padded = pygame.Surface(((subImg.get_width() + pad * 2) - 3, subImg.get_height() + pad * 2), pygame.SRCALPHA)
+            padded.fill((0, 0, 0, 0))
+            padded.blit(subImg, (pad, pad))
+            subImg = padded
 
-            jokers[name] = subImg
-
-        return jokers
+        # Scale to target height while preserving crispness
+        return self._scaleToHeightIntegerish(subImg, self.targetJokerH)
 
     # ---------- Preload planet art ----------
     def preloadPlanets(self):
@@ -179,7 +196,7 @@ class DeckManager:
         for file in os.listdir(folder):
             if file.startswith("Planet") and file.endswith(".png"):
                 name = os.path.splitext(file)[0]
-                image = pygame.image.load(os.path.join(folder, file)).convert_alpha()
+                image = assetManager.getImage(os.path.join(folder, file))
                 key = name[6:]
                 # Attach image back into PLANETS
                 if key in PLANETS:
@@ -208,7 +225,7 @@ class DeckManager:
         for file in os.listdir(folder):
             if file.startswith("Tarot") and file.endswith(".png"):
                 name = os.path.splitext(file)[0]
-                image = pygame.image.load(os.path.join(folder, file)).convert_alpha()
+                image = assetManager.getImage(os.path.join(folder, file))
                 key = name[5:]
                 # Attach image back into TAROTS
                 if key in ABBREVIATIONS:
@@ -258,7 +275,7 @@ class DeckManager:
             for enhancement in cardImages[card]:
                 if cardImages[card][enhancement]:
                     deck.append(Card(suit=suit, rank=rank, image=cardImages[card][enhancement]))
-        return deck
+        return Deck(deck)
 
     # DONE (TASK 5.1): Complete the priceMap variable by assigning each joker a price.
     #   The key should represent the joker's name, and the value should be the joker's price.
@@ -287,6 +304,7 @@ class DeckManager:
             joker = Jokers(name=name, description="Joker Card", image=image)
             joker.price = price
             joker._sell_price = sellPrice
+            entityRegistry.assign(joker)  # Each deck keeps its own objects, see EntityRegistry
             deckJokers.append(joker)
 
         return deckJokers
@@ -317,21 +335,23 @@ class DeckManager:
 
     # ---------- Utilities ----------
     def shuffleDeck(self, deck): # Shuffles any given deck of card or joker objects
-        random.shuffle(deck)
+        if isinstance(deck, Deck):
+            deck.shuffle()
+        else:
+            random.shuffle(deck)
         return deck
 
-    def dealCards(self, deck, numCards, subLevel: SubLevel = None): # Deals a number of cards from the deck
+    def dealCards(self, deck: Deck, numCards, subLevel: SubLevel = None): # Deals a number of cards from the top of the deck
         dealtCards = []
         bossName = getattr(subLevel, "bossLevel", None) if subLevel is not None else None
 
         houseImage = None
         if bossName == "The House":
-            sheet = pygame.image.load('Graphics/Cards/Poker_Sprites.png').convert_alpha()
-            houseImage = sheet.subsurface(pygame.Rect(0, 0, self.srcCardW, self.srcCardH)).copy()
+            if self.cardAtlas is None:
+                self._buildCardAtlas()
+            houseImage = self.cardBack
 
-        take = min(numCards, len(deck))
-        for _ in range(take):
-            card = deck.pop(0)
+        for card in deck.drawCards(numCards):
             if bossName == "The House":
                 card.image = houseImage
                 card.faceDown = True
@@ -1,6 +1,7 @@
 from enum import Enum
 from Cards.Card import Card, Rank, Suit, Enhancement
 import random
+import numpy as np
 
 HAND_VALUES = {
     "Flush Five": 12,
@@ -18,6 +19,216 @@ HAND_VALUES = {
     "": 0
     }
 
+# ---------- Bitmask evaluator ----------
+# Every hand type gets one bit, ordered by HAND_VALUES so the best hand is always the highest set bit.
+# "Royal Flush" scores like a "Straight Flush" and is the only straight flush the evaluator reports.
+HAND_TYPES = [
+    "High Card",
+    "One Pair",
+    "Two Pair",
+    "Three of a Kind",
+    "Straight",
+    "Flush",
+    "Full House",
+    "Four of a Kind",
+    "Straight Flush",
+    "Royal Flush",
+    "Five of a Kind",
+    "Flush House",
+    "Flush Five",
+]
+HAND_BITS = {name: 1 << i for i, name in enumerate(HAND_TYPES)}
+
+_ROYAL_MASK = Rank.TEN.bit | Rank.JACK.bit | Rank.QUEEN.bit | Rank.KING.bit | Rank.ACE.bit
+
+def _build_straight_table() -> list[int]:
+    # For each 13-bit set of distinct ranks: bit 0 = straight, bit 1 = royal.
+    # Distinct ranks must be consecutive; the only gap allowed is after a FIVE when an ACE is present
+    # ([A, 5, 4, 3, 2], like in base Balatro). Royal means every rank below the highest one is TEN or above.
+    table = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        ranks = [i for i in range(13) if mask >> i & 1]
+        straight = True
+        royal = True
+        for low, high in zip(ranks, ranks[1:]):
+            if low + 1 != high and not (low == Rank.FIVE.value - 2 and mask & Rank.ACE.bit):
+                straight = False
+                break
+            if not (1 << low) & _ROYAL_MASK:
+                royal = False
+        if straight:
+            table[mask] = 3 if royal else 1
+    return table
+
+STRAIGHT_TABLE = _build_straight_table()
+
+# Hot-path constants (module globals are much cheaper than Enum/dict lookups inside the loop)
+_WILD = Enhancement.WILD
+_STONE = Enhancement.STONE
+_LANES = 0x01010101
+_LANE_TOPS = 0x80808080
+_HIGH_CARD, _ONE_PAIR, _TWO_PAIR, _THREE_KIND, _STRAIGHT, _FLUSH, _FULL_HOUSE, _FOUR_KIND, \
+    _STRAIGHT_FLUSH, _ROYAL_FLUSH, _FIVE_KIND, _FLUSH_HOUSE, _FLUSH_FIVE = (1 << i for i in range(len(HAND_TYPES)))
+
+# Rank count vector (one nibble per rank, see Rank.nibble) ->
+#   (hand bits, extra bits if the hand is a flush, (distinct, pairs, trips, quads, fives) rank masks).
+# Filled lazily: a hand of up to 8 cards only has a few thousand distinct count vectors.
+_RANK_CLASSES: dict[int, tuple[int, int, tuple[int, int, int, int, int]]] = {}
+
+def _classify_ranks(counts: int) -> tuple[int, int, tuple[int, int, int, int, int]]:
+    distinct = 0
+    size = 0
+    pairs = trips = quads = fives = 0
+    for i in range(13):
+        n = counts >> (4 * i) & 0xF
+        if n:
+            distinct |= 1 << i
+            size += n
+            if n == 2:
+                pairs |= 1 << i
+            elif n == 3:
+                trips |= 1 << i
+            elif n == 4:
+                quads |= 1 << i
+            elif n == 5:
+                fives |= 1 << i
+
+    mask = _HIGH_CARD
+    flushMask = _FLUSH
+    if pairs:
+        mask |= _ONE_PAIR
+        if pairs & (pairs - 1):
+            mask |= _TWO_PAIR
+    if trips:
+        mask |= _THREE_KIND
+        if pairs:
+            mask |= _FULL_HOUSE
+            flushMask |= _FLUSH_HOUSE
+    if quads:
+        mask |= _FOUR_KIND
+    if fives:
+        mask |= _FIVE_KIND
+        flushMask |= _FLUSH_FIVE
+    if size >= 5:
+        straight = STRAIGHT_TABLE[distinct]
+        if straight:
+            mask |= _STRAIGHT
+            if straight & 2:
+                flushMask |= _ROYAL_FLUSH
+    return mask, flushMask, (distinct, pairs, trips, quads, fives)
+
+def evaluate_hand_bits(hand: list[Card]) -> tuple[str, int]:
+    """
+    Returns (best hand type, bitmask of every hand type contained in 'hand').
+    Ranks and suits are summed into packed count vectors, the rank part is classified once per
+    distinct vector, so a whole hand costs a few integer additions. Hands hold at most 15 cards of one rank.
+    """
+    if not hand:
+        return "High Card", 0
+
+    rank_counts = 0     # one nibble per rank (see Rank.nibble)
+    suit_counts = 0     # one byte per suit (see Suit.lane)
+    wilds = 0
+    for card in hand:
+        rank_counts += card.rank.nibble
+        suit_counts += card.suit.lane
+        if card.enhancement is _WILD:
+            # A Wild card counts towards every suit (on top of its own)
+            wilds += 1
+
+    classes = _RANK_CLASSES.get(rank_counts)
+    if classes is None:
+        classes = _RANK_CLASSES[rank_counts] = _classify_ranks(rank_counts)
+    mask, flushMask, _ = classes
+
+    # Flush: some suit has at least 5 - wilds cards. Adding (128 - need) to every byte sets its top bit
+    # exactly when that suit's count reaches 'need' (counts stay far below 128)
+    need = 5 - wilds
+    if need <= 0 or (suit_counts + (128 - need) * _LANES) & _LANE_TOPS:
+        mask |= flushMask
+
+    return HAND_TYPES[mask.bit_length() - 1], mask
+
+def _top(ranks: int) -> int:
+    # Highest rank bit of a rank mask (0 if empty)
+    return 1 << (ranks.bit_length() - 1) if ranks else 0
+
+def score_kernel(hand: list[Card]) -> tuple[str, int, list[int]]:
+    """
+    Classifies 'hand' and picks its scoring cards in the same pass.
+    Returns (best hand type, hand-type bitmask, ascending indices into 'hand' of the cards that score).
+    Only the cards that form the best hand score, plus Stone cards which always score.
+    """
+    if not hand:
+        return "High Card", 0, []
+
+    rank_counts = 0
+    suit_counts = 0
+    wilds = 0
+    for card in hand:
+        rank_counts += card.rank.nibble
+        suit_counts += card.suit.lane
+        if card.enhancement is _WILD:
+            wilds += 1
+
+    classes = _RANK_CLASSES.get(rank_counts)
+    if classes is None:
+        classes = _RANK_CLASSES[rank_counts] = _classify_ranks(rank_counts)
+    mask, flushMask, (distinct, pairs, trips, quads, fives) = classes
+
+    flushSuit = -1
+    need = 5 - wilds
+    if need <= 0 or (suit_counts + (128 - need) * _LANES) & _LANE_TOPS:
+        mask |= flushMask
+        flushSuit = max(range(4), key=lambda i: suit_counts >> (8 * i) & 0xFF)
+
+    best = 1 << (mask.bit_length() - 1)
+    if best == _FLUSH or best == _ROYAL_FLUSH:
+        scoring = [i for i, c in enumerate(hand) if c.suit.index == flushSuit or c.enhancement is _WILD]
+        if best == _FLUSH:
+            # The five highest cards of the flush
+            scoring = sorted(sorted(scoring, key=lambda i: hand[i].rank.value, reverse=True)[:5])
+    else:
+        if best == _HIGH_CARD or best == _STRAIGHT:
+            ranks = distinct if best == _STRAIGHT else _top(distinct)
+        elif best == _ONE_PAIR:
+            ranks = _top(pairs)
+        elif best == _TWO_PAIR:
+            ranks = _top(pairs)
+            ranks |= _top(pairs & ~ranks)
+        elif best == _THREE_KIND:
+            ranks = _top(trips)
+        elif best == _FULL_HOUSE or best == _FLUSH_HOUSE:
+            ranks = _top(trips) | _top(pairs)
+        elif best == _FOUR_KIND:
+            ranks = _top(quads)
+        else:  # Five of a Kind / Flush Five
+            ranks = _top(fives)
+        scoring = [i for i, c in enumerate(hand) if c.rank.bit & ranks]
+        if best == _HIGH_CARD:
+            scoring = scoring[:1]
+
+    if best == _STRAIGHT or best == _ROYAL_FLUSH:
+        # A straight scores one card per rank
+        seen = 0
+        perRank = []
+        for i in scoring:
+            b = hand[i].rank.bit
+            if not seen & b:
+                seen |= b
+                perRank.append(i)
+        scoring = perRank
+
+    stones = [i for i, c in enumerate(hand) if c.enhancement is _STONE and i not in scoring]
+    if stones:
+        scoring = sorted(scoring + stones)
+
+    return HAND_TYPES[mask.bit_length() - 1], mask, scoring
+
+def hand_contains(mask: int, hand_type: str) -> bool:
+    # O(1) containment test on a mask from evaluate_hand_bits ("does this hand contain a Pair?")
+    return bool(mask & HAND_BITS[hand_type])
+
 # DONE (TASK 3): Implement a function that evaluates a player's poker hand.
 #   Loop through all cards in the given 'hand' list and collect their ranks and suits.
 #   Use a dictionary to count how many times each rank appears to detect pairs, three of a kind, or four of a kind.
@@ -28,111 +239,28 @@ HAND_VALUES = {
 #   and flags to determine if the hand is: "Four of a Kind", "Full House", "Flush", "Straight", "Three of a Kind",
 #   "Two Pair", "One Pair", or "High Card". Return a string with the correct hand type at the end.
 def evaluate_hand(hand: list[Card]):
-    current_hands = set()
+    return evaluate_hand_bits(hand)[0]
 
-    rank_counts: dict[Rank, int] = {}
-    suit_counts: dict[Suit, int] = {}
-    for card in hand:
-        rank_counts[card.rank] = rank_counts.get(card.rank, 0) + 1
-        suit_counts[card.suit] = suit_counts.get(card.suit, 0) + 1
-        if card.enhancement == Enhancement.WILD:
-            suit_counts[Suit.SPADES] = suit_counts.get(Suit.SPADES, 0) + 1
-            suit_counts[Suit.HEARTS] = suit_counts.get(Suit.HEARTS, 0) + 1
-            suit_counts[Suit.CLUBS] = suit_counts.get(Suit.CLUBS, 0) + 1
-            suit_counts[Suit.DIAMONDS] = suit_counts.get(Suit.DIAMONDS, 0) + 1
-
-
-
-    # Check for hand types
-    for rank in rank_counts:
-        match rank_counts[rank]:
-            case 2:
-                if "One Pair" in current_hands:
-                    current_hands.add("Two Pair")
-                elif "Three of a Kind" in current_hands:
-                    current_hands.add("Full House")
-
-                current_hands.add("One Pair")
-            case 3:
-                if "One Pair" in current_hands:
-                    current_hands.add("Full House")
-
-                current_hands.add("Three of a Kind")
-            case 4:
-                current_hands.add("Four of a Kind")
-            case 5:
-                current_hands.add("Five of a Kind")
-
-    # Check for flushes
-    for suit in suit_counts:
-        if suit_counts[suit] >= 5:
-            current_hands.add("Flush")
-
-    # Check for Flush House
-    if ("Flush" in current_hands) and ("Full House" in current_hands):
-        current_hands.add("Flush House")
-
-    if ("Flush" in current_hands) and ("Five of a Kind" in current_hands):
-        current_hands.add("Flush Five")
-
-    # Check for straights and royal
-    royal_list = {Rank.ACE, Rank.KING, Rank.QUEEN, Rank.JACK, Rank.TEN}
-    ranks_set = set()
-    for card in hand:
-        ranks_set.add(card.rank)
-
-    has_straight = False
-    has_royal = False
-    if len(hand) >= 5:
-        ranks_list = list(ranks_set)
-        ranks_list.sort(key=lambda r: r.value)
-        has_straight = True
-        has_royal = True
-        for i in range(len(ranks_list) - 1):
-            card_rank = ranks_list[i]
-            next_card_rank = ranks_list[i + 1]
-            if card_rank.value != next_card_rank.value - 1:
-                # NOTE: Straight only works for numerical sequences or for
-                # [A, 5, 4, 3, 2], like in base Balatro.
-                # It does not numerically shift or overflow the other values
-                if not ((card_rank.value == 5) and (Rank.ACE in ranks_list)):
-                    has_straight = False
-                    break
-
-            if card_rank not in royal_list:
-                has_royal = False
-
-    if has_straight:
-        current_hands.add("Straight")
-        if has_royal and ("Flush" in current_hands):
-            current_hands.add("Royal Flush")
-
-
-    # Final Selection: Check the highest value possible with the hand
-    max_hand: str = ""
-    max_hand_value: int = HAND_VALUES[max_hand]
-    for play_hand in current_hands:
-        score_hand = "Straight Flush" if (play_hand == "Royal Flush") else play_hand
-        if HAND_VALUES[score_hand] > max_hand_value:
-            max_hand_value = HAND_VALUES[score_hand]
-            max_hand = play_hand
-
-    # Return the final selection if something of the above
-    if max_hand != "":
-        return max_hand
-
-    return "High Card"
-
-def Enhancments_fun(hand: list[Card]):
+def Enhancments_fun(hand: list[Card], held: list[Card] | None = None):
+    """
+    Scores 'hand' as a played hand: enhancements of the scoring cards (score_kernel) apply when scored,
+    Steel and Gold apply for the cards in 'held'.
+    """
     destroyed = []
-    hand_type = evaluate_hand(hand)
-    total_chips = sum(c.chips for c in hand if c.enhancement != Enhancement.STONE)
+    hand_type, _, scoring = score_kernel(hand)
+    total_chips = 0
     mult = 1.0
     cash = 0.0
 
-    for card in hand:
+    for i in scoring:
+        card = hand[i]
         enh = card.enhancement
 
+        if enh == Enhancement.STONE:
+            total_chips += 50
+            continue
+        total_chips += card.chips
+
         if enh == Enhancement.BONUS:
             total_chips += 30
 
@@ -145,19 +273,16 @@ def Enhancments_fun(hand: list[Card]):
                 card.isDestroyed = True
                 destroyed.append(card)
 
-        elif enh == Enhancement.STEEL:
-            mult *= 1.5
-
-        elif enh == Enhancement.STONE:
-            total_chips += 50
-
         elif enh == Enhancement.LUCKY:
             if random.random() < 0.20:
                 mult += 20
             if random.random() < 1 / 15:
                 cash += 20.0
 
-        elif enh == Enhancement.GOLD:
+    for card in held or []:
+        if card.enhancement == Enhancement.STEEL:
+            mult *= 1.5
+        elif card.enhancement == Enhancement.GOLD:
             cash += 3.0
 
     total_score = total_chips * mult
@@ -169,4 +294,173 @@ def Enhancments_fun(hand: list[Card]):
         "total_score": total_score,
         "cash": cash,
         "destroyed": destroyed
-    }
\ No newline at end of file
+    }
+
+
+# ---------- Batch scoring (NumPy) ----------
+# Cards are encoded as ints: suit.index * 13 + (rank.value - 2), so code % 13 is the rank bit index
+# and code // 13 the suit index. Enhancements are encoded by their position in the Enhancement enum.
+ENHANCEMENT_CODES = {enhancement: i for i, enhancement in enumerate(Enhancement)}
+_CARD_CHIPS = np.array([card_rank.value if card_rank.value <= 10 else (10 if card_rank.value < 14 else 11) for card_rank in Rank], dtype=np.int64)
+_STRAIGHT_ARRAY = np.array(STRAIGHT_TABLE, dtype=np.int8)
+# Per card code lookups: rank index, suit index, rank bit, rank nibble and suit byte
+_CODE_RANK = np.arange(52, dtype=np.int64) % 13
+_CODE_SUIT = np.arange(52, dtype=np.int64) // 13
+_CODE_RANK_BIT = np.left_shift(1, _CODE_RANK)
+_CODE_NIBBLE = np.left_shift(1, 4 * _CODE_RANK)
+_CODE_LANE = np.left_shift(1, 8 * _CODE_SUIT)
+_NIBBLE_ONES = int("1" * 13, 16)
+_NIBBLE_SEVENS = _NIBBLE_ONES * 7
+_NIBBLE_EIGHTS = _NIBBLE_ONES * 8
+_BATCH_CHUNK = 1 << 16   # rows per pass, keeps the (k, chunk) temporaries cache friendly
+
+def encode_card(card: Card) -> int:
+    return card.suit.index * 13 + card.rank.value - 2
+
+def encode_hands(hands: list[list[Card]]) -> tuple[np.ndarray, np.ndarray]:
+    # Same-size hands -> (cards, enhancements) arrays for score_hands_batch
+    cards = np.array([[encode_card(c) for c in hand] for hand in hands], dtype=np.int16)
+    enhancements = np.array([[ENHANCEMENT_CODES[c.enhancement] for c in hand] for hand in hands], dtype=np.int8)
+    return cards, enhancements
+
+def score_hands_batch(cards: np.ndarray, enhancements: np.ndarray | None, hand_scores: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Scores N hands of k cards at once (cards: (N, k) card codes, enhancements: (N, k) codes or None).
+    Returns (hand type codes as indices into HAND_TYPES, chips, mult) with the same rules as playHand:
+    base chips/mult from 'hand_scores' (GameState.HAND_SCORES) plus the score_kernel scoring cards with
+    their Bonus, Mult, Glass and Stone effects. Random effects (Lucky cards, Glass breaking) are not rolled.
+    """
+    cards = np.asarray(cards)
+    if cards.ndim != 2:
+        raise ValueError(f"cards must be an (N, k) array, got shape {cards.shape}")
+    if enhancements is None:
+        enhancements = np.zeros(cards.shape, dtype=np.int8)
+    enhancements = np.asarray(enhancements)
+    if enhancements.shape != cards.shape:
+        raise ValueError(f"enhancements shape {enhancements.shape} does not match cards shape {cards.shape}")
+
+    base_chips = np.zeros(len(HAND_TYPES), dtype=np.int64)
+    base_mult = np.ones(len(HAND_TYPES), dtype=np.float64)
+    for code, name in enumerate(HAND_TYPES):
+        info = hand_scores.get(name, {"chips": 0, "multiplier": 1})
+        base_chips[code] = info.get("chips", 0)
+        base_mult[code] = info.get("multiplier", 1)
+
+    n = cards.shape[0]
+    types = np.empty(n, dtype=np.int8)
+    chips = np.empty(n, dtype=np.int64)
+    mult = np.empty(n, dtype=np.float64)
+    for start in range(0, n, _BATCH_CHUNK):
+        stop = min(start + _BATCH_CHUNK, n)
+        types[start:stop], chips[start:stop], mult[start:stop] = _score_chunk(
+            cards[start:stop], enhancements[start:stop], base_chips, base_mult)
+    return types, chips, mult
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    # int.bit_length() for non-negative int64 arrays below 2**53 (exact through the float exponent)
+    return np.frexp(values.astype(np.float64))[1].astype(np.int64)
+
+def _top_bit(values: np.ndarray) -> np.ndarray:
+    return np.where(values != 0, np.left_shift(1, np.maximum(_bit_length(values) - 1, 0)), 0)
+
+def _nibbles_equal(packed: np.ndarray, count: int) -> np.ndarray:
+    # Bit 4*i + 3 is set where nibble i of 'packed' equals 'count' (SWAR zero-nibble test, no carries)
+    x = packed ^ (count * _NIBBLE_ONES)
+    return ~(((x & _NIBBLE_SEVENS) + _NIBBLE_SEVENS) | x) & _NIBBLE_EIGHTS
+
+def _score_chunk(cards: np.ndarray, enhancements: np.ndarray, base_chips: np.ndarray, base_mult: np.ndarray):
+    # Works on (k, N) arrays so every per-card step is a contiguous row operation over the whole chunk
+    k, n = cards.shape[1], cards.shape[0]
+    cards = np.ascontiguousarray(cards.T)
+    ranks = _CODE_RANK[cards]
+    suits = _CODE_SUIT[cards]
+    rank_bits = _CODE_RANK_BIT[cards]
+    enhancements = enhancements.T
+    wild = enhancements == ENHANCEMENT_CODES[Enhancement.WILD]
+    stone = enhancements == ENHANCEMENT_CODES[Enhancement.STONE]
+
+    # --- Count vectors: one nibble per rank, one byte per suit (like evaluate_hand_bits) ---
+    rank_counts = _CODE_NIBBLE[cards].sum(axis=0)
+    suit_counts = _CODE_LANE[cards].sum(axis=0)
+    wilds = wild.sum(axis=0, dtype=np.int64)
+    distinct = np.zeros(n, dtype=np.int64)
+    first = np.empty((k, n), dtype=bool)    # card j is the first card of its rank
+    for j in range(k):
+        first[j] = (distinct & rank_bits[j]) == 0
+        distinct |= rank_bits[j]
+    # Rank masks in nibble space: bit 4*i + 3 stands for rank i
+    pairs = _nibbles_equal(rank_counts, 2)
+    trips = _nibbles_equal(rank_counts, 3)
+    quads = _nibbles_equal(rank_counts, 4)
+    fives = _nibbles_equal(rank_counts, 5)
+
+    # --- Hand-type bitmask (same rules as evaluate_hand_bits) ---
+    mask = np.full(n, _HIGH_CARD if k else 0, dtype=np.int64)
+    mask |= np.where(pairs != 0, _ONE_PAIR, 0)
+    mask |= np.where((pairs & (pairs - 1)) != 0, _TWO_PAIR, 0)
+    mask |= np.where(trips != 0, _THREE_KIND, 0)
+    mask |= np.where((trips != 0) & (pairs != 0), _FULL_HOUSE, 0)
+    mask |= np.where(quads != 0, _FOUR_KIND, 0)
+    mask |= np.where(fives != 0, _FIVE_KIND, 0)
+    straight = _STRAIGHT_ARRAY[distinct] if k >= 5 else np.zeros(n, dtype=np.int8)
+    mask |= np.where(straight != 0, _STRAIGHT, 0)
+    need = 5 - wilds
+    flush = (need <= 0) | (((suit_counts + (128 - need) * _LANES) & _LANE_TOPS) != 0)
+    mask |= np.where(flush & ((mask & _FULL_HOUSE) != 0), _FLUSH_HOUSE, 0)
+    mask |= np.where(flush & ((mask & _FIVE_KIND) != 0), _FLUSH_FIVE, 0)
+    mask |= np.where(flush & ((straight & 2) != 0), _ROYAL_FLUSH, 0)
+    mask |= np.where(flush, _FLUSH, 0)
+    types = np.maximum(_bit_length(mask) - 1, 0)
+    best = np.where(mask != 0, np.left_shift(1, types), 0)
+
+    # --- Scoring cards (same rules as score_kernel) ---
+    top_pair = _top_bit(pairs)
+    top_trips = _top_bit(trips)
+    scoring_ranks = np.zeros(n, dtype=np.int64)
+    scoring_ranks = np.where(best == _ONE_PAIR, top_pair, scoring_ranks)
+    scoring_ranks = np.where(best == _TWO_PAIR, top_pair | _top_bit(pairs & ~top_pair), scoring_ranks)
+    scoring_ranks = np.where(best == _THREE_KIND, top_trips, scoring_ranks)
+    scoring_ranks = np.where((best == _FULL_HOUSE) | (best == _FLUSH_HOUSE), top_trips | top_pair, scoring_ranks)
+    scoring_ranks = np.where(best == _FOUR_KIND, _top_bit(quads), scoring_ranks)
+    scoring_ranks = np.where((best == _FIVE_KIND) | (best == _FLUSH_FIVE), _top_bit(fives), scoring_ranks)
+    scoring = ((scoring_ranks >> (4 * ranks + 3)) & 1).astype(bool)
+    scoring |= (best == _HIGH_CARD) & (rank_bits == _top_bit(distinct)) & first
+    scoring |= (best == _STRAIGHT) & first
+
+    # Flushes are rare, their cards are picked on the subset of flush hands only
+    rows = np.nonzero((best == _FLUSH) | (best == _ROYAL_FLUSH))[0]
+    if rows.size:
+        sub_counts = suit_counts[rows]
+        flush_suit = ((sub_counts[:, None] >> (8 * np.arange(4))) & 0xFF).argmax(axis=1)
+        suited = (suits[:, rows] == flush_suit) | wild[:, rows]
+        royal = best[rows] == _ROYAL_FLUSH
+        sub_ranks = ranks[:, rows]
+        picked = suited.copy()
+        # Royal Flush: one card per rank among the flush cards
+        seen = np.zeros(rows.size, dtype=np.int64)
+        for j in range(k):
+            bit = rank_bits[j, rows]
+            picked[j] &= ~royal | ((seen & bit) == 0)
+            seen |= np.where(suited[j], bit, 0)
+        if k > 5:
+            # Flush: the five highest flush cards, ties broken by position (stable sort)
+            order = np.argsort(np.where(suited, -sub_ranks, 1), axis=0, kind="stable")[:5]
+            top5 = np.zeros(suited.shape, dtype=bool)
+            np.put_along_axis(top5, order, True, axis=0)
+            picked &= royal | top5
+        scoring[:, rows] |= picked
+    scoring |= stone
+
+    # --- Chips and mult, card by card in hand order like playHand ---
+    chips = base_chips[types]
+    mult = base_mult[types]
+    bonus_code = ENHANCEMENT_CODES[Enhancement.BONUS]
+    mult_code = ENHANCEMENT_CODES[Enhancement.MULT]
+    glass_code = ENHANCEMENT_CODES[Enhancement.GLASS]
+    for j in range(k):
+        scored = scoring[j] & ~stone[j]
+        enh = enhancements[j]
+        chips += np.where(stone[j], 50, np.where(scored, _CARD_CHIPS[ranks[j]] + np.where(enh == bonus_code, 30, 0), 0))
+        mult = np.where(scored & (enh == mult_code), mult + 4, mult)
+        mult = np.where(scored & (enh == glass_code), mult * 2, mult)
+    return types, chips, mult
@@ -0,0 +1,135 @@
+import random
+from Cards.Card import Card, Enhancement
+from Deck.HandEvaluator import score_kernel
+from Deck.JokerEffects import JokerPipeline, JokerTotals, HandContext, compile_jokers
+
+
+class ScoreResult:
+    """
+    Everything a played hand produces. score_hand only fills this in,
+    the caller (GameState.playHand) decides how to apply it.
+    """
+    def __init__(self, hand_name: str, scoring_cards: list[Card]):
+        self.hand_name = hand_name
+        self.scoring_cards = scoring_cards
+        self.hand_chips = 0             # base chips from the hand level
+        self.card_chips = 0             # chips added by the scoring cards
+        self.chips = 0                  # total chips after jokers and heat
+        self.mult = 1
+        self.score = 0                  # amount added to the round score
+        self.money = 0                  # money delta (Lucky cards)
+        self.hands = 0                  # hands-left delta (Gauntlet)
+        self.destroyed: list[Card] = [] # Glass cards that broke
+        self.activated_jokers: list[str] = []
+
+    def __repr__(self):
+        return f"ScoreResult({self.hand_name}: {self.chips} x {self.mult} = {self.score})"
+
+
+def score_hand(selected: list[Card], held: list[Card], jokers, hand_levels: dict, heat: int = 0, rng=random,
+               joker_count: int | None = None, hands_played: int = 0) -> ScoreResult:
+    """
+    Scores a played hand without touching the game: no pygame, no player state, no global RNG.
+      selected     : cards played, held: cards left in hand
+      jokers       : JokerPipeline from compile_jokers(), or names of the jokers that apply
+                     (disabled ones already removed)
+      hand_levels  : HAND_SCORES-like table {hand name: {"chips", "multiplier"}}
+      heat         : active heat level (0 if heat is not active)
+      rng          : anything with randint (random.Random(seed) for reproducible runs)
+      joker_count  : jokers owned, including disabled ones (Ogre), defaults to len(jokers)
+      hands_played : hands already played this round (Straw Hat)
+    Joker bonuses are summed while the cards are walked and added after the card enhancements,
+    so Glass/Steel only ever multiply the enhancement mult, never a joker bonus.
+    """
+    pipeline = jokers if isinstance(jokers, JokerPipeline) else compile_jokers(jokers)
+    if joker_count is None:
+        joker_count = len(pipeline)
+
+    hand_name, _, scoring = score_kernel(selected)
+    result = ScoreResult(hand_name, [selected[i] for i in scoring])
+    ctx = HandContext(hand_name, selected, held, joker_count, hands_played, rng)
+    jokers_total = JokerTotals()
+
+    # Base values from the hand levels
+    score_info = hand_levels.get(hand_name, {"chips": 0, "multiplier": 1})
+    hand_chips = score_info.get("chips", 0)
+    hand_mult = score_info.get("multiplier", 1)
+    result.hand_chips = hand_chips
+
+    # ----------------- Played cards (enhancements of the scored ones) -----------------
+    scored = set(scoring)
+    played_steps, scored_steps = pipeline.played, pipeline.scored
+    card_chips_sum = 0
+    for i, c in enumerate(selected):
+        if i in scored:
+            if c.enhancement == Enhancement.STONE:
+                card_chips_sum += 50  # Stone cards have no rank, just a flat +50
+            else:
+                card_chips_sum += c.chips
+                match c.enhancement:
+                    case Enhancement.BONUS:
+                        card_chips_sum += 30
+                    case Enhancement.MULT:
+                        hand_mult += 4
+                    case Enhancement.GLASS:
+                        hand_mult *= 2
+                        if rng.randint(1, 4) == 1:
+                            result.destroyed.append(c)
+                    case Enhancement.LUCKY:
+                        if rng.randint(1, 5) == 1:
+                            hand_mult += 20
+                        if rng.randint(1, 15) == 1:
+                            result.money += 20
+            if scored_steps:
+                step = scored_steps.get(c.rank.bit)
+                if step is not None:
+                    jokers_total.run(step, c, ctx)
+        if played_steps:
+            step = played_steps.get(c.rank.bit)
+            if step is not None:
+                jokers_total.run(step, c, ctx)
+    result.card_chips = card_chips_sum
+    total_chips = hand_chips + card_chips_sum
+
+    # ------------------ Held cards ------------------------
+    held_steps = pipeline.held
+    for c in held:
+        if c.enhancement == Enhancement.STEEL:
+            hand_mult *= 1.5
+        if held_steps:
+            step = held_steps.get(c.rank.bit)
+            if step is not None:
+                jokers_total.run(step, c, ctx)
+
+    # ------------------- Joker effects -------------------
+    if pipeline.hand is not None:
+        jokers_total.run(pipeline.hand, ctx)
+    total_chips += jokers_total.chips
+    hand_mult += jokers_total.mult
+
+    # -------------------  HEAT EFFECTS  -------------------
+    if heat == 1:
+        hand_mult *= 2
+    elif heat == 2:
+        hand_mult = int(hand_mult * 1.2)
+        total_chips += 40
+    elif heat == 3:
+        hand_mult = int(hand_mult * 1.8)
+        total_chips += 80
+
+    # ------------------ End of hand ------------------
+    if pipeline.end is not None:
+        chips_before, mult_before = jokers_total.chips, jokers_total.mult
+        jokers_total.run(pipeline.end, ctx)
+        total_chips += jokers_total.chips - chips_before
+        hand_mult += jokers_total.mult - mult_before
+
+    # ------------------ Finalize ------------------
+    result.chips = total_chips
+    result.mult = hand_mult
+    result.score = total_chips * hand_mult * jokers_total.xscore
+    result.hands = jokers_total.hands
+    if jokers_total.triggered:
+        triggered = set(jokers_total.triggered)
+        result.activated_jokers = [name for name in pipeline.order if name in triggered]
+    return result
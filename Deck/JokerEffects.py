@@ -0,0 +1,203 @@
+import math
+from typing import Callable, NamedTuple
+from Cards.Card import Card, Rank
+
+# Trigger phases, in the order score_hand runs them
+PLAYED_CARD = "played_card"  # once per played card (scoring or not)
+SCORED_CARD = "scored_card"  # once per scoring card, right after its enhancement
+HELD_CARD = "held_card"      # once per card left in hand
+ON_HAND = "on_hand"          # once per hand, after the card passes
+END_OF_HAND = "end_of_hand"  # once per hand, after the heat bonus
+PHASES = (PLAYED_CARD, SCORED_CARD, HELD_CARD, ON_HAND, END_OF_HAND)
+CARD_PHASES = (PLAYED_CARD, SCORED_CARD, HELD_CARD)
+ALL_RANKS = sum(rank.bit for rank in Rank)
+
+
+class Bonus(NamedTuple):
+    """What one joker trigger adds. Effects return a Bonus, or None when they don't trigger."""
+    chips: int = 0
+    mult: int = 0
+    hands: int = 0      # hands-left delta
+    xscore: int = 1     # final score multiplier
+
+
+class HandContext:
+    """Read-only facts about the hand being scored, shared by every effect."""
+    __slots__ = ("hand_name", "selected", "held", "joker_count", "hands_played", "rng")
+
+    def __init__(self, hand_name: str, selected: list[Card], held: list[Card], joker_count: int, hands_played: int, rng):
+        self.hand_name = hand_name
+        self.selected = selected
+        self.held = held
+        self.joker_count = joker_count
+        self.hands_played = hands_played
+        self.rng = rng
+
+
+class JokerEffect(NamedTuple):
+    order: int              # registration order, compiled phases keep catalog order
+    name: str
+    phase: str
+    effect: Callable | None # (card, ctx) -> Bonus | None for card phases, (ctx) -> Bonus | None otherwise
+    bonus: Bonus | None     # fixed bonus instead of an effect function
+    ranks: int              # Rank.bit mask of the cards a card phase joker triggers on
+
+
+# key : joker name, value : JokerEffect
+JOKER_EFFECTS: dict[str, JokerEffect] = {}
+
+
+def _register(name: str, phase: str, effect, bonus, ranks: int | None):
+    if phase not in PHASES:
+        raise ValueError(f"Unknown joker phase '{phase}', expected one of {PHASES}")
+    if ranks is not None and phase not in CARD_PHASES:
+        raise ValueError(f"Joker '{name}': only card phases can filter on ranks")
+    JOKER_EFFECTS[name] = JokerEffect(len(JOKER_EFFECTS), name, phase, effect, bonus, ALL_RANKS if ranks is None else ranks)
+
+
+def joker_effect(name: str, phase: str, ranks: int | None = None):
+    """Registers the decorated function as the effect of joker 'name'. 'ranks' limits a card phase to some ranks."""
+    def register(effect):
+        _register(name, phase, effect, None, ranks)
+        return effect
+    return register
+
+
+def joker_bonus(name: str, phase: str, bonus: Bonus, ranks: int | None = None):
+    """Registers a joker that always adds the same bonus (per matching card in a card phase)."""
+    _register(name, phase, None, bonus, ranks)
+
+
+def rank_mask(*ranks: Rank) -> int:
+    return sum(rank.bit for rank in ranks)
+
+
+# ---------- Compiled pipeline ----------
+def _compile_step(effects: list[JokerEffect]):
+    """
+    (fixed joker names, their bonuses folded into one, (name, effect function) pairs) for one phase,
+    None if no joker acts in it.
+    """
+    if not effects:
+        return None
+    fixed = [e for e in effects if e.effect is None]
+    total = Bonus(sum(e.bonus.chips for e in fixed), sum(e.bonus.mult for e in fixed),
+                  sum(e.bonus.hands for e in fixed), math.prod(e.bonus.xscore for e in fixed))
+    dynamic = tuple((e.name, e.effect) for e in effects if e.effect is not None)
+    return tuple(e.name for e in fixed), total, dynamic
+
+
+def _compile_card_step(effects: list[JokerEffect]) -> dict:
+    """Rank.bit -> step, only for the ranks some joker triggers on."""
+    steps = {}
+    for rank in Rank:
+        step = _compile_step([e for e in effects if e.ranks & rank.bit])
+        if step is not None:
+            steps[rank.bit] = step
+    return steps
+
+
+class JokerPipeline:
+    """
+    The owned jokers compiled per phase, in catalog order.
+    Card phases map Rank.bit to the step for that rank, so a card only runs the jokers that can trigger on it.
+    Fixed bonuses of a step are summed at compile time, only effect functions are called per hand.
+    score_hand's cost depends on the jokers owned, not on the size of the catalog.
+    Build it with compile_jokers().
+    """
+    __slots__ = ("count", "order", "played", "scored", "held", "hand", "end")
+
+    def __init__(self, names):
+        names = set(names)
+        self.count = len(names)  # every owned joker, with or without an effect (Ogre counts them all)
+        effects = sorted((JOKER_EFFECTS[n] for n in names if n in JOKER_EFFECTS), key=lambda e: e.order)
+        self.order = tuple(e.name for e in effects)
+        byPhase = {phase: [e for e in effects if e.phase == phase] for phase in PHASES}
+        self.played = _compile_card_step(byPhase[PLAYED_CARD])
+        self.scored = _compile_card_step(byPhase[SCORED_CARD])
+        self.held = _compile_card_step(byPhase[HELD_CARD])
+        self.hand = _compile_step(byPhase[ON_HAND])
+        self.end = _compile_step(byPhase[END_OF_HAND])
+
+    def __len__(self):
+        return self.count
+
+
+_PIPELINES: dict[frozenset, JokerPipeline] = {}
+MAX_CACHED_PIPELINES = 64
+
+
+def compile_jokers(names) -> JokerPipeline:
+    """Pipeline for the jokers in 'names'. Compiled once per distinct inventory, then reused."""
+    key = frozenset(names)
+    pipeline = _PIPELINES.get(key)
+    if pipeline is None:
+        if len(_PIPELINES) >= MAX_CACHED_PIPELINES:
+            _PIPELINES.clear()
+        pipeline = _PIPELINES[key] = JokerPipeline(key)
+    return pipeline
+
+
+class JokerTotals:
+    """Running sums of the joker triggers of one hand, and which jokers triggered."""
+    __slots__ = ("chips", "mult", "hands", "xscore", "triggered")
+
+    def __init__(self):
+        self.chips = 0
+        self.mult = 0
+        self.hands = 0
+        self.xscore = 1
+        self.triggered = []
+
+    def add(self, bonus: Bonus):
+        self.chips += bonus.chips
+        self.mult += bonus.mult
+        self.hands += bonus.hands
+        self.xscore *= bonus.xscore
+
+    def run(self, step, *args):
+        """Applies one compiled step, 'args' are passed on to its effect functions."""
+        names, total, dynamic = step
+        if names:
+            self.triggered += names
+            self.add(total)
+        for name, effect in dynamic:
+            bonus = effect(*args)
+            if bonus is not None:
+                self.triggered.append(name)
+                self.add(bonus)
+
+
+# ---------- Joker catalog ----------
+HOG_RIDER_BONUS = Bonus(chips=100)
+QUESTION_BLOCK_BONUS = Bonus(chips=4)
+NO_BONUS = Bonus()
+
+joker_bonus("The Joker", ON_HAND, Bonus(mult=4))
+
+@joker_effect("Michael Myers", ON_HAND)
+def _michael_myers(ctx):
+    return Bonus(mult=ctx.rng.randint(0, 23))
+
+joker_bonus("Fibonacci", PLAYED_CARD, Bonus(mult=8), ranks=rank_mask(Rank.TWO, Rank.THREE, Rank.FIVE, Rank.EIGHT, Rank.ACE))
+joker_bonus("Gauntlet", ON_HAND, Bonus(chips=250, hands=-2))
+
+@joker_effect("Ogre", ON_HAND)
+def _ogre(ctx):
+    return Bonus(mult=ctx.joker_count * 3)
+
+@joker_effect("Straw Hat", ON_HAND)
+def _straw_hat(ctx):
+    return Bonus(chips=max(0, 100 - (5 * ctx.hands_played)))
+
+@joker_effect("Hog Rider", ON_HAND)
+def _hog_rider(ctx):
+    # Triggers on every hand, only Straights get the chips
+    return HOG_RIDER_BONUS if ctx.hand_name == "Straight" else NO_BONUS
+
+@joker_effect("? Block", ON_HAND)
+def _question_block(ctx):
+    return QUESTION_BLOCK_BONUS if len(ctx.selected) == 4 else None
+
+joker_bonus("Hogwarts", PLAYED_CARD, Bonus(chips=20, mult=4), ranks=rank_mask(Rank.ACE))
+joker_bonus("802", END_OF_HAND, Bonus(xscore=2))
@@ -0,0 +1,51 @@
+import pygame
+
+DIRTY_RECTS = False  # Opt-in (python main.py --dirty-rects), worth it on software-rendered displays
+
+
+class DirtyRects:
+    """
+    Dirty-rectangle display updates.
+    States that set 'usesDirtyRects' report every region they changed with add() while drawing;
+    present() then pushes only those regions plus last frame's (so things that moved or vanished
+    get erased) instead of the whole 1300x750 frame.
+    invalidate() forces a full-frame update: state transitions, full-screen overlays (deck view,
+    red tint, debug menu, CRT flicker) and blocking effects that drew the screen themselves.
+    """
+    def __init__(self, enabled: bool = DIRTY_RECTS):
+        self.enabled = enabled
+        self.rects: list[pygame.Rect] = []
+        self.lastRects: list[pygame.Rect] = []
+        self.full = True
+        self.fullFrames = 0
+        self.partialFrames = 0
+        self.lastCoverage = 1.0  # fraction of the screen pushed by the last present()
+
+    def add(self, rect):
+        if self.enabled and rect:
+            self.rects.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        self.full = True
+
+    def present(self, state=None):
+        screen = pygame.display.get_surface()
+        partial = self.enabled and not self.full and getattr(state, "usesDirtyRects", False)
+        if partial and screen is not None:
+            # Most regions are redrawn at the same place every frame, push each one once
+            rects = [pygame.Rect(r) for r in {tuple(r) for r in self.rects + self.lastRects}]
+            pygame.display.update(rects)
+            screenArea = screen.get_width() * screen.get_height()
+            self.lastCoverage = min(1.0, sum(r.width * r.height for r in rects) / screenArea) if screenArea else 1.0
+            self.partialFrames += 1
+        else:
+            pygame.display.update()
+            self.lastCoverage = 1.0
+            self.fullFrames += 1
+        self.lastRects = self.rects
+        self.rects = []
+        self.full = False
+
+
+# Shared instance, states report the regions they draw to it and main.py presents it
+dirtyRects = DirtyRects()
@@ -0,0 +1,49 @@
+import pygame
+
+FPS_CAP = 60        # Default max rendered frames per second, 0 = uncapped (main.py --fps N)
+TICK_RATE = 60      # Fixed simulation steps per second
+MAX_FRAME_TIME = 0.25  # Clamp long frames (window drag, blocking effects) so logic never spirals
+
+
+class FrameClock:
+    """
+    Frame limiter + fixed-timestep accumulator.
+    tick() sleeps until the frame cap and returns how many fixed steps of 'step' seconds
+    the game logic has to run this frame, so timers behave the same on every machine.
+    'time' is the simulated time in seconds; ticks() gives it in ms like pygame.time.get_ticks().
+    """
+    def __init__(self, fps: int = FPS_CAP, tickRate: int = TICK_RATE, maxFrameTime: float = MAX_FRAME_TIME):
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.step = 1.0 / tickRate
+        self.maxFrameTime = maxFrameTime
+        self.accumulator = 0.0
+        self.dt = 0.0       # real seconds the last frame took (clamped)
+        self.workMs = 0     # ms the last frame spent working, without the frame cap sleep
+        self.time = 0.0     # simulated seconds since start
+
+    def setFrameCap(self, fps: int):
+        self.fps = max(0, fps)
+
+    def tick(self) -> int:
+        ms = self.clock.tick(self.fps)
+        self.workMs = self.clock.get_rawtime()
+        self.dt = min(ms / 1000.0, self.maxFrameTime)
+        self.accumulator += self.dt
+
+        steps = 0
+        while self.accumulator >= self.step:
+            self.accumulator -= self.step
+            self.time += self.step
+            steps += 1
+        return steps
+
+    def ticks(self) -> int:
+        return int(self.time * 1000)
+
+    def getFps(self) -> float:
+        return self.clock.get_fps()
+
+
+# Shared instance driving the main loop, states read the game time from it
+frameClock = FrameClock()
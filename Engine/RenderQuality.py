@@ -0,0 +1,109 @@
+import weakref
+import pygame
+from Engine.DirtyRects import dirtyRects
+
+QUALITY_LEVELS = ("low", "medium", "high")
+QUALITY = "high"            # python main.py --quality low|medium|high
+ADAPTIVE_QUALITY = False    # python main.py --adaptive-quality
+FRAME_BUDGET_MS = 1000 / 60
+ADAPT_COOLDOWN = 120        # frames to wait after a change before judging the new level
+RAISE_AFTER = 300           # frames well under budget before going back up a level
+
+
+class RenderQuality:
+    """
+    Render-quality tiers for the full-screen effects every state draws.
+    high   : CRT overlay alpha-blended as is.
+    medium : CRT overlay baked once into an opaque multiply layer (the overlay is almost pure black,
+             so dst * (1 - a) is the same picture) and blitted with BLEND_RGB_MULT, about 3x cheaper.
+    low    : no CRT overlay.
+    In adaptive mode sample() watches the frame work time and steps down a level when the average
+    goes over the frame budget, and back up (never above the chosen level) once there is room again.
+    Tints (red game over tint, effect flashes) are drawn on every level from one cached surface per color.
+    """
+    def __init__(self, level: str = QUALITY, adaptive: bool = ADAPTIVE_QUALITY, budgetMs: float = FRAME_BUDGET_MS):
+        self.preferred = level  # level picked by the player, adaptive mode never goes above it
+        self.level = level
+        self.adaptive = adaptive
+        self.budgetMs = budgetMs
+        self.avgFrameMs = 0.0
+        self.cooldown = 0
+        self.fastFrames = 0
+        self.changes = 0        # adaptive level changes so far, shown in the debug panel
+        self.multiplyLayers = weakref.WeakKeyDictionary()  # key : overlay surface, value : {overlay alpha: layer}
+        self.tints = {}  # key : rgb, value : [alpha the surface is filled with, surface]
+
+    def setLevel(self, level: str):
+        if level not in QUALITY_LEVELS:
+            raise ValueError(f"Unknown render quality '{level}', expected one of {QUALITY_LEVELS}")
+        self.preferred = self.level = level
+        self.cooldown = ADAPT_COOLDOWN
+        dirtyRects.invalidate()  # the overlay changes on every pixel, push the whole next frame
+
+    # ---------- Adaptive ----------
+    def sample(self, workMs: float):
+        """Feeds the time the last frame spent working (without the frame cap sleep)."""
+        if not self.adaptive:
+            return
+        # Clamp so one loading stall (state change, asset build) doesn't count as a slow machine
+        workMs = min(workMs, self.budgetMs * 2)
+        self.avgFrameMs += (workMs - self.avgFrameMs) * 0.1
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return
+
+        index = QUALITY_LEVELS.index(self.level)
+        if self.avgFrameMs > self.budgetMs and index > 0:
+            self._changeLevel(QUALITY_LEVELS[index - 1])
+        elif self.avgFrameMs < self.budgetMs * 0.5 and index < QUALITY_LEVELS.index(self.preferred):
+            self.fastFrames += 1
+            if self.fastFrames >= RAISE_AFTER:
+                self._changeLevel(QUALITY_LEVELS[index + 1])
+        else:
+            self.fastFrames = 0
+
+    def _changeLevel(self, level: str):
+        self.level = level
+        self.changes += 1
+        self.cooldown = ADAPT_COOLDOWN
+        self.fastFrames = 0
+        dirtyRects.invalidate()
+
+    # ---------- Drawing ----------
+    def drawOverlay(self, screen: pygame.Surface, overlay: pygame.Surface):
+        """Draws a full-screen CRT style overlay the way the current level allows."""
+        if self.level == "low":
+            return
+        if self.level == "high":
+            screen.blit(overlay, (0, 0))
+            return
+        screen.blit(self._multiplyLayer(overlay), (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+
+    def _multiplyLayer(self, overlay: pygame.Surface) -> pygame.Surface:
+        layers = self.multiplyLayers.get(overlay)
+        if layers is None:
+            layers = self.multiplyLayers[overlay] = {}
+        alpha = overlay.get_alpha()  # ShopState changes its overlay's alpha, one layer per value
+        layer = layers.get(alpha)
+        if layer is None:
+            # The overlay composited on white is exactly the factor it scales each pixel by
+            layer = pygame.Surface(overlay.get_size())
+            layer.fill((255, 255, 255))
+            layer.blit(overlay, (0, 0))
+            layers[alpha] = layer
+        return layer
+
+    def drawTint(self, screen: pygame.Surface, color, alpha: int):
+        """Fills the screen with color at alpha, reusing one surface per color instead of a new one each frame."""
+        color = tuple(color)
+        entry = self.tints.get(color)
+        if entry is None or entry[1].get_size() != screen.get_size():
+            entry = self.tints[color] = [None, pygame.Surface(screen.get_size(), pygame.SRCALPHA)]
+        if entry[0] != alpha:
+            entry[1].fill((*color, alpha))
+            entry[0] = alpha
+        screen.blit(entry[1], (0, 0))
+
+
+# Shared instance, every State draws its overlays and tints through it
+renderQuality = RenderQuality()
@@ -0,0 +1,33 @@
+import pygame
+
+
+class SlotRow:
+    """
+    Hit-testing for a row of equally spaced slots (the joker and consumable bars).
+    The draw code calls reset() with the row geometry and place() for every slot it draws,
+    at() then finds the slot under a point with one division instead of testing every rect.
+    Only the slot under the point and its neighbours are tested, so a rect drawn a few pixels
+    outside its slot (activated jokers, consumables while a hand is played) still gets hit.
+    """
+    def __init__(self):
+        self.originX = 0
+        self.pitch = 1
+        self.entries: list = []  # slot index -> (object, rect) or None for an empty slot
+
+    def reset(self, originX: int, pitch: int, count: int):
+        self.originX = originX
+        self.pitch = max(1, pitch)
+        self.entries = [None] * count
+
+    def place(self, index: int, obj, rect: pygame.Rect):
+        self.entries[index] = (obj, rect)
+
+    def at(self, pos):
+        """(object, rect) drawn under pos, or None."""
+        index = (pos[0] - self.originX) // self.pitch
+        for i in (index, index - 1, index + 1):
+            if 0 <= i < len(self.entries):
+                entry = self.entries[i]
+                if entry is not None and entry[1].collidepoint(pos):
+                    return entry
+        return None
@@ -0,0 +1,68 @@
+import os
+import time
+import pygame
+
+# Startup benchmark, run from the repo root:  python -m Engine.StartupBenchmark
+# Times the joker deck build (sprite slicing + border trim + scaling) against the old per-pixel trim
+# and checks that both trims crop to exactly the same pixels.
+
+
+def legacy_trim_transparent_border(surf: pygame.Surface) -> pygame.Surface:
+    # The original get_at() double loop, kept here only as the reference for the benchmark
+    w, h = surf.get_size()
+    left, right = w, 0
+    top, bottom = h, 0
+    found = False
+    for y in range(h):
+        for x in range(w):
+            if surf.get_at((x, y))[3] != 0:
+                found = True
+                left, right = min(left, x), max(right, x)
+                top, bottom = min(top, y), max(bottom, y)
+    if not found:
+        return surf.copy()
+    return surf.subsurface(pygame.Rect(left, top, right - left + 1, bottom - top + 1)).copy()
+
+
+def _timeMs(fn, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1300, 750))
+
+    from Deck.DeckManager import DeckManager
+    from Assets.AssetManager import assetManager
+
+    deckManager = DeckManager()
+    sheet = assetManager.getImage('Graphics/Cards/Joker_Sprites.png')
+    cellW, cellH = sheet.get_width() // 5, sheet.get_height() // 2
+    cells = [sheet.subsurface(pygame.Rect(col * cellW, row * cellH, cellW, cellH)).copy()
+             for row in range(2) for col in range(5)]
+
+    # Same crop as the old loop, pixel for pixel
+    for cell in cells:
+        old, new = legacy_trim_transparent_border(cell), deckManager._trim_transparent_border(cell)
+        assert old.get_size() == new.get_size(), (old.get_size(), new.get_size())
+        assert pygame.image.tobytes(old, "RGBA") == pygame.image.tobytes(new, "RGBA")
+
+    legacyMs = _timeMs(lambda: [legacy_trim_transparent_border(c) for c in cells])
+    trimMs = _timeMs(lambda: [deckManager._trim_transparent_border(c) for c in cells], repeat=50)
+    firstBuildMs = _timeMs(deckManager.createJokerDeck)
+    rebuildMs = _timeMs(deckManager.createJokerDeck, repeat=50)
+
+    print(f"Trim 10 joker cells   legacy get_at loop: {legacyMs:8.2f} ms")
+    print(f"Trim 10 joker cells   get_bounding_rect : {trimMs:8.3f} ms")
+    print(f"createJokerDeck       first build       : {firstBuildMs:8.2f} ms")
+    print(f"createJokerDeck       next GameState    : {rebuildMs:8.3f} ms")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    run()
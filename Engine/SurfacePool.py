@@ -0,0 +1,51 @@
+from collections import OrderedDict
+import pygame
+
+MAX_POOLED_SURFACES = 64  # Enough for every container/overlay drawn in a frame plus a few tooltip sizes
+
+
+class SurfacePool:
+    """
+    Scratch surfaces for draw code that builds a temporary surface, draws on it and blits it.
+    get() hands back the same surface every frame for the same (name, size, flags) and only
+    allocates the first time, so steady-state frames allocate nothing. The surface is filled
+    with 'fill' (transparent by default, None keeps last frame's pixels) before it is returned.
+    'name' separates call sites that need surfaces of the same size at the same time.
+    A pooled surface is only valid until the next get() with the same key, don't keep it.
+    allocations / lastFrameAllocations count the surfaces the pool had to create (debug menu).
+    """
+    def __init__(self, maxEntries: int = MAX_POOLED_SURFACES):
+        self.maxEntries = maxEntries
+        self.surfaces = OrderedDict()
+        self.allocations = 0
+        self.frameAllocations = 0
+        self.lastFrameAllocations = 0
+
+    def get(self, name: str, size, flags: int = pygame.SRCALPHA, fill=(0, 0, 0, 0)) -> pygame.Surface:
+        size = (int(size[0]), int(size[1]))
+        key = (name, size, flags)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, flags)
+            self.surfaces[key] = surface
+            self.allocations += 1
+            self.frameAllocations += 1
+            if len(self.surfaces) > self.maxEntries:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        if fill is not None:
+            surface.fill(fill)
+        return surface
+
+    def endFrame(self):
+        """Called once per frame by the main loop, closes the per-frame allocation count."""
+        self.lastFrameAllocations = self.frameAllocations
+        self.frameAllocations = 0
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Shared instance, states get their scratch surfaces from it
+surfacePool = SurfacePool()
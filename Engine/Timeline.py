@@ -0,0 +1,93 @@
+def linear(t: float) -> float:
+    return t
+
+
+def easeOut(t: float) -> float:
+    return 1 - (1 - t) * (1 - t)
+
+
+class Timeline:
+    """
+    A sequence of timed steps that runs without blocking the game loop.
+    Build it by chaining tween() / wait() / call(), then hand it to an Animator:
+
+        Timeline("flash").tween(0.3, setAlpha, 0, 80).wait(1.0).call(clearFlash)
+
+    Steps run one after another; advance(dt) is fed the frame clock's fixed steps,
+    so effects last the same on every machine and input keeps being handled meanwhile.
+    """
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.steps = []     # (duration, fn) ; fn(progress 0..1) is called while the step runs
+        self.index = 0
+        self.elapsed = 0.0  # seconds spent in the current step
+        self.finished = False
+
+    # ---------- Building ----------
+    def tween(self, duration: float, onUpdate, start: float, end: float, ease=linear):
+        """Calls onUpdate(value) every step with value going from start to end over 'duration' seconds."""
+        self.steps.append((duration, lambda t: onUpdate(start + (end - start) * ease(t))))
+        return self
+
+    def wait(self, duration: float):
+        self.steps.append((duration, None))
+        return self
+
+    def call(self, fn):
+        """Runs fn() once when the timeline reaches this point."""
+        self.steps.append((0.0, lambda t: fn()))
+        return self
+
+    # ---------- Running ----------
+    def advance(self, dt: float) -> bool:
+        """Moves the timeline forward by dt seconds, returns True once every step has run."""
+        while not self.finished:
+            if self.index >= len(self.steps):
+                self.finished = True
+                break
+            duration, fn = self.steps[self.index]
+            self.elapsed += dt
+            dt = 0.0
+            done = self.elapsed >= duration
+            if fn is not None:
+                fn(1.0 if done else self.elapsed / duration)
+            if not done:
+                break
+            # Carry the leftover time into the next step so long frames don't stretch the sequence
+            dt = self.elapsed - duration
+            self.elapsed = 0.0
+            self.index += 1
+        return self.finished
+
+
+class Animator:
+    """
+    Runs the timelines a state registered with play(), advanced from the state's fixedUpdate().
+    Playing a timeline with the name of one that is still running replaces it.
+    """
+    def __init__(self):
+        self.timelines: list[Timeline] = []
+
+    def play(self, timeline: Timeline) -> Timeline:
+        if timeline.name:
+            self.cancel(timeline.name)
+        self.timelines.append(timeline)
+        return timeline
+
+    def cancel(self, name: str):
+        self.timelines = [t for t in self.timelines if t.name != name]
+
+    def clear(self):
+        self.timelines = []
+
+    def isPlaying(self, name: str = None) -> bool:
+        """True while the named timeline (or any timeline, with no name) is running."""
+        if name is None:
+            return bool(self.timelines)
+        return any(t.name == name for t in self.timelines)
+
+    def update(self, dt: float):
+        # Iterate over a copy: a step may play() or cancel() timelines
+        for timeline in list(self.timelines):
+            if timeline in self.timelines and timeline.advance(dt) and timeline in self.timelines:
+                self.timelines.remove(timeline)
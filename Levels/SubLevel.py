@@ -1,4 +1,5 @@
 import pygame
+from Assets.AssetManager import assetManager
 from enum import Enum
 
 class Blind(Enum): # Base score values for each blind type
@@ -17,25 +18,25 @@ class SubLevel():
         self.setUpScore()
         # --------- Loading blind image ----------
         if self.blind == Blind.SMALL:
-            self.image = pygame.image.load("Graphics/Backgrounds/Blinds/smallBlind.png").convert_alpha()
+            self.image = assetManager.getImage("Graphics/Backgrounds/Blinds/smallBlind.png")
         elif self.blind == Blind.BIG:
-            self.image = pygame.image.load("Graphics/Backgrounds/Blinds/bigBlind.png").convert_alpha()
+            self.image = assetManager.getImage("Graphics/Backgrounds/Blinds/bigBlind.png")
         else: # Default image for BOSS or NONE
             if self.bossLevel:
                 if self.bossLevel == "The Water":
-                    self.image = pygame.image.load("Graphics/Backgrounds/Blinds/theWaterBlind.png").convert_alpha()
+                    self.image = assetManager.getImage("Graphics/Backgrounds/Blinds/theWaterBlind.png")
                 elif self.bossLevel == "The Mark":
-                    self.image = pygame.image.load("Graphics/Backgrounds/Blinds/theMarkBlind.png").convert_alpha()
+                    self.image = assetManager.getImage("Graphics/Backgrounds/Blinds/theMarkBlind.png")
                 elif self.bossLevel == "The House":
-                    self.image = pygame.image.load("Graphics/Backgrounds/Blinds/theHouseBlind.png").convert_alpha()
+                    self.image = assetManager.getImage("Graphics/Backgrounds/Blinds/theHouseBlind.png")
                 elif self.bossLevel == "The Hook":
-                    self.image = pygame.image.load("Graphics/Backgrounds/Blinds/theHookBlind.png").convert_alpha()
+                    self.image = assetManager.getImage("Graphics/Backgrounds/Blinds/theHookBlind.png")
                 elif self.bossLevel == "The Manacle":
-                    self.image = pygame.image.load("Graphics/Backgrounds/Blinds/theManacleBlind.png").convert_alpha()
+                    self.image = assetManager.getImage("Graphics/Backgrounds/Blinds/theManacleBlind.png")
                 elif self.bossLevel == "The Needle":
-                    self.image = pygame.image.load("Graphics/Backgrounds/Blinds/theNeedleBlind.png").convert_alpha()
+                    self.image = assetManager.getImage("Graphics/Backgrounds/Blinds/theNeedleBlind.png")
                 else:
-                    self.image = pygame.image.load("Graphics/Backgrounds/Blinds/smallBlind.png").convert_alpha()
+                    self.image = assetManager.getImage("Graphics/Backgrounds/Blinds/smallBlind.png")
 
     def setUpScore(self): # Sets up score based on blind and ante values
         if self.blind != Blind.NONE and self.ante != 0:  # Calculate score only if blind is valid and ante is valid
@@ -1,9 +1,17 @@
-from States.GameState import GameState
+from States.GameState import GameState, HAND_SIZE
 from States.Core.StateClass import State
 from Levels.SubLevel import SubLevel, Blind
+from Deck.Deck import Deck
+from Deck.CardSelection import CardSelection
+from Engine.Timeline import Timeline
 import pygame
 import random
 import os
+from Assets.AssetManager import assetManager
+from Assets.TextCache import textCache
+from Engine.FrameClock import frameClock
+from Engine.RenderQuality import renderQuality
+from Engine.SurfacePool import surfacePool
 
 BOSS_RUSH_BOSSES = [
     {
@@ -58,6 +66,7 @@ BOSS_RUSH_BOSSES = [
 ]
 
 class BossRushState(GameState):
+    usesDirtyRects = False  # transitions and timers draw straight to the display, keep full-frame updates
     def __init__(self, nextState: str = "", playerInfo=None):
         self.restoring_from_save = False
         self.coming_from_run_info = False
@@ -92,7 +101,7 @@ class BossRushState(GameState):
             self.hand = saved['hand']
             self.deck = saved['deck']
             self.used = saved['used']
-            self.cardsSelectedList = saved['cardsSelectedList']
+            self.cardsSelectedList = CardSelection(saved['cardsSelectedList'])
             self.playerJokers = saved['playerJokers']
             self.playerConsumables = saved['playerConsumables']
             self.hands_played_this_boss = saved['hands_played_this_boss']
@@ -144,8 +153,8 @@ class BossRushState(GameState):
             self.current_boss_ability = None
             self.hands_played_this_boss = 0
             self.boss_phase = 1
-            self.boss_ability_timer = pygame.time.get_ticks()
-            self.last_hand_time = pygame.time.get_ticks()
+            self.boss_ability_timer = frameClock.ticks()
+            self.last_hand_time = frameClock.ticks()
             self.disabled_joker_this_round = False
             self.phase_changed = False
             self.disabled_jokers = []
@@ -184,8 +193,8 @@ class BossRushState(GameState):
         self.current_boss_ability = None
         self.hands_played_this_boss = 0
         self.boss_phase = 1
-        self.boss_ability_timer = pygame.time.get_ticks()
-        self.last_hand_time = pygame.time.get_ticks()
+        self.boss_ability_timer = frameClock.ticks()
+        self.last_hand_time = frameClock.ticks()
         self.disabled_joker_this_round = False
         self.phase_changed = False
         self.disabled_jokers = []
@@ -211,14 +220,11 @@ class BossRushState(GameState):
             bg_path = boss["background"]
             try:
                 if os.path.exists(bg_path):
-                    self.backgroundImage = pygame.image.load(bg_path)
-                    self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
+                    self.background = assetManager.getScaledImage(bg_path, (1300, 750), alpha=False)
                 else:
-                    self.backgroundImage = pygame.image.load('Graphics/Backgrounds/gameplayBG.jpg')
-                    self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
+                    self.background = assetManager.getScaledImage('Graphics/Backgrounds/gameplayBG.jpg', (1300, 750), alpha=False)
             except Exception as e:
-                self.backgroundImage = pygame.image.load('Graphics/Backgrounds/gameplayBG.jpg')
-                self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
+                self.background = assetManager.getScaledImage('Graphics/Backgrounds/gameplayBG.jpg', (1300, 750), alpha=False)
 
             self.bossMusic_path = f"Graphics/Sounds/{boss['theme']}"
 
@@ -238,8 +244,8 @@ class BossRushState(GameState):
         # Reset boss ability tracking
         self.hands_played_this_boss = 0
         self.boss_phase = 1
-        self.boss_ability_timer = pygame.time.get_ticks()
-        self.last_hand_time = pygame.time.get_ticks()
+        self.boss_ability_timer = frameClock.ticks()
+        self.last_hand_time = frameClock.ticks()
         self.disabled_joker_this_round = False
         self.phase_changed = False
 
@@ -247,16 +253,13 @@ class BossRushState(GameState):
         bg_path = boss["background"]
         try:
             if os.path.exists(bg_path):
-                self.backgroundImage = pygame.image.load(bg_path)
-                self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
+                self.background = assetManager.getScaledImage(bg_path, (1300, 750), alpha=False)
             else:
                 # Use default background if boss background not found
-                self.backgroundImage = pygame.image.load('Graphics/Backgrounds/gameplayBG.jpg')
-                self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
+                self.background = assetManager.getScaledImage('Graphics/Backgrounds/gameplayBG.jpg', (1300, 750), alpha=False)
         except Exception as e:
             # If any error occurs, use default background
-            self.backgroundImage = pygame.image.load('Graphics/Backgrounds/gameplayBG.jpg')
-            self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
+            self.background = assetManager.getScaledImage('Graphics/Backgrounds/gameplayBG.jpg', (1300, 750), alpha=False)
 
         # Create a SubLevel for this boss
         self.playerInfo.levelManager.curSubLevel = SubLevel(
@@ -287,7 +290,7 @@ class BossRushState(GameState):
             self.hand = self.deckManager.dealCards(self.deck, 8, self.playerInfo.levelManager.curSubLevel)
 
         self.used = []
-        self.cardsSelectedList = []
+        self.cardsSelectedList.clear()
         self.cardsSelectedRect = {}
         self.updateCards(400, 520, self.cards, self.hand, scale=1.2)
 
@@ -351,7 +354,7 @@ class BossRushState(GameState):
         if (self.current_boss_ability == "disables_random_joker" and
                 not self.disabled_joker_this_round):
 
-            current_time = pygame.time.get_ticks()
+            current_time = frameClock.ticks()
             time_since_boss_start = current_time - self.boss_ability_timer
 
             if time_since_boss_start > 10000:  # 10 seconds
@@ -376,7 +379,7 @@ class BossRushState(GameState):
 
     def check_gundyr_aggression(self):
         """Check if player is taking too long for Gundyr or Soul of Cinder Phase 3"""
-        current_time = pygame.time.get_ticks()
+        current_time = frameClock.ticks()
         time_since_last_hand = current_time - self.last_hand_time
 
         # Gundyr's time pressure: 15 seconds
@@ -386,7 +389,7 @@ class BossRushState(GameState):
                 try:
                     card = random.choice(self.hand)
                     self.hand.remove(card)
-                    self.deck.append(card)
+                    self.deck.putBottom(card)
 
                     if len(self.hand) == 0 and not self.gameOverTriggered:
                         self.trigger_card_depletion_game_over()
@@ -406,7 +409,7 @@ class BossRushState(GameState):
                 try:
                     card = random.choice(self.hand)
                     self.hand.remove(card)
-                    self.deck.append(card)
+                    self.deck.putBottom(card)
                     if len(self.hand) == 0 and not self.gameOverTriggered:
                         self.trigger_card_depletion_game_over()
                         return
@@ -437,13 +440,8 @@ class BossRushState(GameState):
                     if card not in self.cardsSelectedList:
                         return
 
-                    # Remove from selected list
-                    self.cardsSelectedList.remove(card)
-
-                    # Deselect it visually if it's still in the cards dictionary
-                    if card in self.cards:
-                        card.isSelected = False
-                        self.cards[card].y += 50
+                    # Deselect it (also lowers it back if it's still in the cards dictionary)
+                    self.setCardSelected(card, False)
 
                     # Handle as destroyed card
                     result = {"destroyed_cards": [card], "effect": "soul_of_cinder_discard"}
@@ -471,7 +469,7 @@ class BossRushState(GameState):
             self.check_soul_of_cinder_phases()
 
         # Update last hand time for time pressure mechanics
-        self.last_hand_time = pygame.time.get_ticks()
+        self.last_hand_time = frameClock.ticks()
 
     def apply_pre_hand_abilities(self):
         """Apply abilities that affect the hand before playing"""
@@ -482,7 +480,8 @@ class BossRushState(GameState):
         if self.current_boss_ability == "honorable_duel":
             if len(self.cardsSelectedList) > 4:
                 # Trim selection to max 4 cards
-                self.cardsSelectedList = self.cardsSelectedList[:4]
+                for card in self.cardsSelectedList[4:]:
+                    self.setCardSelected(card, False)
                 # Also update visual selection
                 self.cardsSelectedRect = {k: v for k, v in list(self.cardsSelectedRect.items())[:4]}
 
@@ -502,7 +501,7 @@ class BossRushState(GameState):
 
                 # Show penalty text
                 penalty_text = f"(GAEL PENALTY -50%) -> +{self.pending_round_add}"
-                self.scoreBreakdownTextSurface = self.playerInfo.textFont2.render(
+                self.scoreBreakdownTextSurface = textCache.render(self.playerInfo.textFont2, 
                     penalty_text, True, (255, 100, 100)
                 )
 
@@ -514,7 +513,7 @@ class BossRushState(GameState):
 
             # Show penalty text
             penalty_text = f"(SOUL OF CINDER -5%) -> +{self.pending_round_add}"
-            self.scoreBreakdownTextSurface = self.playerInfo.textFont2.render(
+            self.scoreBreakdownTextSurface = textCache.render(self.playerInfo.textFont2, 
                 penalty_text, True, (255, 100, 100)
             )
     def check_soul_of_cinder_phases(self):
@@ -539,7 +538,7 @@ class BossRushState(GameState):
             self.boss_phase = 3
             self.phase_changed = True
             # Phase 3: Time pressure + -5% score reduction
-            self.last_hand_time = pygame.time.get_ticks()
+            self.last_hand_time = frameClock.ticks()
 
         # Phase 4 at 75% progress
         elif self.boss_phase == 3 and current_progress >= 0.75:
@@ -608,24 +607,24 @@ class BossRushState(GameState):
         pygame.draw.rect(card_surface, (30, 30, 50), card_surface.get_rect(), border_radius=15)
         pygame.draw.rect(card_surface, (60, 60, 80), card_surface.get_rect(), 3, border_radius=15)
 
-        title_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 40)
-        title_text = title_font.render("NEXT BOSS", True, (255, 215, 0))
+        title_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 40)
+        title_text = textCache.render(title_font, "NEXT BOSS", True, (255, 215, 0))
         card_surface.blit(title_text, (card_width // 2 - title_text.get_width() // 2, 30))
 
-        name_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 50)
-        name_text = name_font.render(next_boss["name"], True, (255, 100, 100))
+        name_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 50)
+        name_text = textCache.render(name_font, next_boss["name"], True, (255, 100, 100))
         card_surface.blit(name_text, (card_width // 2 - name_text.get_width() // 2, 100))
 
-        score_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 35)
-        score_text = score_font.render(f"Score: {next_boss['score']}", True, (200, 200, 255))
+        score_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 35)
+        score_text = textCache.render(score_font, f"Score: {next_boss['score']}", True, (200, 200, 255))
         card_surface.blit(score_text, (card_width // 2 - score_text.get_width() // 2, 180))
 
         # Money notification
-        money_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 28)
-        money_text = money_font.render(f"+$100 earned", True, (100, 255, 100))
+        money_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 28)
+        money_text = textCache.render(money_font, f"+$100 earned", True, (100, 255, 100))
         card_surface.blit(money_text, (card_width // 2 - money_text.get_width() // 2, 230))
 
-        progress_text = score_font.render(
+        progress_text = textCache.render(score_font, 
             f"{self.current_boss_index + 1}/{len(BOSS_RUSH_BOSSES)}",
             True, (200, 255, 200)
         )
@@ -634,12 +633,12 @@ class BossRushState(GameState):
         self.screen.fill((0, 0, 0))  # Black background
         self.screen.blit(card_surface, (card_x, card_y))
 
-        continue_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 25)
-        continue_text = continue_font.render("Continuing in 2 seconds...", True, (150, 150, 150))
+        continue_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 25)
+        continue_text = textCache.render(continue_font, "Continuing in 2 seconds...", True, (150, 150, 150))
         self.screen.blit(continue_text, (650 - continue_text.get_width() // 2, 700))
 
         if hasattr(self, 'tvOverlay'):
-            self.screen.blit(self.tvOverlay, (0, 0))
+            renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
         pygame.display.update()
 
@@ -655,12 +654,12 @@ class BossRushState(GameState):
             self.screen.blit(card_surface, (card_x, card_y))
 
             # Fade continue text too
-            continue_text_surface = continue_font.render("Continuing in 2 seconds...", True,
+            continue_text_surface = textCache.render(continue_font, "Continuing in 2 seconds...", True,
                                                          (150, 150, 150, alpha))
             self.screen.blit(continue_text_surface, (650 - continue_text.get_width() // 2, 700))
 
             if hasattr(self, 'tvOverlay'):
-                self.screen.blit(self.tvOverlay, (0, 0))
+                renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
             pygame.display.update()
             pygame.time.wait(100)
@@ -683,7 +682,7 @@ class BossRushState(GameState):
             self.screen.blit(fade_surface, (0, 0))
 
             if hasattr(self, 'tvOverlay'):
-                self.screen.blit(self.tvOverlay, (0, 0))
+                renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
             pygame.display.update()
             pygame.time.wait(100)
@@ -705,26 +704,26 @@ class BossRushState(GameState):
         self.screen.fill((0, 0, 0))
 
         # Draw title
-        title_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 72)
-        title = title_font.render("BOSS RUSH COMPLETE!", True, (255, 215, 0))
+        title_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 72)
+        title = textCache.render(title_font, "BOSS RUSH COMPLETE!", True, (255, 215, 0))
         self.screen.blit(title, (650 - title.get_width() // 2, 100))
 
 
-        stats_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 48)
+        stats_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 48)
 
-        congrats = stats_font.render(f"Thank you for playing Boss Rush! (This was a bitch to make...)",
+        congrats = textCache.render(stats_font, f"Thank you for playing Boss Rush! (This was a bitch to make...)",
                                      True,
                                      (100, 255, 100))
-        ps = stats_font.render(f"I ' M  I N  Y O U R  W A L L S, - Revel",
+        ps = textCache.render(stats_font, f"I ' M  I N  Y O U R  W A L L S, - Revel",
                                True,
                                (136, 8, 8))
         self.screen.blit(congrats, (650 - congrats.get_width() // 2, 250))
         self.screen.blit(ps, (950 - congrats.get_width() // 2, 200))
 
-        souls_text = stats_font.render(f"Souls Earned: {self.total_souls_earned}", True, (255, 215, 0))
+        souls_text = textCache.render(stats_font, f"Souls Earned: {self.total_souls_earned}", True, (255, 215, 0))
         self.screen.blit(souls_text, (650 - souls_text.get_width() // 2, 320))
 
-        self.screen.blit(self.tvOverlay, (0, 0))
+        renderQuality.drawOverlay(self.screen, self.tvOverlay)
         pygame.display.update()
 
         start_time = pygame.time.get_ticks()
@@ -756,18 +755,18 @@ class BossRushState(GameState):
 
             self.screen.fill((0, 0, 0), (0, 550, 1300, 200))
 
-            prompt_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 32)
+            prompt_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 32)
             blink_on = (current_time // 600) % 2 == 0
 
             if blink_on:
-                space_prompt = prompt_font.render("Press SPACE to return to Main Menu", True, (200, 200, 255))
+                space_prompt = textCache.render(prompt_font, "Press SPACE to return to Main Menu", True, (200, 200, 255))
                 self.screen.blit(space_prompt, (650 - space_prompt.get_width() // 2, 600))
 
             if show_L_prompt and blink_on:
-                L_prompt = prompt_font.render("Press L for ???", True, (255, 100, 100))
+                L_prompt = textCache.render(prompt_font, "Press L for ???", True, (255, 100, 100))
                 self.screen.blit(L_prompt, (650 - L_prompt.get_width() // 2, 650))
 
-            overlay_portion = pygame.Surface((1300, 200), pygame.SRCALPHA)
+            overlay_portion = surfacePool.get("winOverlayPortion", (1300, 200))
             overlay_portion.blit(self.tvOverlay, (0, 0), (0, 550, 1300, 200))
             self.screen.blit(overlay_portion, (0, 550))
 
@@ -841,9 +840,9 @@ class BossRushState(GameState):
     def show_video_fallback(self):
         self.screen.fill((0, 0, 0))
 
-        font = pygame.font.Font('Graphics/Text/m6x11.ttf', 40)
-        text1 = font.render("Kept you waiting huh...", True, (255, 215, 0))
-        text2 = font.render("(Video playback unavailable)", True, (200, 200, 200))
+        font = assetManager.getFont('Graphics/Text/m6x11.ttf', 40)
+        text1 = textCache.render(font, "Kept you waiting huh...", True, (255, 215, 0))
+        text2 = textCache.render(font, "(Video playback unavailable)", True, (200, 200, 200))
 
         self.screen.blit(text1, (650 - text1.get_width() // 2, 300))
         self.screen.blit(text2, (650 - text2.get_width() // 2, 360))
@@ -918,7 +917,7 @@ class BossRushState(GameState):
             self.screen.blit(fade, (0, 0))
 
             if hasattr(self, 'tvOverlay'):
-                self.screen.blit(self.tvOverlay, (0, 0))
+                renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
             pygame.display.update()
             pygame.time.wait(50)
@@ -992,7 +991,7 @@ class BossRushState(GameState):
             # Iterate in reverse to select the top-most card first
             for card in reversed(list(self.cards.keys())):
                 if self.cards[card].collidepoint(mousePos):
-                    if not card.isSelected:
+                    if card not in self.cardsSelectedList:
                         if len(self.cardsSelectedList) >= 5:
                             # Normal limit: Cannot select more than 5 cards
                             return
@@ -1001,61 +1000,33 @@ class BossRushState(GameState):
                         if self.current_boss_ability == "honorable_duel" and len(self.cardsSelectedList) >= 4:
                             return
 
-                        card.isSelected = True
-                        self.cards[card].y -= 50
-                        self.cardsSelectedList.append(card)
+                        self.setCardSelected(card, True)
                         self.select_sfx.play()
                     else:
-                        card.isSelected = False
-                        self.cards[card].y += 50
-                        self.cardsSelectedList.remove(card)
+                        self.setCardSelected(card, False)
                         self.deselect_sfx.play()
                     return  # Stop after interacting with one card
 
     def show_double_target_effect(self):
         """Show visual effect when target is doubled"""
-        # Flash red warning
-        for _ in range(3):
-            flash = pygame.Surface((1300, 750), pygame.SRCALPHA)
-            flash.fill((255, 50, 50, 100))
-            self.screen.blit(flash, (0, 0))
-            pygame.display.update()
-            pygame.time.wait(100)
+        warning_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 40)
+        warning_text = textCache.render(warning_font, "TARGET DOUBLED!", True, (255, 50, 50))
 
-            self.draw()
-            pygame.display.update()
-            pygame.time.wait(100)
-
-        # Show warning text
-        warning_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 40)
-        warning_text = warning_font.render("TARGET DOUBLED!", True, (255, 50, 50))
-        text_rect = warning_text.get_rect(center=(650, 200))
-
-        # Draw with background
-        bg_rect = text_rect.inflate(20, 10)
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(bg_surface, (0, 0, 0, 200), bg_surface.get_rect(), border_radius=8)
-
-        self.screen.blit(bg_surface, bg_rect)
-        self.screen.blit(warning_text, text_rect)
-        pygame.display.update()
-        pygame.time.wait(1500)
+        # Flash red warning three times, then show the warning text
+        effect = Timeline("targetDoubled")
+        for _ in range(3):
+            effect.call(lambda: self.setFlash((255, 50, 50), 100)).wait(0.1)
+            effect.call(self.clearEffects).wait(0.1)
+        effect.call(lambda: self.showBanner(warning_text, (650, 200))).wait(1.5).call(self.clearEffects)
+        self.animator.play(effect)
 
     def disable_random_joker(self):
         """Disable a random joker - used by Artorias and Soul of Cinder Phase 2"""
         try:
             # Check if player has jokers in GameState
             if hasattr(self, 'playerJokers') and self.playerJokers:
-                # Since playerJokers stores names, we need to find the actual joker objects
-                available_jokers = []
-
-                # First, find all joker objects that match the player's joker names
-                for joker_name in self.playerJokers:
-                    # Find the joker object in jokerDeck
-                    for joker_obj in self.jokerDeck:
-                        if joker_obj.name == joker_name:
-                            available_jokers.append(joker_obj)
-                            break
+                # playerJokers stores entity IDs, this state's joker deck hands back the joker objects
+                available_jokers = self.ownedJokers()
 
                 if available_jokers:
                     # Choose a random joker to disable
@@ -1107,53 +1078,22 @@ class BossRushState(GameState):
             color = (255, 150, 50)  # Orange for Soul of Cinder
             boss_title = "SOUL OF CINDER"
 
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((1300, 750), pygame.SRCALPHA)
-        overlay.fill((*color, 50))  # Semi-transparent color
-
-        # Show the overlay for a brief moment
-        self.screen.blit(overlay, (0, 0))
-        pygame.display.update()
-        pygame.time.wait(100)
-
-        # Clear the overlay
-        self.draw()  # Redraw the normal game screen
-        pygame.display.update()
-        pygame.time.wait(100)
-
-        # Show again for another flash
-        self.screen.blit(overlay, (0, 0))
-        pygame.display.update()
-        pygame.time.wait(100)
-
-        # Create the notification message
-        notification_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 36)
+        notification_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 36)
         message = f"{boss_title}: DISABLED {joker_name.upper()}"
-        notification_text = notification_font.render(message, True, color)
-
-        # Position the notification at the top center
-        text_rect = notification_text.get_rect(center=(650, 50))
-
-        # Create a background for the text
-        bg_rect = text_rect.inflate(20, 10)
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(bg_surface, (0, 0, 0, 200), bg_surface.get_rect(), border_radius=8)
-
-        # Draw everything
-        self.screen.blit(bg_surface, bg_rect)
-        self.screen.blit(notification_text, text_rect)
-
-        pygame.display.update()
-
-        # Show the notification for 2 seconds
-        pygame.time.wait(2000)
-
-        # Redraw the normal screen
-        self.draw()
-        pygame.display.update()
-
+        notification_text = textCache.render(notification_font, message, True, color)
+
+        # Two quick flashes, then the notification at the top center stays for 2 seconds (over the flash)
+        self.animator.play(Timeline("jokerDisabled")
+                           .call(lambda: self.setFlash(color, 50)).wait(0.1)
+                           .call(self.clearEffects).wait(0.1)
+                           .call(lambda: self.setFlash(color, 50)).wait(0.1)
+                           .call(lambda: self.showBanner(notification_text, (650, 50))).wait(2.0)
+                           .call(self.clearEffects)
+                           .call(self.play_joker_disabled_sound))
+
+    def play_joker_disabled_sound(self):
         try:
-            disable_sound = pygame.mixer.Sound('Graphics/Sounds/thunder.wav')
+            disable_sound = assetManager.getSound('Graphics/Sounds/thunder.wav')
             disable_sound.play()
         except:
             pass
@@ -1173,13 +1113,17 @@ class BossRushState(GameState):
     def discardCards(self, removeFromHand: bool):
         """Override to check for empty deck before trying to draw"""
         # Check if we need to draw cards but deck is empty
-        if len(self.hand) < 8 and len(self.deck) == 0:
+        if len(self.hand) < HAND_SIZE and len(self.deck) == 0:
             self.trigger_card_depletion_game_over()
             return
 
         # Call parent implementation
         super().discardCards(removeFromHand)
 
+        # Same check once the discards and draws are done: the deck ran out before the hand was full again
+        if len(self.hand) < HAND_SIZE and len(self.deck) == 0:
+            self.trigger_card_depletion_game_over()
+
     def save_boss_rush_progress(self):
         # Added this for better saving
         if not self.playerInfo:
@@ -1202,14 +1146,14 @@ class BossRushState(GameState):
 
         self.playerInfo.saved_boss_rush_state = {
             'hand': self.hand.copy() if hasattr(self, 'hand') else [],
-            'deck': self.deck.copy() if hasattr(self, 'deck') else [],
+            'deck': self.deck.copy() if hasattr(self, 'deck') else Deck(),
             'used': self.used.copy() if hasattr(self, 'used') else [],
             'cardsSelectedList': self.cardsSelectedList.copy() if hasattr(self, 'cardsSelectedList') else [],
             'playerJokers': self.playerJokers.copy() if hasattr(self, 'playerJokers') else [],
             'playerConsumables': self.playerConsumables.copy() if hasattr(self, 'playerConsumables') else [],
             'hands_played_this_boss': self.hands_played_this_boss if hasattr(self, 'hands_played_this_boss') else 0,
             'boss_phase': self.boss_phase if hasattr(self, 'boss_phase') else 1,
-            'last_hand_time': self.last_hand_time if hasattr(self, 'last_hand_time') else pygame.time.get_ticks(),
+            'last_hand_time': self.last_hand_time if hasattr(self, 'last_hand_time') else frameClock.ticks(),
             'disabled_jokers': self.disabled_jokers.copy() if hasattr(self, 'disabled_jokers') else [],
             'roundScore': self.playerInfo.roundScore,
             'playerChips': self.playerInfo.playerChips,
@@ -1,7 +1,41 @@
 import pygame
 from States.Core.StateClass import State
 from Levels.LevelManager import LevelManager
-
+from Assets.AssetManager import assetManager
+from Assets.SpriteFrameCache import spriteFrames
+from Assets.TextCache import textCache
+from Engine.DirtyRects import dirtyRects
+
+
+
+# Blind section colors (header, background) for each boss
+BOSS_COLORS = {
+    "The Mark": ((120, 40, 160), (60, 30, 80)),        # purple
+    "The Needle": ((180, 20, 20), (80, 20, 20)),       # crimson
+    "The House": ((200, 160, 20), (100, 80, 10)),      # gold/bronze
+    "The Hook": ((20, 150, 140), (10, 70, 80)),        # teal
+    "The Water": ((30, 120, 200), (10, 50, 90)),       # blue
+    "The Manacle": ((90, 90, 90), (40, 40, 40)),       # steel/gray
+    "The Club": ((20, 120, 40), (10, 60, 30)),         # green
+    "The Goad": ((70, 40, 140), (30, 20, 70)),         # indigo
+}
+
+
+class PanelValue:
+    """One number on the left panel, only re-rendered when its value changes."""
+    def __init__(self, font: pygame.font.Font, color, antialias: bool = False, fmt: str = "{}"):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.fmt = fmt
+        self.value = None
+        self.text = None
+
+    def surface(self, value) -> pygame.Surface:
+        if self.text is None or value != self.value:
+            self.value = value
+            self.text = textCache.render(self.font, self.fmt.format(value), self.antialias, self.color)
+        return self.text
 
 
 class PlayerInfo(State):
@@ -37,32 +71,31 @@ class PlayerInfo(State):
         self.levelFinished = False  # Flag to trigger level selection screen
 
         # --------------------------------Images----------------------------------------------
-        self.backgroundImage = pygame.image.load('Graphics/Backgrounds/gameplayBG.jpg')
-        self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
+        self.background = assetManager.getScaledImage('Graphics/Backgrounds/gameplayBG.jpg', (1300, 750), alpha=False)
         self.blindImage = self.levelManager.curSubLevel.image  # Get image from current level
 
         # -------------------------------Text Fonts-------------------------------------------
-        self.textFont1 = pygame.font.Font('Graphics/Text/m6x11.ttf', 30)
-        self.textFont2 = pygame.font.Font('Graphics/Text/m6x11.ttf', 22)
-        self.textFont3 = pygame.font.Font('Graphics/Text/m6x11.ttf', 60)
-        self.textFont4 = pygame.font.Font('Graphics/Text/m6x11.ttf', 25)
+        self.textFont1 = assetManager.getFont('Graphics/Text/m6x11.ttf', 30)
+        self.textFont2 = assetManager.getFont('Graphics/Text/m6x11.ttf', 22)
+        self.textFont3 = assetManager.getFont('Graphics/Text/m6x11.ttf', 60)
+        self.textFont4 = assetManager.getFont('Graphics/Text/m6x11.ttf', 25)
 
         # -------------------------------Text Renders-----------------------------------------
-        self.scoreAtLeastText = self.textFont1.render("Score at least", False, 'white')
-        self.scoreAtLeastTextNum = self.textFont3.render(str(self.score), False, 'red')
-        self.playerScoreText = self.textFont3.render(str(self.roundScore), False, 'white')
-        self.roundText = self.textFont2.render("Round", False, 'white')
-        self.round2Text = self.textFont1.render("Round", False, 'white')
-        self.scoreText = self.textFont2.render("Score", False, 'white')
-        self.curHandText = self.textFont1.render(self.curHandOfPlayer, False, 'white')
-        self.xText = self.textFont3.render('X', False, (180, 30, 30))
-        self.runText = self.textFont1.render('Run', False, 'white')
-        self.infoText = self.textFont1.render('Info', False, 'white')
-        self.instrText = self.textFont1.render('Help', False, 'white')
-        self.handText = self.textFont1.render('Hands', False, 'white')
-        self.discardText = self.textFont4.render('Discards', False, 'white')
-        self.anteText = self.textFont1.render("Ante", False, "white")
-        self.anteLimitText = self.textFont1.render("/ 6", False, "white")
+        self.scoreAtLeastText = textCache.render(self.textFont1, "Score at least", False, 'white')
+        self.scoreAtLeastTextNum = textCache.render(self.textFont3, str(self.score), False, 'red')
+        self.playerScoreText = textCache.render(self.textFont3, str(self.roundScore), False, 'white')
+        self.roundText = textCache.render(self.textFont2, "Round", False, 'white')
+        self.round2Text = textCache.render(self.textFont1, "Round", False, 'white')
+        self.scoreText = textCache.render(self.textFont2, "Score", False, 'white')
+        self.curHandText = textCache.render(self.textFont1, self.curHandOfPlayer, False, 'white')
+        self.xText = textCache.render(self.textFont3, 'X', False, (180, 30, 30))
+        self.runText = textCache.render(self.textFont1, 'Run', False, 'white')
+        self.infoText = textCache.render(self.textFont1, 'Info', False, 'white')
+        self.instrText = textCache.render(self.textFont1, 'Help', False, 'white')
+        self.handText = textCache.render(self.textFont1, 'Hands', False, 'white')
+        self.discardText = textCache.render(self.textFont4, 'Discards', False, 'white')
+        self.anteText = textCache.render(self.textFont1, "Ante", False, "white")
+        self.anteLimitText = textCache.render(self.textFont1, "/ 6", False, "white")
 
         # --------------------------------Rects-----------------------------------------------
         self.leftRect = pygame.Rect(0, 0, 300, 750)
@@ -97,6 +130,19 @@ class PlayerInfo(State):
         self.playerInfoSurface = pygame.Surface((270, 140), pygame.SRCALPHA)
         self.playerInfo2Surface = pygame.Surface((290, 300), pygame.SRCALPHA)
 
+        # --------------------Cached panel layers and value widgets----------------------
+        self.roundScoreValue = PanelValue(self.textFont3, 'white')
+        self.chipsValue = PanelValue(self.textFont3, 'white', antialias=True)
+        self.multValue = PanelValue(self.textFont3, 'white', antialias=True)
+        self.handsValue = PanelValue(self.textFont3, 'blue')
+        self.discardsValue = PanelValue(self.textFont3, 'red')
+        self.moneyValue = PanelValue(self.textFont3, (255, 215, 0), fmt="$ {}")
+        self.anteValue = PanelValue(self.textFont3, 'orange')
+        self.roundValue = PanelValue(self.textFont3, 'orange')
+        self.blindLayer = None
+        self.blindLayerKey = None
+        self.buildPanelLayer()
+
         # --------------------Animation Variables for smallBlind-------------------------
         self.smallBlindAngle = 0  # Current angle of rotation
         self.smallBlindDirection = 1  # 1 = rotate right, -1 = rotate left
@@ -109,14 +155,12 @@ class PlayerInfo(State):
         if abs(self.smallBlindAngle) >= self.smallBlindMaxAngle:
             self.smallBlindDirection *= -1  # Reverse direction when max angle reached
 
-        # Update background based on whether current level is a boss level
+        # Update background based on whether current level is a boss level (cached, no disk access per frame)
         if not hasattr(self, 'is_boss_rush') or not self.is_boss_rush:
             if self.levelManager.curSubLevel.bossLevel == "":
-                self.backgroundImage = pygame.image.load('Graphics/Backgrounds/gameplayBG.jpg')
-                self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
+                self.background = assetManager.getScaledImage('Graphics/Backgrounds/gameplayBG.jpg', (1300, 750), alpha=False)
             else:
-                self.backgroundImage = pygame.image.load('Graphics/Backgrounds/bossBG.png')
-                self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
+                self.background = assetManager.getScaledImage('Graphics/Backgrounds/bossBG.png', (1300, 750), alpha=False)
         self.draw() # draw the updated player info panel
 
     def draw(self):
@@ -124,182 +168,188 @@ class PlayerInfo(State):
         if not hasattr(self, 'is_boss_rush') or not self.is_boss_rush:
             self.screen.blit(self.background, (0, 0))
 
-        pygame.draw.rect(State.screen, (50, 50, 50), self.leftRect)
-        pygame.draw.rect(State.screen, 'blue', self.leftRect, 1)
+        # Gray backdrop, border and every static box/label in one blit, then only the parts that change
+        self.screen.blit(self.panelBackdrop, self.leftRect)
+        self.drawPanel(self.screen, self.leftRect.topleft)
+
+    def drawbuttons(self):
+        # Panel without the gray backdrop, composed on leftRectSurface (the shop blits it on its own background)
         self.leftRectSurface.fill((0, 0, 0, 0))
-        self.drawbuttons()
-        self.screen.blit(self.leftRectSurface, self.leftRect)
-        mousePosPlayerInfo2 = (
-        pygame.mouse.get_pos()[0] - self.playerInfo2.x, pygame.mouse.get_pos()[1] - self.playerInfo2.y)
+        self.leftRectSurface.blit(self.panelLayer, (0, 0))
+        self.drawPanel(self.leftRectSurface, (0, 0))
 
-        if self.runInfoRect.collidepoint(mousePosPlayerInfo2):
-            pygame.draw.rect(self.playerInfo2Surface, (139, 0, 0), self.runInfoRect)
-        else:
-            pygame.draw.rect(self.playerInfo2Surface, 'red', self.runInfoRect)
-        if self.instrRect.collidepoint(mousePosPlayerInfo2):
-            pygame.draw.rect(self.playerInfo2Surface, 'darkorange', self.instrRect)
-        else:
-            pygame.draw.rect(self.playerInfo2Surface, 'orange', self.instrRect)
+    # ---------- Left panel layers ----------
+    def buildPanelLayer(self):
+        """
+        Everything on the left panel that never changes: section boxes, borders and labels.
+        Drawn once; draw() blits it and then only the blind section, the buttons and the numbers.
+        """
+        layer = pygame.Surface(self.leftRect.size, pygame.SRCALPHA)
 
-    def drawbuttons(self):
-        # ------------------------Blind Section-------------------------------------------
+        # ------------------------Score Section-------------------------------------------
+        pygame.draw.rect(layer, (30, 30, 30), pygame.Rect(15, 220, 270, 70))
+        pygame.draw.rect(layer, (0, 0, 0), pygame.Rect(110, 225, 160, 60))
+        layer.blit(self.roundText, pygame.Rect(30, 230, 20, 20))
+        layer.blit(self.scoreText, pygame.Rect(30, 250, 20, 20))
+
+        # --------------------Player Info Section-----------------------------------------
+        pygame.draw.rect(layer, (30, 30, 30), self.playerInfo)
+        info = pygame.Surface(self.playerInfo.size, pygame.SRCALPHA)
+        pygame.draw.rect(info, 'blue', self.chipsRect)
+        pygame.draw.rect(info, 'red', self.multiplierRect)
+        info.blit(self.xText, self.xTextRect)
+        layer.blit(info, self.playerInfo)
+
+        # ---------------------Player Info 2 Section--------------------------------------
+        info2 = pygame.Surface(self.playerInfo2Surface.get_size(), pygame.SRCALPHA)
+        pygame.draw.rect(info2, (20, 20, 20), self.handRect)
+        pygame.draw.rect(info2, (20, 20, 20), self.discardRect)
+
+        # ---------------------Hands------------------------------------------------------
+        info2.blit(self.handText, pygame.Rect(120, 18, 0, 0))
+        pygame.draw.rect(info2, (30, 30, 30), pygame.Rect(110, 45, 80, 50))
+
+        # ---------------------Discards---------------------------------------------------
+        info2.blit(self.discardText, pygame.Rect(208, 18, 0, 0))
+        pygame.draw.rect(info2, (30, 30, 30), pygame.Rect(207, 45, 80, 50))
+
+        # ---------------------Player Money-----------------------------------------------
+        pygame.draw.rect(info2, (20, 20, 20), pygame.Rect(105, 110, 185, 70))
+        pygame.draw.rect(info2, (30, 30, 30), pygame.Rect(112, 118, 170, 55))
+
+        # -----------------------Ante-----------------------------------------------------
+        pygame.draw.rect(info2, (20, 20, 20), pygame.Rect(105, 190, 90, 100))
+        pygame.draw.rect(info2, (30, 30, 30), pygame.Rect(110, 220, 80, 65))
+        info2.blit(self.anteText, pygame.Rect(122, 195, 0, 0))
+        info2.blit(self.anteLimitText, pygame.Rect(155, 245, 0, 0))
+
+        # -----------------------Round----------------------------------------------------
+        pygame.draw.rect(info2, (20, 20, 20), pygame.Rect(200, 190, 90, 100))
+        pygame.draw.rect(info2, (30, 30, 30), pygame.Rect(205, 220, 80, 65))
+        info2.blit(self.round2Text, pygame.Rect(215, 195, 0, 0))
+        layer.blit(info2, self.playerInfo2)
+
+        self.panelLayer = layer
+
+        # Same layer over the gray panel background, for the in-game draw
+        backdrop = pygame.Surface(self.leftRect.size)
+        backdrop.fill((50, 50, 50))
+        pygame.draw.rect(backdrop, 'blue', backdrop.get_rect(), 1)
+        backdrop.blit(layer, (0, 0))
+        self.panelBackdrop = backdrop.convert() if pygame.display.get_surface() else backdrop
+
+        # Run Info / Help buttons, normal and hovered
+        self.runInfoButton = {}
+        self.instrButton = {}
+        for hovered in (False, True):
+            run = pygame.Surface(self.runInfoRect.size)
+            run.fill((139, 0, 0) if hovered else 'red')
+            run.blit(self.runText, self.runTextRect.move(-self.runInfoRect.x, -self.runInfoRect.y))
+            run.blit(self.infoText, self.infoTextRect.move(-self.runInfoRect.x, -self.runInfoRect.y))
+            self.runInfoButton[hovered] = run
+            instr = pygame.Surface(self.instrRect.size)
+            instr.fill('darkorange' if hovered else 'orange')
+            instr.blit(self.instrText, self.instrTextRect.move(-self.instrRect.x, -self.instrRect.y))
+            self.instrButton[hovered] = instr
+
+    def buildBlindLayer(self, cur):
+        # Blind header, colors and target score, rebuilt only when the blind changes
         # Choose colors based on blind type, but override with boss-specific colors
-        boss_colors = {
-            "The Mark": ((120, 40, 160), (60, 30, 80)),        # purple
-            "The Needle": ((180, 20, 20), (80, 20, 20)),       # crimson
-            "The House": ((200, 160, 20), (100, 80, 10)),      # gold/bronze
-            "The Hook": ((20, 150, 140), (10, 70, 80)),        # teal
-            "The Water": ((30, 120, 200), (10, 50, 90)),       # blue
-            "The Manacle": ((90, 90, 90), (40, 40, 40)),       # steel/gray
-            "The Club": ((20, 120, 40), (10, 60, 30)),         # green
-            "The Goad": ((70, 40, 140), (30, 20, 70)),         # indigo
-        }
-
-        # determine current sublevel and choose colors
-        curSubLevel = self.levelManager.curSubLevel
-        boss_name = self.levelManager.curSubLevel.bossLevel
+        boss_name = cur.bossLevel
 
         # check if boss level to set colors
-        if boss_name and boss_name in boss_colors:
-            header_color, bg_color = boss_colors[boss_name]
+        if boss_name and boss_name in BOSS_COLORS:
+            header_color, bg_color = BOSS_COLORS[boss_name]
         else:
             # otherwise set based on blind type
-            if curSubLevel.blind.name == "SMALL":
+            if cur.blind.name == "SMALL":
                 header_color = (70, 130, 180)
                 bg_color = (40, 65, 90)
-            elif curSubLevel.blind.name == "BIG":
+            elif cur.blind.name == "BIG":
                 header_color = (255, 140, 0)
                 bg_color = (127, 70, 0)
             else:
                 header_color = (128, 128, 128)
                 bg_color = (64, 64, 64)
 
-        # draw background rect for the blind area on the left panel
-        pygame.draw.rect(self.leftRectSurface, bg_color, self.blindRect)
-        # Clear the blind surface each frame to avoid leftover pixels/colors from previous frames
-        self.blindRectSurface.fill((0, 0, 0, 0))
-        self.blindTextSurface.fill((0, 0, 0, 0))  # Clear before redrawing
+        blindLayer = pygame.Surface(self.blindRect.size)
+        blindLayer.fill(bg_color)
 
         # Header rectangle uses header_color
-        pygame.draw.rect(self.blindRectSurface, header_color, pygame.Rect(0, 0, 270, 45))
+        pygame.draw.rect(blindLayer, header_color, pygame.Rect(0, 0, 270, 45))
 
         # Dynamic blind name Text (centered in the header area)
-        cur = self.levelManager.curSubLevel
-        if cur.bossLevel:
-            label = cur.bossLevel
-        else:
-            label = cur.blind.name
-
-        textBlindDynamic = self.textFont1.render(label, True, 'white')
-
+        label = cur.bossLevel if cur.bossLevel else cur.blind.name
+        textBlindDynamic = textCache.render(self.textFont1, label, True, 'white')
         header_height = 45
-        header_center = (self.blindRectSurface.get_width() // 2, header_height // 2)
-        text_rect = textBlindDynamic.get_rect(center=header_center)
-        # draw directly on the blindRectSurface so it is centered in the header
-        self.blindRectSurface.blit(textBlindDynamic, text_rect)
+        header_center = (blindLayer.get_width() // 2, header_height // 2)
+        blindLayer.blit(textBlindDynamic, textBlindDynamic.get_rect(center=header_center))
         # optional small dark bar below header for contrast
-        pygame.draw.rect(self.blindRectSurface, (30, 30, 30), self.blindTextRect)
-
-        # ------------------------Score Section-------------------------------------------
-        pygame.draw.rect(self.leftRectSurface, (30, 30, 30), pygame.Rect(15, 220, 270, 70))
-        pygame.draw.rect(self.leftRectSurface, (0, 0, 0), pygame.Rect(110, 225, 160, 60))
-        # display roundScore here (updated by GameState.playHand)
-        playerScoreStr = self.textFont3.render(str(self.roundScore), False, 'white')
-
-        playerScoreStrRect = playerScoreStr.get_rect()
-        playerScoreStrRect.right = 265
-        playerScoreStrRect.top = 230
+        pygame.draw.rect(blindLayer, (30, 30, 30), self.blindTextRect)
 
         # Dynamic score target from current level
-        scoreAtLeastTextNum = self.textFont3.render(str(self.levelManager.curSubLevel.score), False, 'red')
+        scoreAtLeastTextNum = textCache.render(self.textFont3, str(cur.score), False, 'red')
         scoreAtLeatTextNumRect = scoreAtLeastTextNum.get_rect()
         scoreAtLeatTextNumRect.center = (100, 70)
-
-        # --------------------Player Info Section-----------------------------------------
-        pygame.draw.rect(self.leftRectSurface, (30, 30, 30), self.playerInfo)
-        pygame.draw.rect(self.playerInfoSurface, 'blue', self.chipsRect)
-        pygame.draw.rect(self.playerInfoSurface, 'red', self.multiplierRect)
-
-        playerChipsText = self.textFont3.render(str(self.playerChips), True, 'white')
-        playerMultiplierText = self.textFont3.render(str(self.playerMultiplier), True, 'white')
-
-        playerChipsTextRect = playerChipsText.get_rect()
-        playerMultiplierTextRect = playerMultiplierText.get_rect()
-        playerChipsTextRect.right = 100
-        playerMultiplierTextRect.left = 180
-        playerChipsTextRect.y = 70
-        playerMultiplierTextRect.y = 70
-
-        self.playerInfoSurface.blit(playerChipsText, playerChipsTextRect)
-        self.playerInfoSurface.blit(playerMultiplierText, playerMultiplierTextRect)
-        self.playerInfoSurface.blit(self.xText, self.xTextRect)
-
-        # ---------------------Player Info 2 Section--------------------------------------
-        pygame.draw.rect(self.playerInfo2Surface, (20, 20, 20), self.handRect)
-        pygame.draw.rect(self.playerInfo2Surface, (20, 20, 20), self.discardRect)
-
-        # ---------------------Hands------------------------------------------------------
-        self.playerInfo2Surface.blit(self.handText, pygame.Rect(120, 18, 0, 0))
-        pygame.draw.rect(self.playerInfo2Surface, (30, 30, 30), pygame.Rect(110, 45, 80, 50))
-        amountsOfHandsText = self.textFont3.render(str(self.amountOfHands), False, 'blue')
-        self.playerInfo2Surface.blit(amountsOfHandsText, pygame.Rect(140, 50, 0, 0))
-
-        # ---------------------Discards---------------------------------------------------
-        self.playerInfo2Surface.blit(self.discardText, pygame.Rect(208, 18, 0, 0))
-        pygame.draw.rect(self.playerInfo2Surface, (30, 30, 30), pygame.Rect(207, 45, 80, 50))
-        amountOfDiscardsText = self.textFont3.render(str(self.amountOfDiscards), False, 'red')
-        self.playerInfo2Surface.blit(amountOfDiscardsText, pygame.Rect(235, 50, 0, 0))
-
-        # ---------------------Player Money-----------------------------------------------
-        pygame.draw.rect(self.playerInfo2Surface, (20, 20, 20), pygame.Rect(105, 110, 185, 70))
-        pygame.draw.rect(self.playerInfo2Surface, (30, 30, 30), pygame.Rect(112, 118, 170, 55))
-        playerMoneyText = self.textFont3.render("$ " + str(self.playerMoney), False, (255, 215, 0))
-        playerMoneyTextRect = playerMoneyText.get_rect()
-        playerMoneyTextRect.center = (200, 150)
-        self.playerInfo2Surface.blit(playerMoneyText, playerMoneyTextRect)
-
-        # -----------------------Ante-----------------------------------------------------
-        pygame.draw.rect(self.playerInfo2Surface, (20, 20, 20), pygame.Rect(105, 190, 90, 100))
-        pygame.draw.rect(self.playerInfo2Surface, (30, 30, 30), pygame.Rect(110, 220, 80, 65))
-        self.playerInfo2Surface.blit(self.anteText, pygame.Rect(122, 195, 0, 0))
-        self.playerInfo2Surface.blit(self.anteLimitText, pygame.Rect(155, 245, 0, 0))
-        playerAnteText = self.textFont3.render(str(self.playerAnte), False, 'orange')
-        self.playerInfo2Surface.blit(playerAnteText, pygame.Rect(125, 230, 0, 0))
-
-        # -----------------------Round----------------------------------------------------
-        pygame.draw.rect(self.playerInfo2Surface, (20, 20, 20), pygame.Rect(200, 190, 90, 100))
-        pygame.draw.rect(self.playerInfo2Surface, (30, 30, 30), pygame.Rect(205, 220, 80, 65))
-        self.playerInfo2Surface.blit(self.round2Text, pygame.Rect(215, 195, 0, 0))
-        playerRoundText = self.textFont3.render(str(self.round), False, 'orange')
-        self.playerInfo2Surface.blit(playerRoundText, pygame.Rect(235, 230, 0, 0))
-
-        # ------------------Join all surfaces---------------------------------------------
-        self.scoreAtLeastTextSurf.fill((0, 0, 0, 0))  # Clear before redrawing
+        self.scoreAtLeastTextSurf.fill((0, 0, 0, 0))
         self.scoreAtLeastTextSurf.blit(self.scoreAtLeastText, pygame.Rect(15, 0, 10, 10))
         self.scoreAtLeastTextSurf.blit(scoreAtLeastTextNum, scoreAtLeatTextNumRect)
+        blindLayer.blit(self.scoreAtLeastTextSurf, self.blindTextRect)
+
+        self.blindLayer = blindLayer
+        self.blindLayerKey = (id(cur), cur.bossLevel, cur.blind, cur.score)
+
+    def drawPanel(self, target: pygame.Surface, origin: tuple[int, int]):
+        ox, oy = origin
+        cur = self.levelManager.curSubLevel
+        # Only the parts that can change are reported for dirty-rect updates
+        dirty = dirtyRects.add if target is State.screen else (lambda rect: None)
 
-        self.blindRectSurface.blit(self.scoreAtLeastTextSurf, self.blindTextRect)
-        self.blindRectSurface.blit(self.blindTextSurface, self.blindRect)
+        # ------------------------Blind Section-------------------------------------------
+        if self.blindLayerKey != (id(cur), cur.bossLevel, cur.blind, cur.score):
+            self.buildBlindLayer(cur)
+            dirty(pygame.Rect((ox + self.blindRect.x, oy + self.blindRect.y), self.blindRect.size))
+        blindPos = (ox + self.blindRect.x, oy + self.blindRect.y)
+        target.blit(self.blindLayer, blindPos)
 
         # --------------------Blind Image Rotation Animation (Dynamic)-------------------------------
-        self.blindImage = self.levelManager.curSubLevel.image  # Update image each frame
-        rotatedBlindImage = pygame.transform.rotate(self.blindImage, self.smallBlindAngle)
+        self.blindImage = cur.image  # Update image each frame
+        rotatedBlindImage = spriteFrames.rotated(self.blindImage, self.smallBlindAngle)
         rotatedRect = rotatedBlindImage.get_rect(center=self.blindRectImage.center)
-        self.blindRectSurface.blit(rotatedBlindImage, rotatedRect.topleft)
+        clip = target.get_clip()
+        target.set_clip(pygame.Rect(blindPos, self.blindRect.size).clip(clip))
+        dirty(target.blit(rotatedBlindImage, (blindPos[0] + rotatedRect.x, blindPos[1] + rotatedRect.y)))
 
-        # Now that blindRectSurface is fully drawn for this frame, blit it to the left panel
-        self.leftRectSurface.blit(self.blindRectSurface, self.blindRect)
-
-        self.playerInfo2Surface.blit(self.runText, self.runTextRect)
-        self.playerInfo2Surface.blit(self.infoText, self.infoTextRect)
-        self.playerInfo2Surface.blit(self.instrText, self.instrTextRect)
-        self.playerInfo2Surface.blit(self.playerInfo2Surface, self.playerInfo2)
+        # ---------------------Run Info / Help buttons-----------------------------------
+        info2X, info2Y = ox + self.playerInfo2.x, oy + self.playerInfo2.y
+        target.set_clip(pygame.Rect(info2X, info2Y, *self.playerInfo2Surface.get_size()).clip(clip))
+        mousePos = pygame.mouse.get_pos()
+        mousePosPlayerInfo2 = (mousePos[0] - self.playerInfo2.x, mousePos[1] - self.playerInfo2.y)
+        dirty(target.blit(self.runInfoButton[self.runInfoRect.collidepoint(mousePosPlayerInfo2)],
+                          (info2X + self.runInfoRect.x, info2Y + self.runInfoRect.y)))
+        dirty(target.blit(self.instrButton[self.instrRect.collidepoint(mousePosPlayerInfo2)],
+                          (info2X + self.instrRect.x, info2Y + self.instrRect.y)))
+
+        # ---------------------Hands / Discards / Money / Ante / Round--------------------
+        dirty(target.blit(self.handsValue.surface(self.amountOfHands), (info2X + 140, info2Y + 50)))
+        dirty(target.blit(self.discardsValue.surface(self.amountOfDiscards), (info2X + 235, info2Y + 50)))
+        playerMoneyText = self.moneyValue.surface(self.playerMoney)
+        dirty(target.blit(playerMoneyText, playerMoneyText.get_rect(center=(info2X + 200, info2Y + 150))))
+        dirty(target.blit(self.anteValue.surface(self.playerAnte), (info2X + 125, info2Y + 230)))
+        dirty(target.blit(self.roundValue.surface(self.round), (info2X + 235, info2Y + 230)))
+
+        # --------------------Chips x Mult------------------------------------------------
+        infoX, infoY = ox + self.playerInfo.x, oy + self.playerInfo.y
+        target.set_clip(pygame.Rect(infoX, infoY, *self.playerInfo.size).clip(clip))
+        playerChipsText = self.chipsValue.surface(self.playerChips)
+        dirty(target.blit(playerChipsText, playerChipsText.get_rect(right=infoX + 100, y=infoY + 70)))
+        dirty(target.blit(self.multValue.surface(self.playerMultiplier), (infoX + 180, infoY + 70)))
+        target.set_clip(clip)
 
-        self.leftRectSurface.blit(self.roundText, pygame.Rect(30, 230, 20, 20))
-        self.leftRectSurface.blit(self.scoreText, pygame.Rect(30, 250, 20, 20))
-        self.leftRectSurface.blit(playerScoreStr, playerScoreStrRect)
-        self.leftRectSurface.blit(self.playerInfoSurface, self.playerInfo)
-        self.leftRectSurface.blit(self.playerInfo2Surface, self.playerInfo2)
+        # ------------------------Score Section-------------------------------------------
+        # display roundScore here (updated by GameState.playHand)
+        playerScoreStr = self.roundScoreValue.surface(self.roundScore)
+        dirty(target.blit(playerScoreStr, playerScoreStr.get_rect(right=ox + 265, top=oy + 230)))
 
     def userInput(self, events): # Handle user input
         # Get mouse position relative to playerInfo2Surface
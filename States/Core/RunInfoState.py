@@ -2,14 +2,17 @@ import pygame
 from Cards.Card import Suit, Rank, Enhancement
 from States.Core.StateClass import State
 from States.GameState import HAND_SCORES
+from Assets.AssetManager import assetManager
+from Assets.TextCache import textCache
+from Engine.RenderQuality import renderQuality
+from Engine.SurfacePool import surfacePool
 
 class RunInfoState(State):
     def __init__(self, hand,nextState: str = ""):
         super().__init__(nextState)
 
         self.stackSurface = pygame.Surface((900, 600), pygame.SRCALPHA)
-        self.tvOverlay = pygame.image.load('Graphics/Backgrounds/CRT.png').convert_alpha()
-        self.tvOverlay = pygame.transform.scale(self.tvOverlay, (1300, 750))
+        self.tvOverlay = assetManager.getScaledImage('Graphics/Backgrounds/CRT.png', (1300, 750))
         self.desc = ''
         self.cards = []
         self.handNames = hand
@@ -20,7 +23,7 @@ class RunInfoState(State):
         self.x = 350
         self.yStart = 100
         self.gap = 10
-        self.font = pygame.font.Font("Graphics/Text/m6x11.ttf", 24)
+        self.font = assetManager.getFont("Graphics/Text/m6x11.ttf", 24)
         self.cardImages = State.deckManager.load_card_images()
 
         # labels dictionary (10)
@@ -117,13 +120,10 @@ class RunInfoState(State):
 
     def draw(self):
         self.screen.blit(State.screenshot, (0, 0))
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        renderQuality.drawTint(self.screen, (0, 0, 0), 150)
 
         self.stackSurface.fill((0, 0, 0, 0))
-        infoBox = pygame.Surface((400,250), pygame.SRCALPHA)
-        infoBox.fill((220, 220, 220, 255))
+        infoBox = surfacePool.get("runInfoBox", (400, 250), fill=(220, 220, 220, 255))
 
         # Fixed offsets for clean display
         offsetLvl = 10
@@ -152,7 +152,7 @@ class RunInfoState(State):
 
             # needed since back key value is empty
             if not value:
-                textSurface = self.font.render(key, True, (0, 0, 0))
+                textSurface = textCache.render(self.font, key, True, (0, 0, 0))
                 textCenter = textSurface.get_rect(center=rect.center)
                 self.stackSurface.blit(textSurface, textCenter)
                 continue
@@ -163,14 +163,14 @@ class RunInfoState(State):
             chipsMult = value[:2]
 
             # 1. Lvl
-            lvlDisp = self.font.render(f"Lvl {lvl}", True, (0, 0, 0))
+            lvlDisp = textCache.render(self.font, f"Lvl {lvl}", True, (0, 0, 0))
             lvlRect = lvlDisp.get_rect()
             lvlRect.centery = rect.centery
             lvlRect.left = rect.left + offsetLvl
             self.stackSurface.blit(lvlDisp, lvlRect)
 
             # 2. hand
-            textDisp = self.font.render(key, True, (0, 0, 0))
+            textDisp = textCache.render(self.font, key, True, (0, 0, 0))
             textRect = textDisp.get_rect()
             textRect.centery = rect.centery
             textRect.left = rect.left + offsetText
@@ -178,14 +178,14 @@ class RunInfoState(State):
 
             # 3. chips & multiplier
             chipsMultStr = " x ".join(str(v) for v in chipsMult)
-            chipsMultDisp = self.font.render(chipsMultStr, True, (0, 0, 0))
+            chipsMultDisp = textCache.render(self.font, chipsMultStr, True, (0, 0, 0))
             chipsMultRect = chipsMultDisp.get_rect()
             chipsMultRect.centery = rect.centery
             chipsMultRect.left = rect.left + offsetChipsMult
             self.stackSurface.blit(chipsMultDisp, chipsMultRect)
 
             # 4. times played counter
-            countDisp = self.font.render(f"#{count}", True, (0, 0, 0))
+            countDisp = textCache.render(self.font, f"#{count}", True, (0, 0, 0))
             countRect = countDisp.get_rect()
             countRect.centery = rect.centery
             countRect.left = rect.left + offsetCount
@@ -209,7 +209,7 @@ class RunInfoState(State):
                 strPosition = 5
                 for line in lines:
 
-                    descDisp = self.font.render(line, True, (0, 0, 0))
+                    descDisp = textCache.render(self.font, line, True, (0, 0, 0))
                     descRect = descDisp.get_rect()
                     descRect.left = 10
                     descRect.top = strPosition
@@ -231,7 +231,7 @@ class RunInfoState(State):
 
         self.screen.blit(self.stackSurface, (0, 0))
         self.screen.blit(infoBox, (850, 200))
-        self.screen.blit(self.tvOverlay,(0,0))
+        renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
     """ Handle user input """
     def userInput(self, events):
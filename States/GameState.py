@@ -1,3 +1,4 @@
+import bisect
 import pygame
 import random
 from States.Menus.DebugState import DebugState
@@ -7,8 +8,19 @@ from Cards.Jokers import Jokers
 from Cards.Planets import PLANETS, PlanetCard
 from Cards.Tarots import TAROTS, TarotCard
 from States.Core.PlayerInfo import PlayerInfo
-from Deck.HandEvaluator import evaluate_hand
+from Deck.HandScoring import score_hand
+from Deck.JokerEffects import compile_jokers
+from Deck.CardSelection import CardSelection
 from Levels.SubLevel import Blind
+from Engine.Timeline import Timeline, Animator, easeOut
+from Engine.SlotRow import SlotRow
+from Assets.AssetManager import assetManager
+from Assets.TextCache import textCache
+from Cards.EntityRegistry import entityRegistry
+from Engine.DirtyRects import dirtyRects
+from Engine.FrameClock import frameClock
+from Engine.RenderQuality import renderQuality
+from Engine.SurfacePool import surfacePool
 
 
 HAND_SCORES = {
@@ -26,11 +38,22 @@ HAND_SCORES = {
     "High Card": {"chips": 5, "multiplier": 1, "level": 1},
 }
 
+HAND_SIZE = 8  # Cards the hand is refilled to after a discard
+SELECTED_CARD_LIFT = 50  # Pixels a selected card sits above the rest of the hand
+
+# Hand sorting: 'sorting' mode -> key of a card, highest ranks first inside each group
+SUIT_ORDER = {Suit.HEARTS: 0, Suit.CLUBS: 1, Suit.DIAMONDS: 2, Suit.SPADES: 3}
+SORT_KEYS = {
+    "suit": lambda card: (SUIT_ORDER.get(card.suit, len(SUIT_ORDER)), -card.rank.value),
+    "rank": lambda card: (-card.rank.value, SUIT_ORDER.get(card.suit, len(SUIT_ORDER))),
+}
+
 
 
 
 
 class GameState(State):
+    usesDirtyRects = True
     def __init__(self, nextState: str = "", player: PlayerInfo = None):
         super().__init__(nextState)
         # ----------------------------Deck and Hand initialization----------------------------
@@ -40,12 +63,15 @@ class GameState(State):
         self.cards = {}
         
         self.jokerDeck = State.deckManager.createJokerDeck()
+        self.jokersById = {joker.id: joker for joker in self.jokerDeck}  # this state's own joker objects
         self.consumableDeck = State.deckManager.createConsumableDeck()
         State.deckManager.shuffleDeck(self.consumableDeck)
-        self.playerJokers = []
-        self.playerConsumables = []
+        self.playerJokers = []       # entity IDs (entityRegistry), in slot order
+        self.playerConsumables = []  # entity IDs
         self.jokers = {}
         self.consumables = {}
+        self.jokerSlots = SlotRow()       # hit-testing for the rects in self.jokers
+        self.consumableSlots = SlotRow()  # hit-testing for the rects in self.consumables
         self.max_jokers = 2
         self.max_consumables = 3
         # track which jokers activated for the current played hand (used to offset their draw)
@@ -81,37 +107,39 @@ class GameState(State):
         print("DEBUG: Consumable deck has:", [c.name for c in self.consumableDeck])
 
         #cool sounds
-        self.use_sound = pygame.mixer.Sound("Graphics/Sounds/rupee.wav")
+        self.use_sound = assetManager.getSound("Graphics/Sounds/rupee.wav")
         self.use_sound.set_volume(1.0)
-        self.destroy_sound = pygame.mixer.Sound("Graphics/Sounds/thunder.wav")
+        self.destroy_sound = assetManager.getSound("Graphics/Sounds/thunder.wav")
         self.destroy_sound.set_volume(1.0)
-        self.buy_sound = pygame.mixer.Sound("Graphics/Sounds/buySFX.wav")
+        self.buy_sound = assetManager.getSound("Graphics/Sounds/buySFX.wav")
         self.buy_sound.set_volume(1.0)
 
         # for joker in self.jokerDeck:
         #     print(joker.name)
 
-        self.cardsSelectedList = []
+        self.cardsSelectedList = CardSelection()  # ordered set of the selected cards, owns card.isSelected
         self.cardsSelectedRect = {}
         self.playedHandNameList = ['']
         self.used = []
         self.sorting = ""
 
-        self.redTint = pygame.image.load("Graphics/Backgrounds/redTint.png").convert_alpha()
-        self.redTint = pygame.transform.scale(self.redTint, (1300, 750))
+        self.redTint = assetManager.getScaledImage("Graphics/Backgrounds/redTint.png", (1300, 750))
         self.showRedTint = False
         self.redAlpha = 0
 
-        self.gameOverSound = pygame.mixer.Sound("Graphics/Sounds/gameEnd.mp3")
+        # Timed effects (game over fade, heat level up, boss warnings) run on the animator instead of blocking the loop
+        self.animator = Animator()
+        self.effectFlash = None   # (r, g, b, a) full-screen flash drawn over the game
+        self.effectBanner = None  # (text surface, center) message shown on a dark box
+
+        self.gameOverSound = assetManager.getSound("Graphics/Sounds/gameEnd.mp3")
         self.gameOverSound.set_volume(0.6)  # adjust loudness if needed
 
         # --------------------------------Images----------------------------------------------
-        self.backgroundImage = pygame.image.load('Graphics/Backgrounds/gameplayBG.jpg')
-        self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
-        self.smallBlind = pygame.image.load('Graphics/Backgrounds/Blinds/smallBlind.png')
+        self.background = assetManager.getScaledImage('Graphics/Backgrounds/gameplayBG.jpg', (1300, 750), alpha=False)
+        self.smallBlind = assetManager.getImage('Graphics/Backgrounds/Blinds/smallBlind.png')
 
-        self.tvOverlay = pygame.image.load('Graphics/Backgrounds/CRT.png').convert_alpha()
-        self.tvOverlay = pygame.transform.scale(self.tvOverlay, (1300, 750))
+        self.tvOverlay = assetManager.getScaledImage('Graphics/Backgrounds/CRT.png', (1300, 750))
         # ----------------------------Player Options UI---------------------------------------
 
         # -----------------------Player Joker/Consumable Manip -------------------------------
@@ -125,8 +153,7 @@ class GameState(State):
         # ----------------------------Boss Theme & Background----------------------------
         # Use the music channel for background themes (main/boss) to avoid overlaps
         self.bossMusic_path = "Graphics/Sounds/bossBlindTheme.mp3"
-        self.bossBackgroundImage = pygame.image.load('Graphics/Backgrounds/bossBG.png')
-        self.bossBackground = pygame.transform.scale(self.bossBackgroundImage, (1300, 750))
+        self.bossBackground = assetManager.getScaledImage('Graphics/Backgrounds/bossBG.png', (1300, 750), alpha=False)
         self.isBossActive = False
         self.bossMusicPlaying = False
 
@@ -150,11 +177,11 @@ class GameState(State):
         self.sortSuitRect = pygame.Rect(self.sortHandRect.x + inner_margin * 2 + inner_w, inner_y, inner_w, inner_h)
 
         # -------------------------------Text surfaces--------------------------------------
-        self.playHandText = self.playerInfo.textFont2.render("Play Hand", False, 'white')
-        self.discardText = self.playerInfo.textFont2.render("Discard", False, 'white')
-        self.sortRankText = self.playerInfo.textFont2.render("Rank", False, 'white')
-        self.sortSuitText = self.playerInfo.textFont2.render("Suit", False, 'white')
-        self.sortTitleText = self.playerInfo.textFont2.render("Sort Hand", False, 'white')
+        self.playHandText = textCache.render(self.playerInfo.textFont2, "Play Hand", False, 'white')
+        self.discardText = textCache.render(self.playerInfo.textFont2, "Discard", False, 'white')
+        self.sortRankText = textCache.render(self.playerInfo.textFont2, "Rank", False, 'white')
+        self.sortSuitText = textCache.render(self.playerInfo.textFont2, "Suit", False, 'white')
+        self.sortTitleText = textCache.render(self.playerInfo.textFont2, "Sort Hand", False, 'white')
 
         # ----------------------------Game Areas----------------------------------------------
         self.centerCardsRect = pygame.Rect(450, 300, 500, 140)
@@ -165,12 +192,24 @@ class GameState(State):
         self.pileContainer = pygame.Rect(1120, 550, 100, 140)
 
         # ----------------------------Sound Effects-------------------------------------------
-        self.select_sfx = pygame.mixer.Sound('Graphics/Sounds/selectCard.ogg')
-        self.deselect_sfx = pygame.mixer.Sound('Graphics/Sounds/deselectCard.ogg')
+        self.select_sfx = assetManager.getSound('Graphics/Sounds/selectCard.ogg')
+        self.deselect_sfx = assetManager.getSound('Graphics/Sounds/deselectCard.ogg')
 
         # ----------------------------Deck Pile UI--------------------------------------------
         self.show_deck_pile = False
+        self.overlayWasVisible = False  # a full-screen overlay was drawn last frame (see draw)
         self.deck_button_rect = self.pileContainer.copy()
+        self.pileCardImage = assetManager.getScaledImage('Graphics/Cards/Poker_Sprites.png', self.pileContainer.size,
+                                                              area=pygame.Rect(0, 0, 70, 94))
+
+        # ----------------------------Soul Icon-----------------------------------------------
+        try:
+            self.soulIcon = assetManager.getScaledImage("Graphics/backgrounds/soul_icon.png", (60, 60))
+        except (pygame.error, FileNotFoundError):
+            # Fallback to drawn icon if image not found
+            self.soulIcon = pygame.Surface((60, 60), pygame.SRCALPHA)
+            pygame.draw.circle(self.soulIcon, (200, 100, 255), (30, 30), 25)
+            pygame.draw.circle(self.soulIcon, (255, 255, 255), (30, 30), 15)
 
         # ----------------------------Play Hand Logic-----------------------------------------
         self.playHandActive = False
@@ -204,10 +243,37 @@ class GameState(State):
         return desc_map.get(joker_obj.name, "No description available.")
 
     def gray_overlay_(self, destSurface, rect):
-        shade = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        shade.fill((0, 0, 0, 180))
+        shade = surfacePool.get("grayOverlay", rect.size, fill=(0, 0, 0, 180))
         destSurface.blit(shade, rect.topleft)
 
+    def fixedUpdate(self, dt: float):
+        self.animator.update(dt)
+        if self.playerInfo.levelManager.playerWins or self.showReviveOption:
+            return
+
+        # Heat stuff
+        if self.playerInfo.isHeatActive:
+            # Reduce heat duration (seconds of real time)
+            self.playerInfo.heatDuration -= dt
+
+            # Check if heat duration expired
+            if self.playerInfo.heatDuration <= 0:
+                # Level down or deactivate heat
+                if self.playerInfo.heat_level > 1:
+                    self.playerInfo.heat_level -= 1
+                    print(f"HEAT LEVEL DOWN: Now at level {self.playerInfo.heat_level}")
+
+                    # Set new duration based on current level
+                    if self.playerInfo.heat_level == 2:
+                        self.playerInfo.heatDuration = 5  # 5 seconds
+                    elif self.playerInfo.heat_level == 1:
+                        self.playerInfo.heatDuration = 5  # 5 seconds
+                else:
+                    # Heat completely depleted
+                    self.playerInfo.heat_level = 0
+                    self.playerInfo.isHeatActive = False
+                    print("HEAT DEPLETED: Heat mode ended!")
+
     def update(self):
         # Always update LevelManager first so win/levelFinished flags are fresh
         self.playerInfo.levelManager.update()
@@ -226,20 +292,19 @@ class GameState(State):
             return
         # Check if we need to reset deck (coming back from LevelSelectState)
         if self.deckManager.resetDeck:
-            for card in self.hand:
-                card.isSelected = False
-            self.deck = self.deck + self.hand.copy() #+ self.used.copy()
+            self.cardsSelectedList.clear()
+            self.deck.reshuffle(self.hand) # used cards stay out
+            for card in self.used:
+                self.deck.composition.remove(card)
             self.updateCardImages()
-            self.deck = State.deckManager.shuffleDeck(self.deck)
             self.hand = State.deckManager.dealCards(self.deck, 8, self.playerInfo.levelManager.next_unfinished_sublevel())
             self.used = []
-            self.cardsSelectedList = []
             self.cardsSelectedRect = {}
             self.updateCards(400, 520, self.cards, self.hand, scale=1.2)
             self.deckManager.resetDeck = False  # Clear the flag
 
-        # Check if level is finished and transition to LevelSelectState
-        if self.playerInfo.levelFinished:
+        # Check if level is finished and transition to LevelSelectState (once the heat level up effect is done)
+        if self.playerInfo.levelFinished and not self.animator.isPlaying("heatLevelUp"):
             reward = self.calculate_gold_reward(self.playerInfo)
             self.playerInfo.playerMoney += reward
             self.playerInfo.amountOfHands = 4
@@ -249,17 +314,15 @@ class GameState(State):
             self.drawJokers()
             self.drawConsumables()
             self.drawDeckContainer()
-            self.screen.blit(self.tvOverlay,(0,0))
+            renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
             self.playerInfo.hasRevivedThisBlind = False
 
             State.screenshot = self.screen.copy()
             State.player_info = self.playerInfo
             self.isFinished = True
-            for card in self.hand + self.used:
-                card.isSelected = False
-            self.deck = self.deck + self.hand.copy() + self.used.copy()
-            self.deck = State.deckManager.shuffleDeck(self.deck)
+            self.cardsSelectedList.clear()
+            self.deck.reshuffle(self.hand + self.used)
             self.updateCardImages()
             self.hand = State.deckManager.dealCards(self.deck, 8, self.playerInfo.levelManager.next_unfinished_sublevel())
             self.playerInfo.amountOfHands = 4
@@ -270,30 +333,6 @@ class GameState(State):
 
             return
 
-        # Heat stuff
-        if self.playerInfo.isHeatActive:
-            # Reduce heat duration
-            self.playerInfo.heatDuration -= 1  # Assuming this runs ~60 times per second
-
-            # Check if heat duration expired
-            if self.playerInfo.heatDuration <= 0:
-                # Level down or deactivate heat
-                if self.playerInfo.heat_level > 1:
-                    self.playerInfo.heat_level -= 1
-                    print(f"HEAT LEVEL DOWN: Now at level {self.playerInfo.heat_level}")
-
-                    # Set new duration based on current level
-                    if self.playerInfo.heat_level == 2:
-                        self.playerInfo.heatDuration = 300  # 5 seconds at 60 FPS
-                    elif self.playerInfo.heat_level == 1:
-                        self.playerInfo.heatDuration = 300  # 5 seconds at 60 FPS
-                else:
-                    # Heat completely depleted
-                    self.playerInfo.heat_level = 0
-                    self.playerInfo.isHeatActive = False
-                    print("HEAT DEPLETED: Heat mode ended!")
-
-
         # Handle boss level music switching
         bossName = self.playerInfo.levelManager.curSubLevel.bossLevel
         if bossName and not self.isBossActive:
@@ -305,7 +344,7 @@ class GameState(State):
             
         # Handle play hand timing
         if self.playHandActive and self.playHandStartTime > 0:
-            curTime = pygame.time.get_ticks()
+            curTime = frameClock.ticks()
             if curTime - self.playHandStartTime > self.playHandDuration:
                 # Commit pending round addition and reset displayed chips/multiplier
                 if getattr(self, "pending_round_add", 0) > 0:
@@ -344,7 +383,7 @@ class GameState(State):
                 self.playerInfo.playerMultiplier = 0
 
                 self.playerInfo.curHandOfPlayer = ""
-                self.playerInfo.curHandText = self.playerInfo.textFont1.render("", False, 'white')
+                self.playerInfo.curHandText = textCache.render(self.playerInfo.textFont1, "", False, 'white')
 
                 self.playHandActive = False
                 # clear activated jokers when the display period ends so they return to normal position
@@ -364,6 +403,7 @@ class GameState(State):
                         for c in cardsToDiscard:
                                 self.used.append(c)
                                 self.hand.remove(c)
+                                self.deck.composition.move(c, "used")
                                 self.deselect_sfx.play()
 
 
@@ -373,12 +413,17 @@ class GameState(State):
         self.debugState.update()
 
     def draw(self):
+        # Full-screen overlays change every pixel, fall back to a full-frame update while one is shown
+        # and on the frame after it closes, so the whole overlay gets erased
+        overlayVisible = self.showReviveOption or self.showRedTint or self.show_deck_pile or self.debugState.visible
+        if overlayVisible or self.overlayWasVisible:
+            dirtyRects.invalidate()
+        self.overlayWasVisible = overlayVisible
+
         # mess with this later (Change the bg to black)
         if self.showReviveOption:
             self.screen.fill((0, 0, 0))
-            tint = pygame.Surface((1300, 750), pygame.SRCALPHA)
-            tint.fill((255, 0, 0, 180))
-            self.screen.blit(tint, (0, 0))
+            renderQuality.drawTint(self.screen, (255, 0, 0), 180)
             self.drawGameOverScreen()
             return
         # --- Call funcions ---
@@ -399,14 +444,13 @@ class GameState(State):
         # DRAW SOUL DISPLAY
         self.drawSoulDisplay()
         if self.showRedTint and not self.showReviveOption:
-            tint = pygame.Surface((1300, 750), pygame.SRCALPHA)
-            tint.fill((255, 0, 0, 180))
-            self.screen.blit(tint, (0, 0))
+            renderQuality.drawTint(self.screen, (255, 0, 0), self.redAlpha)
+        self.drawEffects()
 
         # Top level
         self.drawDeckPileOverlay()
 
-        self.screen.blit(self.tvOverlay, (0, 0))
+        renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
     def switchToBossTheme(self):
         # Switch background music to the boss theme using the music channel
@@ -426,7 +470,7 @@ class GameState(State):
 
     # ----------------------------Draw Methods------------------------------------------------
     def drawDeckContainer(self):
-        deckContainer = pygame.Surface(self.deckContainer.size, pygame.SRCALPHA)
+        deckContainer = surfacePool.get("deckContainer", self.deckContainer.size)
         pygame.draw.rect(deckContainer, (0, 0, 0, 120), deckContainer.get_rect())
         self.screen.blit(deckContainer, self.deckContainer.topleft)
 
@@ -435,7 +479,7 @@ class GameState(State):
             if self.playHandActive and card in self.cardsSelectedList:
                 continue
             img_to_draw = getattr(card, "scaled_image", card.image)
-            State.screen.blit(img_to_draw, self.cards[card])
+            dirtyRects.add(State.screen.blit(img_to_draw, self.cards[card]))
         self.drawCardTooltip()
 
     def drawCenterCards(self):
@@ -446,41 +490,39 @@ class GameState(State):
                 img_to_draw = getattr(card, "scaled_image", card.image)
                 self.centerCardsSurface.blit(img_to_draw, rect)
 
-        self.screen.blit(self.centerCardsSurface, self.centerCardsRect)
+        centerRect = self.screen.blit(self.centerCardsSurface, self.centerCardsRect)
+        if self.cardsSelectedRect:
+            dirtyRects.add(centerRect)
 
     def drawPlayedHandName(self):
         if self.playHandActive and self.playedHandTextSurface:
             text_rect = self.playedHandTextSurface.get_rect(centerx=self.centerCardsRect.centerx)
             text_rect.bottom = self.centerCardsRect.top - 40  # Positioned higher
-            self.screen.blit(self.playedHandTextSurface, text_rect)
+            dirtyRects.add(self.screen.blit(self.playedHandTextSurface, text_rect))
 
         if self.playHandActive and self.scoreBreakdownTextSurface:
             score_rect = self.scoreBreakdownTextSurface.get_rect(centerx=self.centerCardsRect.centerx)
             # Position it relative to the hand name's rect for perfect alignment
             score_rect.top = text_rect.bottom + 5
-            self.screen.blit(self.scoreBreakdownTextSurface, score_rect)
+            dirtyRects.add(self.screen.blit(self.scoreBreakdownTextSurface, score_rect))
 
     def drawJokers(self):
         # Draw container background
         if self.showReviveOption:
             return
-        jokerSurface = pygame.Surface(self.jokerContainer.size, pygame.SRCALPHA)
+        jokerSurface = surfacePool.get("jokerContainer", self.jokerContainer.size)
         pygame.draw.rect(jokerSurface, (0, 0, 0, 120), jokerSurface.get_rect(), border_radius=6)
         self.screen.blit(jokerSurface, self.jokerContainer.topleft)
 
-        # Build joker objects list in the exact order of self.playerJokers
-        player_joker_objs = []
-        for name in self.playerJokers:
-            for joker in self.jokerDeck:
-                if joker.name == name:
-                    player_joker_objs.append(joker)
-                    break
+        # Joker objects in the exact order of self.playerJokers
+        player_joker_objs = self.ownedJokers()
         self.jokers.clear()
         n = max(1, len(player_joker_objs))
         inner_margin = 8
         avail_w = self.jokerContainer.width - inner_margin * (n + 1)
         slot_w = max(10, avail_w // n) if n > 0 else self.jokerContainer.width - inner_margin * 2
         slot_h = self.jokerContainer.height - inner_margin * 2
+        self.jokerSlots.reset(self.jokerContainer.x + inner_margin, slot_w + inner_margin, len(player_joker_objs))
 
         for i, joker in enumerate(player_joker_objs):
             img = getattr(joker, "image", None)
@@ -495,8 +537,8 @@ class GameState(State):
                 scale = target_h / ih
             new_w = max(1, int(iw * scale))
             new_h = max(1, int(ih * scale))
-            scaled = pygame.transform.scale(img, (new_w, new_h))
-            joker.scaled_image = scaled
+            joker.scaledSize = (new_w, new_h)
+            scaled = joker.scaled_image
 
             # center the scaled image inside its slot
             slot_x = self.jokerContainer.x + inner_margin + i * (slot_w + inner_margin)
@@ -510,36 +552,31 @@ class GameState(State):
                 rect = rect.move(0, 50)
 
             self.jokers[joker] = rect
-            State.screen.blit(scaled, rect)
+            self.jokerSlots.place(i, joker, rect)
+            dirtyRects.add(State.screen.blit(scaled, rect))
 
         # count/title text (keeps old placement just under container)
-        jokerTitleText = self.playerInfo.textFont1.render((str(len(self.playerJokers))) + "/ " + str(self.max_jokers), True, 'white')
-        self.screen.blit(jokerTitleText, (self.jokerContainer.x + 1, self.jokerContainer.y + self.jokerContainer.height + 0))
+        jokerTitleText = textCache.render(self.playerInfo.textFont1, (str(len(self.playerJokers))) + "/ " + str(self.max_jokers), True, 'white')
+        dirtyRects.add(self.screen.blit(jokerTitleText, (self.jokerContainer.x + 1, self.jokerContainer.y + self.jokerContainer.height + 0)))
 
     # DONE: Draw the consumable slot with really similar logic to drawJokers
     def drawConsumables(self):
         # Draw container background
         if self.showReviveOption:
             return
-        consumableSurface = pygame.Surface(self.consumableContainer.size, pygame.SRCALPHA)
+        consumableSurface = surfacePool.get("consumableContainer", self.consumableContainer.size)
         pygame.draw.rect(consumableSurface, (0, 0, 0, 120), consumableSurface.get_rect(), border_radius=6)
         self.screen.blit(consumableSurface, self.consumableContainer.topleft)
 
-        # Build consumable objects list in the exact order of self.playerConsumables
-        player_consumable_objs = []
-        for name in self.playerConsumables:
-            for consum in self.consumableDeck:
-                if consum.name == name:
-                    player_consumable_objs.append(consum)
-                    break
-
-
+        # Consumable objects in the exact order of self.playerConsumables
+        player_consumable_objs = entityRegistry.resolve(self.playerConsumables)
         self.consumables.clear()
         n = max(1, len(player_consumable_objs))
         inner_margin = 8
         avail_w = self.consumableContainer.width - inner_margin * (n + 1)
         slot_w = max(10, avail_w // n) if n > 0 else self.consumableContainer.width - inner_margin * 2
         slot_h = self.consumableContainer.height - inner_margin * 2
+        self.consumableSlots.reset(self.consumableContainer.x + inner_margin, slot_w + inner_margin, len(player_consumable_objs))
 
         for i, consum in enumerate(player_consumable_objs):
             img = getattr(consum, "image", None)
@@ -554,8 +591,8 @@ class GameState(State):
                 scale = target_h / ih
             new_w = max(1, int(iw * scale))
             new_h = max(1, int(ih * scale))
-            scaled = pygame.transform.scale(img, (new_w, new_h))
-            consum.scaled_image = scaled
+            consum.scaledSize = (new_w, new_h)
+            scaled = consum.scaled_image
 
             # center the scaled image inside its slot
             slot_x = self.consumableContainer.x + inner_margin + i * (slot_w + inner_margin)
@@ -569,11 +606,12 @@ class GameState(State):
                 rect = rect.move(5, -10)
 
             self.consumables[consum] = rect
-            State.screen.blit(scaled, rect)
+            self.consumableSlots.place(i, consum, rect)
+            dirtyRects.add(State.screen.blit(scaled, rect))
 
         # count/title text (keeps old placement just under container)
-        consumableTitleText = self.playerInfo.textFont1.render((str(len(self.playerConsumables))) + "/ " + str(self.max_consumables), True, 'white')
-        self.screen.blit(consumableTitleText, (self.consumableContainer.x + 1, self.consumableContainer.y + self.consumableContainer.height + 0))
+        consumableTitleText = textCache.render(self.playerInfo.textFont1, (str(len(self.playerConsumables))) + "/ " + str(self.max_consumables), True, 'white')
+        dirtyRects.add(self.screen.blit(consumableTitleText, (self.consumableContainer.x + 1, self.consumableContainer.y + self.consumableContainer.height + 0)))
 
     def drawHeatDisplay(self):
         heat = self.playerInfo.heat
@@ -587,10 +625,10 @@ class GameState(State):
         bar_y = 50
         color = (0,0,0)
 
-        pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
+        dirtyRects.add(pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height)))
 
         if is_active:
-            max_duration = 600 if heat_level == 3 else 300
+            max_duration = 10 if heat_level == 3 else 5
             fill_ratio = self.playerInfo.heatDuration / max_duration
             fill_width = int(fill_ratio * bar_width)
 
@@ -605,9 +643,9 @@ class GameState(State):
 
             pygame.draw.rect(self.screen, color, (bar_x, bar_y, fill_width, bar_height))
 
-            seconds_remaining = max(0, self.playerInfo.heatDuration) // 60
-            time_text = self.playerInfo.textFont1.render(f"{seconds_remaining}s", True, (255, 255, 255))
-            self.screen.blit(time_text, (bar_x + bar_width + 10, bar_y))
+            seconds_remaining = int(max(0, self.playerInfo.heatDuration))
+            time_text = textCache.render(self.playerInfo.textFont1, f"{seconds_remaining}s", True, (255, 255, 255))
+            dirtyRects.add(self.screen.blit(time_text, (bar_x + bar_width + 10, bar_y)))
         else:
             fill_width = int((heat / 100) * bar_width)
 
@@ -623,22 +661,22 @@ class GameState(State):
             pygame.draw.rect(self.screen, color, (bar_x, bar_y, fill_width, bar_height))
 
             # Show heat percentage
-            percent_text = self.playerInfo.textFont1.render(f"{heat}%", True, (255, 255, 255))
-            self.screen.blit(percent_text, (bar_x + bar_width + 10, bar_y))
+            percent_text = textCache.render(self.playerInfo.textFont1, f"{heat}%", True, (255, 255, 255))
+            dirtyRects.add(self.screen.blit(percent_text, (bar_x + bar_width + 10, bar_y)))
 
         # Heat level text
-        level_text = self.playerInfo.textFont1.render(f"HEAT: {heat_level}", True, (255, 255, 255))
-        self.screen.blit(level_text, (bar_x, bar_y - 25))
+        level_text = textCache.render(self.playerInfo.textFont1, f"HEAT: {heat_level}", True, (255, 255, 255))
+        dirtyRects.add(self.screen.blit(level_text, (bar_x, bar_y - 25)))
 
         # Active heat indicator
         if is_active:
-            active_text = self.playerInfo.textFont1.render("HEAT ACTIVE!", True, (255, 255, 0))
-            self.screen.blit(active_text, (bar_x, bar_y + 25))
+            active_text = textCache.render(self.playerInfo.textFont1, "HEAT ACTIVE!", True, (255, 255, 0))
+            dirtyRects.add(self.screen.blit(active_text, (bar_x, bar_y + 25)))
 
         # Heat instructions
         if heat_level > 0 and not is_active:
-            heat_instructions = self.playerInfo.textFont2.render(f"Press 'H' to activate heat", False, (255, 255, 255))
-            self.screen.blit(heat_instructions, (bar_x, bar_y + 30))
+            heat_instructions = textCache.render(self.playerInfo.textFont2, f"Press 'H' to activate heat", False, (255, 255, 255))
+            dirtyRects.add(self.screen.blit(heat_instructions, (bar_x, bar_y + 30)))
 
     # --- Sell button (has duplicate in ShopState) -----
     def drawSell(self):
@@ -648,14 +686,14 @@ class GameState(State):
 
         joker_obj, joker_rect = self.joker_for_sell
         text = f"Sell : {joker_obj.sellPrice()}$"
-        txt_surf = self.playerInfo.textFont2.render(text, True, (255, 255, 255))
+        txt_surf = textCache.render(self.playerInfo.textFont2, text, True, (255, 255, 255))
         pad_x, pad_y = 10, 6
         box_w = txt_surf.get_width() + pad_x * 2
         box_h = txt_surf.get_height() + pad_y * 2
         box_x = joker_rect.centerx - box_w // 2
         box_y = joker_rect.bottom + 6
         self.sell_rect = pygame.Rect(box_x, box_y, box_w, box_h)
-        pygame.draw.rect(self.screen, (30, 200, 30), self.sell_rect, border_radius=6)
+        dirtyRects.add(pygame.draw.rect(self.screen, (30, 200, 30), self.sell_rect, border_radius=6))
         self.screen.blit(txt_surf, (box_x + pad_x, box_y + pad_y))
 
     # ---- Use button (has duplicate in ShopState) -----
@@ -666,31 +704,23 @@ class GameState(State):
 
         joker_obj, joker_rect = self.joker_for_use
         text = f"Use"
-        txt_surf = self.playerInfo.textFont2.render(text, True, (255, 255, 255))
+        txt_surf = textCache.render(self.playerInfo.textFont2, text, True, (255, 255, 255))
         pad_x, pad_y = 10, 6
         box_w = txt_surf.get_width() + pad_x * 2
         box_h = txt_surf.get_height() + pad_y * 3
         box_x = joker_rect.centerx + 40
         box_y = (joker_rect.bottom + 6) // 2
         self.use_rect = pygame.Rect(box_x, box_y, box_w, box_h)
-        pygame.draw.rect(self.screen, (200, 0, 0), self.use_rect, border_radius=6)
+        dirtyRects.add(pygame.draw.rect(self.screen, (200, 0, 0), self.use_rect, border_radius=6))
         self.screen.blit(txt_surf, (box_x + pad_x, box_y + pad_y))
 
     def drawSoulDisplay(self):
         souls = getattr(self.playerInfo, 'souls', 0)
-
-        try:
-            soul_icon = pygame.image.load("Graphics/backgrounds/soul_icon.png").convert_alpha()
-            soul_icon = pygame.transform.scale(soul_icon, (60, 60))
-        except:
-            # Fallback to drawn icon if image not found
-            soul_icon = pygame.Surface((60, 60), pygame.SRCALPHA)
-            pygame.draw.circle(soul_icon, (200, 100, 255), (30, 30), 25)
-            pygame.draw.circle(soul_icon, (255, 255, 255), (30, 30), 15)
+        soul_icon = self.soulIcon  # loaded once in __init__
 
         # Soul text
-        souls_label = self.playerInfo.textFont1.render("Souls:", True, (200, 200, 200))  # Gray label
-        souls_value = self.playerInfo.textFont1.render(f"{souls}", True, (255, 255, 255))  # White value
+        souls_label = textCache.render(self.playerInfo.textFont1, "Souls:", True, (200, 200, 200))  # Gray label
+        souls_value = textCache.render(self.playerInfo.textFont1, f"{souls}", True, (255, 255, 255))  # White value
 
         # Position in top-right corner
         icon_x = 200  # Center position
@@ -708,22 +738,18 @@ class GameState(State):
 
         # Draw label, value, and icon
         self.screen.blit(souls_label, (label_x, label_y))
-        self.screen.blit(souls_value, (value_x, value_y))
+        dirtyRects.add(self.screen.blit(souls_value, (value_x, value_y)))
         self.screen.blit(soul_icon, (icon_x, icon_y))
 
     def drawDeckPile(self):
-        pileContainer = pygame.Surface(self.pileContainer.size, pygame.SRCALPHA)
+        pileContainer = surfacePool.get("pileContainer", self.pileContainer.size)
         pygame.draw.rect(pileContainer, (0, 0, 0, 120), pileContainer.get_rect())
-        balatro_card = pygame.image.load('Graphics/Cards/Poker_Sprites.png').convert_alpha()
-        card_width, card_height = 70, 94
-        card_img = balatro_card.subsurface(pygame.Rect(0, 0, card_width, card_height))
-        scaled_card = pygame.transform.scale(card_img, self.pileContainer.size)
-        pileContainer.blit(scaled_card, (0, 0))
+        pileContainer.blit(self.pileCardImage, (0, 0))
         self.screen.blit(pileContainer, self.pileContainer.topleft)
-        pileCountText = self.playerInfo.textFont1.render(str(len(self.deck)) + "/" + str(len(self.deck + self.hand + self.used)), True, 'white')
+        pileCountText = textCache.render(self.playerInfo.textFont1, str(len(self.deck)) + "/" + str(self.deck.composition.total), True, 'white')
         textX = self.pileContainer.x + 5
         textY = self.pileContainer.y + self.pileContainer.height + 5
-        self.screen.blit(pileCountText, (textX, textY))
+        dirtyRects.add(self.screen.blit(pileCountText, (textX, textY)))
         pygame.draw.rect(self.screen, (50, 50, 200), self.deck_button_rect, 3)
 
     def drawPlayerOptions(self):
@@ -763,14 +789,11 @@ class GameState(State):
                                     self.playHandText.get_rect(center=self.playHandButtonRect.center))
             self.playerOpcions.blit(self.discardText, self.discardText.get_rect(center=self.discardButtonRect.center))
 
-        State.screen.blit(self.playerOpcions, self.playerOpcionsRect.topleft)
+        dirtyRects.add(State.screen.blit(self.playerOpcions, self.playerOpcionsRect.topleft))
 
     def drawDeckPileOverlay(self):
         if self.show_deck_pile:
-            overlay = pygame.Surface((1300, 750), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
-            card_images = State.deckManager.load_card_images(self.playerInfo.levelManager.next_unfinished_sublevel(), self.enhanced_cards)
+            renderQuality.drawTint(self.screen, (0, 0, 0), 180)
             suits = [Suit.HEARTS, Suit.CLUBS, Suit.DIAMONDS, Suit.SPADES]
             ranks = [Rank.ACE, Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE, Rank.SIX, Rank.SEVEN,
                      Rank.EIGHT, Rank.NINE, Rank.TEN, Rank.JACK, Rank.QUEEN, Rank.KING]
@@ -785,14 +808,8 @@ class GameState(State):
             for c in self.used:
                 unusable.add(c)
 
-            pre_cards = sorted(self.hand + self.deck + self.used, key=lambda card: card.rank.value, reverse=True)
-            cards = []
-            for row, suit in enumerate(suits):
-                suit_row = []
-                for card in pre_cards:
-                    if card.suit == suit:
-                        suit_row.append(card)
-                cards.append(suit_row)
+            # Rows are cached by the composition index and only rebuilt after a draw/discard/destroy/transform
+            cards = self.deck.composition.suitRows(suits)
 
             for row, suit_list in enumerate(cards):
                 row_spacing_x = (( 13 / len(suit_list) ) * spacing_x)
@@ -807,7 +824,7 @@ class GameState(State):
                         rect = pygame.Rect(start_x + col * row_spacing_x, start_y + row * spacing_y, img.get_width(), img.get_height())
                         self.gray_overlay_(self.screen, rect)
 
-            close_text = self.playerInfo.textFont2.render("Click anywhere to close", True, 'white')
+            close_text = textCache.render(self.playerInfo.textFont2, "Click anywhere to close", True, 'white')
             self.screen.blit(close_text, (start_x, start_y + len(suits) * spacing_y + 20))
 
     # ----------------------------Input Methods-----------------------------------------------
@@ -815,6 +832,10 @@ class GameState(State):
         mousePos = pygame.mouse.get_pos()
         mousePosPlayerOpcions = (mousePos[0] - self.playerOpcionsRect.x, mousePos[1] - self.playerOpcionsRect.y)
 
+        # The game over fade is playing, the revive dialog takes input once it shows up
+        if self.animator.isPlaying("gameOver"):
+            return
+
         # heat keybind
         if events.type == pygame.KEYDOWN:
             if events.key == pygame.K_h:  # Press H to activate heat
@@ -858,11 +879,12 @@ class GameState(State):
                         self.deck = State.deckManager.shuffleDeck(State.deckManager.createDeck(self.playerInfo.levelManager.next_unfinished_sublevel()))
                         self.hand = State.deckManager.dealCards(self.deck, 8, self.playerInfo.levelManager.next_unfinished_sublevel())
                         self.jokerDeck = State.deckManager.shuffleDeck(State.deckManager.createJokerDeck())
+                        self.jokersById = {joker.id: joker for joker in self.jokerDeck}
                         self.consumableDeck = State.deckManager.shuffleDeck(State.deckManager.createConsumableDeck())
                         self.playerJokers = []
                         self.playerConsumables = []
                         self.used = []
-                        self.cardsSelectedList = []
+                        self.cardsSelectedList.clear()
                         self.cardsSelectedRect = {}
                         self.updateCards(400, 520, self.cards, self.hand, scale=1.2)
 
@@ -939,14 +961,15 @@ class GameState(State):
                 self.nextState = "RunInfoState"
 
             # Joker click info
-            for joker_obj, joker_rect in self.jokers.items():
-                if joker_rect.collidepoint(mousePos):
-                    desc_text = self._pretty_joker_description(joker_obj)
-                    price = getattr(joker_obj, 'price', None)
-                    extra = f" — Price: {price}$" if price is not None else ""
-                    print("------------------------------------------------------------")
-                    print(f"[JOKER] {joker_obj.name} — {desc_text}{extra}")
-                    # Pass onto the sell area
+            hit = self.jokerSlots.at(mousePos)
+            if hit is not None:
+                joker_obj = hit[0]
+                desc_text = self._pretty_joker_description(joker_obj)
+                price = getattr(joker_obj, 'price', None)
+                extra = f" — Price: {price}$" if price is not None else ""
+                print("------------------------------------------------------------")
+                print(f"[JOKER] {joker_obj.name} — {desc_text}{extra}")
+                # Pass onto the sell area
 
             # Sell
             if self.sell_rect and self.sell_rect.collidepoint(mousePos):
@@ -959,10 +982,10 @@ class GameState(State):
                     return
 
                 joker_obj, _ = self.joker_for_sell
-                if joker_obj.name in self.playerJokers:
-                    self.playerJokers.remove(joker_obj.name)
-                elif joker_obj.name in self.playerConsumables:
-                    self.playerConsumables.remove(joker_obj.name)
+                if joker_obj.id in self.playerJokers:
+                    self.playerJokers.remove(joker_obj.id)
+                elif joker_obj.id in self.playerConsumables:
+                    self.playerConsumables.remove(joker_obj.id)
                 else:
                     print(f"[GAME] sell: {joker_obj.name} not in playerJokers")
 
@@ -983,7 +1006,7 @@ class GameState(State):
                     self.selected_info = None
                     return
                 joker_obj, _ = self.joker_for_use
-                if joker_obj.name in self.playerConsumables:
+                if joker_obj.id in self.playerConsumables:
                     if joker_obj.name in PLANETS and isinstance(joker_obj, PlanetCard):
                         joker_obj.activatePlanet(HAND_SCORES)
 
@@ -998,7 +1021,9 @@ class GameState(State):
                             print(f"Error: {joker_obj.name} requires selected cards but none were chosen!")
                             return
 
-                        result = joker_obj.activateTarot(self.cardsSelectedList, self.hand)
+                        result = joker_obj.activateTarot(self.cardsSelectedList.toList(), self.hand)
+                        for c in self.cardsSelectedList:
+                            self.deck.composition.refresh(c)  # suit/rank/enhancement may have changed
                         print(f"Tarot '{joker_obj.name}' activated with result: {result}")
 
                         if result and "effect" in result:
@@ -1034,12 +1059,12 @@ class GameState(State):
                             self.updateCards(400, 520, self.cards, self.hand, scale=1.2)
 
                     # Remove from inventory
-                    self.playerConsumables.remove(joker_obj.name)
+                    self.playerConsumables.remove(joker_obj.id)
                     print(f"DEBUG: Removed {joker_obj.name} from playerConsumables")
-                    print(f"DEBUG: playerConsumables after removal: {self.playerConsumables}")
+                    print(f"DEBUG: playerConsumables after removal: {entityRegistry.namesOf(self.playerConsumables)}")
                 else:
                     print(f"[GAME] use: {joker_obj.name} not in playerConsumables")
-                    print(f"DEBUG: Available consumables: {self.playerConsumables}")
+                    print(f"DEBUG: Available consumables: {entityRegistry.namesOf(self.playerConsumables)}")
 
                 self.joker_for_sell = None
                 self.joker_for_use = None
@@ -1052,26 +1077,25 @@ class GameState(State):
                 self.drawConsumables()
             if not self.jokers:
                 self.drawJokers()
-            joker_objects = self.consumables.copy()
-            joker_objects.update(self.jokers.copy())
-            for joker_obj, joker_rect in joker_objects.items():
-                if joker_rect.collidepoint(mousePos) and not (self.joker_for_sell or self.joker_for_use):
-                    # print(f"DEBUG: Clicked on joker/consumable: {joker_obj.name}")
-                    # print(f"DEBUG: Type: {type(joker_obj)}")
-                    desc_text = joker_obj.description
-                    price = joker_obj.price
-                    name = joker_obj.name
-                    usable = True if isinstance(joker_obj, PlanetCard) or (
-                        isinstance(joker_obj, TarotCard)) else False
-                    self.joker_for_sell = (joker_obj, joker_rect)
-                    self.joker_for_use = (joker_obj, joker_rect) if usable else None
-                    self.selected_info = {'name': name, 'desc': desc_text, 'price': price, 'can_buy': False,
-                                          'usable': usable}
-                    # print(f"DEBUG: Set joker_for_use to: {self.joker_for_use[0].name if self.joker_for_use else None}")
-                    return
-            else:
-                self.joker_for_sell = None
-                self.joker_for_use = None
+            # Consumables take precedence over jokers
+            hit = self.consumableSlots.at(mousePos) or self.jokerSlots.at(mousePos)
+            if hit is not None and not (self.joker_for_sell or self.joker_for_use):
+                joker_obj, joker_rect = hit
+                # print(f"DEBUG: Clicked on joker/consumable: {joker_obj.name}")
+                # print(f"DEBUG: Type: {type(joker_obj)}")
+                desc_text = joker_obj.description
+                price = joker_obj.price
+                name = joker_obj.name
+                usable = True if isinstance(joker_obj, PlanetCard) or (
+                    isinstance(joker_obj, TarotCard)) else False
+                self.joker_for_sell = (joker_obj, joker_rect)
+                self.joker_for_use = (joker_obj, joker_rect) if usable else None
+                self.selected_info = {'name': name, 'desc': desc_text, 'price': price, 'can_buy': False,
+                                      'usable': usable}
+                # print(f"DEBUG: Set joker_for_use to: {self.joker_for_use[0].name if self.joker_for_use else None}")
+                return
+            self.joker_for_sell = None
+            self.joker_for_use = None
 
         # Pass input to playerInfo and debugState
         self.playerInfo.userInput(events)
@@ -1084,19 +1108,22 @@ class GameState(State):
             # Iterate in reverse to select the top-most card first
             for card in reversed(list(self.cards.keys())):
                 if self.cards[card].collidepoint(mousePos):
-                    if not card.isSelected:
+                    if card not in self.cardsSelectedList:
                         if len(self.cardsSelectedList) < 5:
-                            card.isSelected = True
-                            self.cards[card].y -= 50
-                            self.cardsSelectedList.append(card)
+                            self.setCardSelected(card, True)
                             self.select_sfx.play()
                     else:
-                        card.isSelected = False
-                        self.cards[card].y += 50
-                        self.cardsSelectedList.remove(card)
+                        self.setCardSelected(card, False)
                         self.deselect_sfx.play()
                     return  # Stop after interacting with one card
 
+    def setCardSelected(self, card, selected: bool) -> bool:
+        """Selects / deselects a card through the selection model and lifts / lowers its rect to match."""
+        changed = self.cardsSelectedList.add(card) if selected else self.cardsSelectedList.discard(card)
+        if changed and card in self.cards:
+            self.cards[card].y += -SELECTED_CARD_LIFT if selected else SELECTED_CARD_LIFT
+        return changed
+
     # DONE (TASK 7) - Rewrite this function so that it calculates the player's gold reward *recursively*.
     #   The recursion should progress through each step of the reward process (base reward, bonus for overkill, etc.)
     #   by calling itself with updated parameters or stages instead of using loops.
@@ -1149,66 +1176,49 @@ class GameState(State):
         for i, card in enumerate(cardsList):
             w, h = card.image.get_width(), card.image.get_height()
             new_w, new_h = int(w * scale), int(h * scale)
-            card.scaled_image = pygame.transform.scale(card.image, (new_w, new_h))
+            card.scaledSize = (new_w, new_h)
             x = posX + i * spacing - leftShift
             y = posY + baseYOffset
             if getattr(card, "isSelected", False):
-                y -= 50
+                y -= SELECTED_CARD_LIFT
             cardsDict[card] = pygame.Rect(x, y, new_w, new_h)
 
-    # DONE (TASK 2) - Implement a basic card-sorting system without using built-in sort functions.
-    #   Create a 'suitOrder' list (Hearts, Clubs, Diamonds, Spades), then use nested loops to compare each card
-    #   with the ones after it. Depending on the mode, sort by rank first or suit first, swapping cards when needed
-    #   until the entire hand is ordered correctly.
+    # DONE (TASK 2) - Card-sorting system. The 'sorting' attribute picks the mode: "suit" orders by
+    #   SUIT_ORDER (Hearts, Clubs, Diamonds, Spades) then rank, "rank" orders by rank then suit, "" keeps the
+    #   hand as dealt. Both are a stable sort over the SORT_KEYS key of each card; cards drawn later are
+    #   placed with insertDrawnCards instead of sorting the whole hand again.
     def SortCards(self, sort_by: str = "suit"):
-        # While programming this task, the code editor suggested I use random.shuffle
-        # The voices are begging me to use bogosort
-        suitOrder = [Suit.HEARTS, Suit.CLUBS, Suit.DIAMONDS, Suit.SPADES]   # Define the order of suits
-
-        if sort_by == "rank":
-            sort_suits = False
-        elif sort_by == "suit":
-            sort_suits = True
-        elif sort_by == "":
+        if sort_by == "":
             return
-        else:
+        key = SORT_KEYS.get(sort_by)
+        if key is None:
             raise IOError("sort_by must be of 'rank', 'suit' or an empty string ('')")
 
+        self.hand = sorted(self.hand, key=key)
+        self.updateCards(400, 520, self.cards, self.hand, scale=1.2)
 
-        hand_buffer = self.hand.copy()
-        is_sorted = False
-        while not is_sorted:
-            is_sorted = True
-            for i in range(len(hand_buffer)):
-                card = hand_buffer[i]
-                for j in range(i, len(hand_buffer)):
-                    card_rabbit = hand_buffer[j]
-                    if card.rank.value < card_rabbit.rank.value:
-                        popped_card = hand_buffer.pop(i)
-                        hand_buffer.append(popped_card)
-                        is_sorted = False
-                        break
-
-        full_hand = []
-        if sort_suits:
-            sorted_suits = []
-            for suit in suitOrder:
-                suit_group = []
-                for card in hand_buffer:
-                    if card.suit == suit:
-                        suit_group.append(card)
-                sorted_suits.append(suit_group)
-
-            for suits_group in sorted_suits:
-                for card in suits_group:
-                    full_hand.append(card)
-        else:
-            full_hand = hand_buffer
-
-
-        self.hand = full_hand
+    def ownedJokers(self) -> list:
+        """Joker objects of self.playerJokers in slot order, taken from this state's own joker deck."""
+        jokersById = self.jokersById
+        return [jokersById[i] for i in self.playerJokers if i in jokersById]
 
-        self.updateCards(400, 520, self.cards, self.hand, scale=1.2)
+    def insertDrawnCards(self, cards):
+        """Adds drawn cards to the hand, keeping it in 'sorting' order with binary insertion."""
+        key = SORT_KEYS.get(self.sorting)
+        if key is None:
+            self.hand.extend(cards)
+            return
+        keys = [key(card) for card in self.hand]
+        if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+            # A tarot changed a card's suit/rank since the last sort, sort the whole hand instead
+            self.hand.extend(cards)
+            self.hand.sort(key=key)
+            return
+        for card in cards:
+            cardKey = key(card)
+            i = bisect.bisect_right(keys, cardKey)  # after equal keys, same as the stable sort
+            keys.insert(i, cardKey)
+            self.hand.insert(i, card)
 
     def checkHoverCards(self):
         mousePos = pygame.mouse.get_pos()
@@ -1225,16 +1235,16 @@ class GameState(State):
                 smallfont = self.playerInfo.textFont2
                 if self.playerInfo.levelManager.curSubLevel.bossLevel == "The Mark":
                     if card.rank in [Rank.JACK, Rank.QUEEN, Rank.KING]:
-                        text_surf = font.render("???", False, 'White')
+                        text_surf = textCache.render(font, "???", False, 'White')
                     else:
-                        text_surf = font.render(tooltip_text, False, 'white')
+                        text_surf = textCache.render(font, tooltip_text, False, 'white')
                 elif self.playerInfo.levelManager.curSubLevel.bossLevel == "The House":
                     if card.faceDown:
-                        text_surf = font.render("???", False, 'White')
+                        text_surf = textCache.render(font, "???", False, 'White')
                     else:
-                        text_surf = font.render(tooltip_text, False, 'white')
+                        text_surf = textCache.render(font, tooltip_text, False, 'white')
                 else:
-                    text_surf = font.render(tooltip_text, False, 'white')
+                    text_surf = textCache.render(font, tooltip_text, False, 'white')
 
                 sm_text_surf = []
                 tooltip_wrap_char_amount = 30
@@ -1245,7 +1255,7 @@ class GameState(State):
                     has_enhancement = True
                     sm_title, sm_text = card.get_pretty_enhancement_description()
 
-                    title_surf = smallfont.render(sm_title, False, 'white')
+                    title_surf = textCache.render(smallfont, sm_title, False, 'white')
                     desc_height += title_surf.get_height()
                     sm_text_surf.append(title_surf)
 
@@ -1271,7 +1281,7 @@ class GameState(State):
                                         cur_text_line = cur_text_line[:len(cur_text_line) - j - 1]
                                         break
 
-                            cur_text_surface = smallfont.render(cur_text_line, False, 'white')
+                            cur_text_surface = textCache.render(smallfont, cur_text_line, False, 'white')
                             desc_height += cur_text_surface.get_height() + 8
 
                             sm_text_surf.append(cur_text_surface)
@@ -1288,7 +1298,7 @@ class GameState(State):
 
                 padding = 6
                 tooltip_w, tooltip_h = width + padding * 2, height + padding * 2
-                tooltip_surf = pygame.Surface((tooltip_w, tooltip_h), pygame.SRCALPHA)
+                tooltip_surf = surfacePool.get("tooltip", (tooltip_w, tooltip_h))
                 pygame.draw.rect(tooltip_surf, (0, 0, 0, 180), tooltip_surf.get_rect(), border_radius=6)
                 tooltip_surf.blit(text_surf, (padding, padding))
                 tooltip_x = rect.x + (rect.width - tooltip_w) // 2
@@ -1301,7 +1311,7 @@ class GameState(State):
                         sm_entry = sm_text_surf[i]
                         tooltip_surf.blit(sm_entry, (padding, padding + offset + (i * 25)))
 
-                self.screen.blit(tooltip_surf, (tooltip_x, tooltip_y))
+                dirtyRects.add(self.screen.blit(tooltip_surf, (tooltip_x, tooltip_y)))
                 break
 
     # drawCardToolTip, but with only joker-style objects (Jokers and Consumables)
@@ -1310,66 +1320,66 @@ class GameState(State):
             return
 
         mousePos = pygame.mouse.get_pos()
-        joker_objects = self.jokers.copy()
-        joker_objects.update(self.consumables)
-        for joker_obj, joker_rect in joker_objects.items():
-            if joker_rect.collidepoint(mousePos) and \
-                    (isinstance(joker_obj, Jokers) or isinstance(joker_obj, PlanetCard) or isinstance(joker_obj, TarotCard)):
-
-                if isinstance(joker_obj, Jokers):
-                    tooltip_text = f"{joker_obj.name}\n{self._pretty_joker_description(joker_obj)}"
-                else:
-                    tooltip_text = f"{joker_obj.name}\n{joker_obj.description}"
-                font = self.playerInfo.textFont1
-                # If we made any boss blinds reliant on deactivating jokers those would go here
-
-                # - Text wrapping -
-                tooltip_wrap_char_amount = 20
-                cur_tooltip_line = ""
-                text_surf_lines = []
-                total_width = 0
-                total_height = 0
-                max_len, max_len_id, cur_id = 0, 0, 0
-                offset = 0
-                for i in range(len(tooltip_text)):
-                    char = tooltip_text[i]
-                    cur_tooltip_line += char if char != '\n' else ' '
-                    if ((char == '\n') and len(cur_tooltip_line) > 1) or (len(cur_tooltip_line) == tooltip_wrap_char_amount - 1)\
-                            or (i == len(tooltip_text) - 1):
-                        next_tooltip_line = ""
-                        if i != len(tooltip_text) - 1:
-                            for j in range(len(cur_tooltip_line)):
-                                if cur_tooltip_line[len(cur_tooltip_line) - j - 1] in {' ', '\n'}:
-                                    next_tooltip_line = cur_tooltip_line[(len(cur_tooltip_line) - j - 1):]
-                                    cur_tooltip_line = cur_tooltip_line[:len(cur_tooltip_line) - j - 1]
-                                    break
-
-                        if len(cur_tooltip_line) > max_len:
-                            max_len = len(cur_tooltip_line)
-                            max_len_id = cur_id
-
-                        cur_surf_line = font.render(cur_tooltip_line, False, 'white')
-                        total_height += cur_surf_line.get_height()
-
-                        text_surf_lines.append(cur_surf_line)
-                        cur_tooltip_line = next_tooltip_line
-                        cur_id += 1
-
-                total_width = text_surf_lines[max_len_id].get_width()
-
-                padding = 6
-                tooltip_w, tooltip_h = total_width + padding * 2, total_height + padding * 2
-                tooltip_surf = pygame.Surface((tooltip_w, tooltip_h), pygame.SRCALPHA)
-                pygame.draw.rect(tooltip_surf, (0, 0, 0, 180), tooltip_surf.get_rect(), border_radius=6)
-
-                for i in range(len(text_surf_lines)):
-                    surf_line = text_surf_lines[i]
-                    tooltip_surf.blit(surf_line, (padding, padding + (i * 25)))
+        # Jokers take precedence over consumables
+        hit = self.jokerSlots.at(mousePos) or self.consumableSlots.at(mousePos)
+        if hit is None:
+            return
+        joker_obj, joker_rect = hit
+        if isinstance(joker_obj, Jokers) or isinstance(joker_obj, PlanetCard) or isinstance(joker_obj, TarotCard):
 
-                tooltip_x = joker_rect.x + (joker_rect.width - tooltip_w) // 2
-                tooltip_y = joker_rect.y + tooltip_h + 15
-                self.screen.blit(tooltip_surf, (tooltip_x, tooltip_y))
-                break
+            if isinstance(joker_obj, Jokers):
+                tooltip_text = f"{joker_obj.name}\n{self._pretty_joker_description(joker_obj)}"
+            else:
+                tooltip_text = f"{joker_obj.name}\n{joker_obj.description}"
+            font = self.playerInfo.textFont1
+            # If we made any boss blinds reliant on deactivating jokers those would go here
+
+            # - Text wrapping -
+            tooltip_wrap_char_amount = 20
+            cur_tooltip_line = ""
+            text_surf_lines = []
+            total_width = 0
+            total_height = 0
+            max_len, max_len_id, cur_id = 0, 0, 0
+            offset = 0
+            for i in range(len(tooltip_text)):
+                char = tooltip_text[i]
+                cur_tooltip_line += char if char != '\n' else ' '
+                if ((char == '\n') and len(cur_tooltip_line) > 1) or (len(cur_tooltip_line) == tooltip_wrap_char_amount - 1)\
+                        or (i == len(tooltip_text) - 1):
+                    next_tooltip_line = ""
+                    if i != len(tooltip_text) - 1:
+                        for j in range(len(cur_tooltip_line)):
+                            if cur_tooltip_line[len(cur_tooltip_line) - j - 1] in {' ', '\n'}:
+                                next_tooltip_line = cur_tooltip_line[(len(cur_tooltip_line) - j - 1):]
+                                cur_tooltip_line = cur_tooltip_line[:len(cur_tooltip_line) - j - 1]
+                                break
+
+                    if len(cur_tooltip_line) > max_len:
+                        max_len = len(cur_tooltip_line)
+                        max_len_id = cur_id
+
+                    cur_surf_line = textCache.render(font, cur_tooltip_line, False, 'white')
+                    total_height += cur_surf_line.get_height()
+
+                    text_surf_lines.append(cur_surf_line)
+                    cur_tooltip_line = next_tooltip_line
+                    cur_id += 1
+
+            total_width = text_surf_lines[max_len_id].get_width()
+
+            padding = 6
+            tooltip_w, tooltip_h = total_width + padding * 2, total_height + padding * 2
+            tooltip_surf = surfacePool.get("tooltip", (tooltip_w, tooltip_h))
+            pygame.draw.rect(tooltip_surf, (0, 0, 0, 180), tooltip_surf.get_rect(), border_radius=6)
+
+            for i in range(len(text_surf_lines)):
+                surf_line = text_surf_lines[i]
+                tooltip_surf.blit(surf_line, (padding, padding + (i * 25)))
+
+            tooltip_x = joker_rect.x + (joker_rect.width - tooltip_w) // 2
+            tooltip_y = joker_rect.y + tooltip_h + 15
+            dirtyRects.add(self.screen.blit(tooltip_surf, (tooltip_x, tooltip_y)))
     
     # -------- Play Hand Logic -----------
     def playHand(self):
@@ -1391,369 +1401,72 @@ class GameState(State):
                 if getattr(self.playerInfo, 'hasRevivedThisBlind', False):
                     self.playerInfo.souls = 0
 
-                for alpha in range(0, 180, 10):
-                    self.redAlpha = alpha
-                    self.draw()
-                    tint = pygame.Surface((1300, 750), pygame.SRCALPHA)
-                    tint.fill((255, 0, 0, alpha))
-                    self.screen.blit(tint, (0, 0))
-                    pygame.display.update()
-                    pygame.time.wait(80)
-
-
-                pygame.time.wait(1200)
-
-                self.showReviveOption = True
-                self.drawGameOverScreen()
-                self.draw()
+                # Fade the red tint in, hold it, then bring up the revive dialog
+                self.redAlpha = 0
+                self.animator.play(Timeline("gameOver")
+                                   .tween(1.44, self.setRedAlpha, 0, 180)
+                                   .wait(1.2)
+                                   .call(self.showGameOverDialog))
                 return
 
         if not (self.playerInfo.isHeatActive and self.playerInfo.heat_level == 3):
             self.playerInfo.amountOfHands -= 1
 
-        hand_name = evaluate_hand(self.cardsSelectedList)
-        self.playedHandName = hand_name
-        self.playedHandNameList.append(hand_name)
-
-        # Base values from HAND_SCORES
-        score_info = HAND_SCORES.get(hand_name, {"chips": 0, "multiplier": 1})
-        hand_chips = score_info.get("chips", 0)
-        hand_mult = score_info.get("multiplier", 1)
-
-        # Prepare helpers
-        sel = list(self.cardsSelectedList)
-        # group by rank value and by suit
-        by_rank = {}
-        for c in sel:
-            by_rank.setdefault(c.rank.value, []).append(c)
-        by_suit = {}
-        for c in sel:
-            by_suit.setdefault(c.suit, []).append(c)
-
-        used_cards = []
-
-        # Helper: find straight sequence in a list of ranks -> returns list of rank values
-        def find_straight_ranks(ranks_set):
-            vals = sorted(set(ranks_set))
-            # include low-Ace (1) if Ace present
-            if 14 in vals:
-                vals_with_ace_low = sorted(set(vals + [1]))
-            else:
-                vals_with_ace_low = vals
-            seq_start = None
-            consec = 1
-            best_seq = []
-            arr = vals_with_ace_low
-            for i in range(len(arr)):
-                if i == 0:
-                    consec = 1
-                    seq_start = arr[0]
-                    cur_seq = [arr[0]]
-                else:
-                    if arr[i] == arr[i-1]:
-                        continue
-                    if arr[i] == arr[i-1] + 1:
-                        consec += 1
-                        cur_seq.append(arr[i])
-                    else:
-                        consec = 1
-                        cur_seq = [arr[i]]
-                    if consec >= 5:
-                        best_seq = cur_seq[-5:]
-                        break
-            return best_seq  # may be empty
-
-        # Determine used Cards per hand type
-        if hand_name == "Straight Flush":
-            # find suit with >=5 then detect straight inside that suit
-            for suit, cards in by_suit.items():
-                if len(cards) >= 5:
-                    suit_ranks = [c.rank.value for c in cards]
-                    seq = find_straight_ranks(suit_ranks)
-                    if seq:
-                        # pick the Cards matching those ranks and suit
-                        for rv in seq:
-                            # map low-Ace (1) back to 14 if needed
-                            pick_val = 14 if rv == 1 and not any(c.rank.value == 1 for c in cards) else rv
-                            # find card with that rank value (prefer exact match)
-                            for c in cards:
-                                if c.rank.value == pick_val or (rv == 1 and c.rank.value == 14):
-                                    used_cards.append(c)
-                                    break
-                        break
-
-        elif hand_name == "Four of a Kind":
-            four_rank = None
-            for rv, lst in by_rank.items():
-                if len(lst) >= 4:
-                    if four_rank is None or rv > four_rank:
-                        four_rank = rv
-            if four_rank:
-                used_cards = by_rank[four_rank][:4]
-
-        elif hand_name == "Full House":
-            three_rank = None
-            pair_rank = None
-            for rv in sorted(by_rank.keys(), reverse=True):
-                if len(by_rank[rv]) >= 3 and three_rank is None:
-                    three_rank = rv
-            for rv in sorted(by_rank.keys(), reverse=True):
-                if rv != three_rank and len(by_rank[rv]) >= 2:
-                    pair_rank = rv
-                    break
-            if three_rank and pair_rank:
-                used_cards = by_rank[three_rank][:3] + by_rank[pair_rank][:2]
-            else:
-                # fallback: if multiple triples exist, use highest triple + next triple (as pair)
-                triples = [rv for rv, lst in by_rank.items() if len(lst) >= 3]
-                if len(triples) >= 2:
-                    t_sorted = sorted(triples, reverse=True)
-                    used_cards = by_rank[t_sorted[0]][:3] + by_rank[t_sorted[1]][:2]
-
-        elif hand_name == "Flush":
-            flush_suit = None
-            for suit, lst in by_suit.items():
-                if len(lst) >= 5:
-                    flush_suit = suit
-                    break
-            if flush_suit:
-                # pick top 5 highest rank Cards of that suit
-                cards_sorted = sorted(by_suit[flush_suit], key=lambda c: c.rank.value, reverse=True)
-                used_cards = cards_sorted[:5]
-
-        elif hand_name == "Straight":
-            seq = find_straight_ranks([c.rank.value for c in sel])
-            if seq:
-                # for each rank in seq pick one available card with that rank (prefer highest suit not important)
-                for rv in seq:
-                    pick_val = 14 if rv == 1 and any(c.rank.value == 14 for c in sel) else rv
-                    for c in sel:
-                        if c.rank.value == pick_val or (rv == 1 and c.rank.value == 14):
-                            used_cards.append(c)
-                            break
-
-        elif hand_name == "Three of a Kind":
-            three_rank = None
-            for rv in sorted(by_rank.keys(), reverse=True):
-                if len(by_rank[rv]) >= 3:
-                    three_rank = rv
-                    break
-            if three_rank:
-                used_cards = by_rank[three_rank][:3]
-
-        elif hand_name == "Two Pair":
-            pairs = [rv for rv, lst in by_rank.items() if len(lst) >= 2]
-            if pairs:
-                top_pairs = sorted(pairs, reverse=True)[:2]
-                for rv in top_pairs:
-                    used_cards += by_rank[rv][:2]
-
-        elif hand_name == "One Pair":
-            pair_rank = None
-            for rv in sorted(by_rank.keys(), reverse=True):
-                if len(by_rank[rv]) >= 2:
-                    pair_rank = rv
-                    break
-            if pair_rank:
-                used_cards = by_rank[pair_rank][:2]
-
-        else:  # High Card or fallback
-            # pick single highest card
-            best = max(sel, key=lambda c: c.rank.value)
-            used_cards = [best]
-
         # List of not-selected cards
-        held_cards = []
-        for c in list(self.hand):
-            if c not in sel:
-                held_cards.append(c)
-
-        # Sum chips of only the used Cards
-        card_chips_sum = 0
-        for c in used_cards:
-            card_chips_sum += c.chips
-            # Card scoring enhancements
-            match c.enhancement:
-                case Enhancement.BONUS:
-                    card_chips_sum += 30
-                case Enhancement.MULT:
-                    hand_mult += 4
-                case Enhancement.GLASS:
-                    hand_mult *= 2
-                    if random.randint(1, 4) == 1:
-                        self.destroy_sound.play()
-                        self.hand.remove(c)
-                case Enhancement.LUCKY:
-                    if random.randint(1, 5) == 1:
-                        hand_mult += 20
-                    if random.randint(1, 15) == 1:
-                        self.playerInfo.playerMoney += 20
-
-        # total chips for display = base hand value + sum of used Cards' chips
-        total_chips = hand_chips + card_chips_sum
+        sel = self.cardsSelectedList.toList()
+        held_cards = [c for c in self.hand if c not in self.cardsSelectedList]
 
-        # Hook 2
-        if self.on_post_play_hand:
-            self.on_post_play_hand()
+        # disabled random joker (boss rush only)
+        disabled = getattr(self, 'disabled_jokers', ())
+        owned = compile_jokers(n for n in entityRegistry.namesOf(self.playerJokers) if n not in disabled)
+        heat_level = self.playerInfo.heat_level if self.playerInfo.isHeatActive else 0
 
-        # ----------------- Apply Card Enhancements -----------------
+        # ----------------- Score the hand -----------------
         # DONE (BONUS): Apply the effects for every card enhancement that influences scoring
-        #   List of card enhancements that apply in scoring (above):
-        #   - Bonus Cards: Give an additional +30 chips when scored
-        #   - Mult Cards: Give an additional +4 Mult when scored
-        #   - Glass Cards: Give *2 mult when scored, with a 1 in 4 chance to self-destruct,
-        #       removing them from your deck for the rest of the run
-        #   - Lucky Cards: When scored, have a...
-        #       > 1 in 5 chance to give +20 mult when scored
-        #       > 1 in 15 chance to give $20
-        #       (Both effects are triggered independently and may occur simultaneously)
-        #   List of card enhancements that apply after scoring (below):
-        #   - Steel Cards: Give *1.5 mult when held in hand
-        #   - Gold Cards: Give $3 if held in hand AT THE END OF THE ROUND
-        #   List of card enhancements that definitely go somewhere else
-        #   - Wild Cards: Are considered of every suit simultaneously (HandEvaluator.py)
-        # -----------------------------------------------------------------
-
-        # ------------------ Effects for Held Cards ------------------------
-        for c in held_cards:
-            match c.enhancement:
-                case Enhancement.STEEL:
-                    hand_mult *= 1.5
-
-        # ------------------- Apply Joker effects -------------------
-        owned = set(self.playerJokers)
         # DONE (TASK 5.2): Let the Joker mayhem begin! Implement each Joker’s effect using the Joker table as reference.
-        #   Follow this structure for consistency:
-        #   if "joker card name" in owned:
-        #       # Apply that Joker’s effect
-        #       self.activated_jokers.add("joker card name")
-        #   The last line ensures the Joker is visibly active and its effects are properly applied.
-        # Variables for readability
+        #   Both live in Deck/HandScoring.py (score_hand), which only computes the result; it is applied below.
+        #   The joker effects themselves are registered in Deck/JokerEffects.py.
+        result = score_hand(sel, held_cards, owned, HAND_SCORES, heat_level, random,
+                            joker_count=len(self.playerJokers), hands_played=len(self.playedHandNameList))
+        hand_name = result.hand_name
+        self.playedHandName = hand_name
+        self.playedHandNameList.append(hand_name)
 
-        # disabled random joker (boss rush only)
-        owned = set(self.playerJokers)
-        if hasattr(self, 'disabled_jokers'):
-            owned = owned - set(self.disabled_jokers)
-
-        two = Rank.TWO
-        three = Rank.THREE
-        four = Rank.FOUR
-        five = Rank.FIVE
-        six = Rank.SIX
-        seven = Rank.SEVEN
-        eight = Rank.EIGHT
-        nine = Rank.NINE
-        ten = Rank.TEN
-        jack = Rank.JACK
-        queen = Rank.QUEEN
-        king = Rank.KING
-        ace = Rank.ACE
-        # Joker abilities are below
-
-        procrastinate = False
-        bonus_802 = False
-
-        if "The Joker" in owned:
-            hand_mult += 4
-            self.activated_jokers.add("The Joker")
-
-        if "Michael Myers" in owned:
-            random_mult = random.randint(0, 23)
-            hand_mult += random_mult
-            self.activated_jokers.add("Michael Myers")
-
-        if "Fibonacci" in owned:
-            funny_cards = [two, three, five, eight, ace]
-            used = False
-            for card in self.cardsSelectedList:
-                if card.rank in funny_cards:
-                    hand_mult += 8
-                    used = True
-            if used:
-                self.activated_jokers.add("Fibonacci")
-
-        if "Gauntlet" in owned:
-            total_chips += 250
-            self.playerInfo.amountOfHands -= 2
-            self.activated_jokers.add("Gauntlet")
-
-        if "Ogre" in owned:
-            joker_amount_mult = len(self.playerJokers) * 3
-            hand_mult += joker_amount_mult
-            self.activated_jokers.add("Ogre")
-
-        if "Straw Hat" in owned:
-            hands_played = max(0, len(self.playedHandNameList) - 1)
-            bonus = max(0, 100 - (5 * hands_played))
-            total_chips += bonus
-            self.activated_jokers.add("Straw Hat")
+        # ------------------ Apply the Result ------------------
+        for c in result.destroyed:
+            self.destroy_sound.play()
+            self.hand.remove(c)
+            self.deck.composition.remove(c)
+        self.playerInfo.playerMoney += result.money
+        self.playerInfo.amountOfHands += result.hands
+        self.activated_jokers.update(result.activated_jokers)
+        if "Straw Hat" in result.activated_jokers:
             print("ONE PIECEEEEEE, THE ONE PIECE IS REAAAALLLLL")
+        if heat_level:
+            print(f"HEAT BONUS: level {heat_level} applied!")
 
-        if "Hog Rider" in owned:
-            if hand_name == "Straight":
-                total_chips += 100
-            self.activated_jokers.add("Hog Rider")
-
-        if "? Block" in owned and len(self.cardsSelectedList) == 4:
-            total_chips += 4
-            self.activated_jokers.add("? Block")
-
-        if "Hogwarts" in owned:
-            used = False
-            for card in self.cardsSelectedList:
-                if card.rank == ace:
-                    hand_mult += 4
-                    total_chips += 20
-            if used:
-                self.activated_jokers.add("Hogwarts")
-
-        if "802" in owned:
-            bonus_802 = True
-            self.activated_jokers.add("802")
-
-
-        # -------------------  HEAT EFFECTS  -------------------
-        if self.playerInfo.isHeatActive:
-            heat_level = self.playerInfo.heat_level
-
-            if heat_level == 1:
-                hand_mult *= 2
-                print("HEAT BONUS: 2x multiplier applied!")
-
-            elif heat_level == 2:
-                hand_mult = int(hand_mult * 1.2)
-                total_chips += 40
-                print("HEAT BONUS: 1.2x multiplier + 40 chips!")
-
-            elif heat_level == 3:
-                hand_mult = int(hand_mult * 1.8)
-                total_chips += 80
-                print("HEAT BONUS: 1.8x multiplier + 80 chips!")
-        # ---------------------------------------------------------------
+        # Hook 2
+        if self.on_post_play_hand:
+            self.on_post_play_hand()
 
         # ------------------ Finalize Hand Scoring ------------------
         # commit modified player multiplier and chips
+        hand_mult = result.mult
         self.playerInfo.playerMultiplier = hand_mult
-        self.playerInfo.playerChips = total_chips
+        self.playerInfo.playerChips = result.chips
         self.playerInfo.curHandOfPlayer = hand_name
-        self.playerInfo.curHandText = self.playerInfo.textFont1.render(self.playerInfo.curHandOfPlayer, False, 'white')
+        self.playerInfo.curHandText = textCache.render(self.playerInfo.textFont1, self.playerInfo.curHandOfPlayer, False, 'white')
 
-        # compute amount that will be added to round when timer expires
-        added_to_round = total_chips * hand_mult
-        # Procrastination doubles the final hand's addition
-        if 'procrastinate' in locals() and procrastinate:
-            added_to_round *= 2
-
-        if bonus_802:
-            added_to_round *= 2
+        # amount that will be added to round when timer expires
+        added_to_round = result.score
         self.pending_round_add = added_to_round  # defer actual addition until timer ends
 
         # prepare on-screen feedback
-        self.playedHandTextSurface = self.playerInfo.textFont1.render(hand_name, True, 'yellow')
-        score_breakdown_text = f"(Hand: {hand_chips} + Cards: {card_chips_sum}) Chips | x{hand_mult} Mult -> +{added_to_round}"
-        self.scoreBreakdownTextSurface = self.playerInfo.textFont2.render(score_breakdown_text, True, 'white')
+        self.playedHandTextSurface = textCache.render(self.playerInfo.textFont1, hand_name, True, 'yellow')
+        score_breakdown_text = f"(Hand: {result.hand_chips} + Cards: {result.card_chips}) Chips | x{hand_mult} Mult -> +{added_to_round}"
+        self.scoreBreakdownTextSurface = textCache.render(self.playerInfo.textFont2, score_breakdown_text, True, 'white')
 
-        self.playHandStartTime = pygame.time.get_ticks()
+        self.playHandStartTime = frameClock.ticks()
         self.playHandActive = True
         self.cardsSelectedRect.clear()
 
@@ -1793,6 +1506,7 @@ class GameState(State):
         for card in destroyed_cards:
             if card in self.hand:
                 self.hand.remove(card)
+                self.deck.composition.remove(card)
                 cards_removed.append(f"{card.rank.name} of {card.suit.value}")
                 print(f"SUCCESS: Card {card.rank.name} of {card.suit.value} was destroyed and removed from hand")
             elif card in self.deck:
@@ -1802,9 +1516,7 @@ class GameState(State):
                 print(f"ERROR: Card {card.rank.name} of {card.suit.value} not found in hand or deck")
 
         for card in destroyed_cards:
-            if card in self.cardsSelectedList:
-                self.cardsSelectedList.remove(card)
-                #print(f"DEBUG: Removed {card.rank.name} of {card.suit.value} from cardsSelectedList")
+            self.cardsSelectedList.discard(card)
 
         self.updateCards(400, 520, self.cards, self.hand, scale=1.2)
 
@@ -1817,17 +1529,15 @@ class GameState(State):
     def updateCardImages(self):
         #print("DEBUG: Force updating all card images")
 
-        card_images = State.deckManager.load_card_images(self.playerInfo.levelManager.next_unfinished_sublevel(), self.enhanced_cards)
+        subLevel = self.playerInfo.levelManager.next_unfinished_sublevel()
 
         for card in self.hand:
-            key = (card.suit, card.rank)
-            if key in card_images:
-                print(card_images[key])
-                card.image = card_images[key][card.enhancement.value]
+            card.image = State.deckManager.getCardImage(card.suit, card.rank, card.enhancement, subLevel)
+            if card.image:
                 original_w, original_h = card.image.get_size()
                 scaled_w = int(original_w * 1.2)
                 scaled_h = int(original_h * 1.2)
-                card.scaled_image = pygame.transform.scale(card.image, (scaled_w, scaled_h))
+                card.scaledSize = (scaled_w, scaled_h)
 
         self.cards.clear()
         self.updateCards(400, 520, self.cards, self.hand, scale=1.2)
@@ -1838,10 +1548,10 @@ class GameState(State):
         """Handle Judgment tarot - create random joker"""
         # Check if player has room for more jokers (max 5)
         if len(self.playerJokers) < self.max_jokers:
-            available_jokers = [j for j in self.jokerDeck if j.name not in self.playerJokers]
+            available_jokers = [j for j in self.jokerDeck if j.id not in self.playerJokers]
             if available_jokers:
                 new_joker = random.choice(available_jokers)
-                self.playerJokers.append(new_joker.name)
+                self.playerJokers.append(new_joker.id)
                 # Update PlayerInfo display
                 self.playerInfo.curAmountJoker = str(len(self.playerJokers))
                 print(f"Judgment created: {new_joker.name}")
@@ -1854,14 +1564,14 @@ class GameState(State):
         available_slots = 5 - len(self.playerConsumables)
 
         if available_slots > 0:
-            available_tarots = [t for t in TAROTS.values() if t.name not in self.playerConsumables and t.name != "The Emperor"]
+            available_tarots = [t for t in TAROTS.values() if t.id not in self.playerConsumables and t.name != "The Emperor"]
             num_to_create = min(available_slots, len(available_tarots), count)
 
             created_tarots = []
             for _ in range(num_to_create):
                 if available_tarots:
                     new_tarot = random.choice(available_tarots)
-                    self.playerConsumables.append(new_tarot.name)
+                    self.playerConsumables.append(new_tarot.id)
                     created_tarots.append(new_tarot.name)
                     available_tarots.remove(new_tarot)
                     print(f"The Emperor created: {new_tarot.name}")
@@ -1877,8 +1587,9 @@ class GameState(State):
         if len(self.playerConsumables) < self.max_consumables:
             for card_name in reversed(self.card_usage_history):
                 if card_name != "The Fool" and (card_name in TAROTS or card_name in PLANETS):
-                    if card_name not in self.playerConsumables:
-                        self.playerConsumables.append(card_name)
+                    card_id = entityRegistry.idOf(card_name)
+                    if card_id not in self.playerConsumables:
+                        self.playerConsumables.append(card_id)
                         print(f"The Fool recreated: {card_name}")
                         return
             print("The Fool: No recent usable card found in history")
@@ -1889,7 +1600,7 @@ class GameState(State):
         # Back ground, going change ts later
         pygame.draw.rect(self.screen, (30, 30, 50), self.dialogBoxRect, border_radius=12)
         pygame.draw.rect(self.screen, (80, 80, 100), self.dialogBoxRect, 3, border_radius=12)
-        self.screen.blit(self.tvOverlay, (0, 0))
+        renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
         mouse_pos = pygame.mouse.get_pos()
 
@@ -1916,45 +1627,45 @@ class GameState(State):
         # Determine question text based on situation
         if is_boss_rush:
             if boss_rush_revive_used:
-                question_text = self.playerInfo.textFont2.render("You're cooked... Better luck next time!", True,
+                question_text = textCache.render(self.playerInfo.textFont2, "You're cooked... Better luck next time!", True,
                                                                  (255, 150, 150))
-                souls_text = self.playerInfo.textFont2.render("(Skill issue)", True,
+                souls_text = textCache.render(self.playerInfo.textFont2, "(Skill issue)", True,
                                                               (200, 150, 150))
             elif souls >= revive_cost:
-                question_text = self.playerInfo.textFont2.render(f"BOSS RUSH Revive for {revive_cost} Souls?", True,
+                question_text = textCache.render(self.playerInfo.textFont2, f"BOSS RUSH Revive for {revive_cost} Souls?", True,
                                                                  (255, 215, 0))
-                souls_text = self.playerInfo.textFont2.render(f"(Can only revive once in Boss Rush!)", True,
+                souls_text = textCache.render(self.playerInfo.textFont2, f"(Can only revive once in Boss Rush!)", True,
                                                               (255, 100, 100))
             else:
-                question_text = self.playerInfo.textFont2.render("Not enough souls...", True,
+                question_text = textCache.render(self.playerInfo.textFont2, "Not enough souls...", True,
                                                                  (255, 150, 150))
-                souls_text = self.playerInfo.textFont2.render(f"Try lasting a little longer?", True,
+                souls_text = textCache.render(self.playerInfo.textFont2, f"Try lasting a little longer?", True,
                                                               (200, 150, 150))
         else:
             # Normal game
             if has_revived:
-                question_text = self.playerInfo.textFont2.render("Already revived this blind!", True, (255, 150, 150))
-                souls_text = self.playerInfo.textFont2.render("One revive per blind allowed", True, (200, 150, 150))
+                question_text = textCache.render(self.playerInfo.textFont2, "Already revived this blind!", True, (255, 150, 150))
+                souls_text = textCache.render(self.playerInfo.textFont2, "One revive per blind allowed", True, (200, 150, 150))
             elif souls >= revive_cost:
-                question_text = self.playerInfo.textFont2.render(f"Revive for {revive_cost} Souls?", True,
+                question_text = textCache.render(self.playerInfo.textFont2, f"Revive for {revive_cost} Souls?", True,
                                                                  (255, 255, 255))
-                souls_text = self.playerInfo.textFont2.render(f"You have {souls} souls", True, (200, 200, 100))
+                souls_text = textCache.render(self.playerInfo.textFont2, f"You have {souls} souls", True, (200, 200, 100))
             else:
-                question_text = self.playerInfo.textFont2.render("Not enough souls to revive", True, (255, 150, 150))
-                souls_text = self.playerInfo.textFont2.render(f"Need {revive_cost}, you have {souls}", True,
+                question_text = textCache.render(self.playerInfo.textFont2, "Not enough souls to revive", True, (255, 150, 150))
+                souls_text = textCache.render(self.playerInfo.textFont2, f"Need {revive_cost}, you have {souls}", True,
                                                               (200, 150, 150))
         # Draw YES button only if player can revive
         if can_revive:
             yes_color = (0, 200, 0) if self.yesButtonRect.collidepoint(mouse_pos) else (0, 100, 0)
             pygame.draw.rect(self.screen, yes_color, self.yesButtonRect, border_radius=8)
-            yes_text = self.playerInfo.textFont2.render("YES", True, (255, 255, 255))
+            yes_text = textCache.render(self.playerInfo.textFont2, "YES", True, (255, 255, 255))
             self.screen.blit(yes_text, (self.yesButtonRect.centerx - yes_text.get_width() // 2,
                                         self.yesButtonRect.centery - yes_text.get_height() // 2))
 
         # Draw NO button (always visible)
         no_color = (200, 0, 0) if self.noButtonRect.collidepoint(mouse_pos) else (150, 0, 0)
         pygame.draw.rect(self.screen, no_color, self.noButtonRect, border_radius=8)
-        no_text = self.playerInfo.textFont2.render("NO", True, (255, 255, 255))
+        no_text = textCache.render(self.playerInfo.textFont2, "NO", True, (255, 255, 255))
         self.screen.blit(no_text, (self.noButtonRect.centerx - no_text.get_width() // 2,
                                    self.noButtonRect.centery - no_text.get_height() // 2))
 
@@ -1965,6 +1676,7 @@ class GameState(State):
                                       self.dialogBoxRect.y + 70))
 
         pygame.display.update()
+        dirtyRects.invalidate()
 
     def handleRevive(self):
         souls = getattr(self.playerInfo, 'souls', 0)
@@ -2020,6 +1732,7 @@ class GameState(State):
 
             self.draw()
             pygame.display.update()
+            dirtyRects.invalidate()
 
             print("DEBUG: Resuming music after revive...")
 
@@ -2049,13 +1762,13 @@ class GameState(State):
             print(f"HEAT ACTIVATED: Level {self.playerInfo.heat_level}!")
 
             if self.playerInfo.heat_level == 3:
-                self.playerInfo.heatDuration = 600
+                self.playerInfo.heatDuration = 10
                 print("HEAT ACTIVATED: Unlimited hands and discards for 10 seconds!")
             elif self.playerInfo.heat_level == 2:
-                self.playerInfo.heatDuration = 300
+                self.playerInfo.heatDuration = 5
                 print("HEAT ACTIVATED: Unlimited discards for 5 seconds!")
             elif self.playerInfo.heat_level == 1:
-                self.playerInfo.heatDuration = 300
+                self.playerInfo.heatDuration = 5
                 print("HEAT ACTIVATED: 2x Multiplier for 5 seconds!")
 
             self.playerInfo.heat = 0
@@ -2069,55 +1782,82 @@ class GameState(State):
             self.show_heat_level_up_effect()
 
     def show_heat_level_up_effect(self):
-        for alpha in range(0, 100, 20):
-            flash = pygame.Surface((1300, 750), pygame.SRCALPHA)
-            flash.fill((255, 100, 100, alpha))
-            self.screen.blit(flash, (0, 0))
-            pygame.display.update()
-            pygame.time.wait(50)
-
-        # Show level up text
-        level_text = self.playerInfo.textFont1.render(f"HEAT LEVEL {self.playerInfo.heat_level}!", True, (255, 255, 0))
-        text_rect = level_text.get_rect(center=(650, 375))
-
-        # Background
-        bg_rect = text_rect.inflate(20, 10)
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(bg_surface, (0, 0, 0, 200), bg_surface.get_rect(), border_radius=8)
-
-        self.screen.blit(bg_surface, bg_rect)
-        self.screen.blit(level_text, text_rect)
-        pygame.display.update()
-        pygame.time.wait(1000)
-
-
-    # DONE (TASK 4) - The function should remove one selected card from the player's hand at a time, calling itself
-    #   again after each removal until no selected cards remain (base case). Once all cards have been
-    #   discarded, draw new cards to refill the hand back to 8 cards. Use helper functions but AVOID using
-    #   iterations (no for/while loops) — the recursion itself must handle repetition. After the
-    #   recursion finishes, reset card selections, clear any display text or tracking lists, and
-    #   update the visual layout of the player's hand.
+        # Flash builds up, then the level up text stays for a second
+        level_text = textCache.render(self.playerInfo.textFont1, f"HEAT LEVEL {self.playerInfo.heat_level}!", True, (255, 255, 0))
+        self.animator.play(Timeline("heatLevelUp")
+                           .tween(0.25, lambda a: self.setFlash((255, 100, 100), a), 0, 80, easeOut)
+                           .call(lambda: self.showBanner(level_text, (650, 375)))
+                           .wait(1.0)
+                           .call(self.clearEffects))
+
+    # ---------- Timed effects ----------
+    def setRedAlpha(self, alpha: float):
+        self.redAlpha = int(alpha)
+
+    def showGameOverDialog(self):
+        self.showReviveOption = True
+
+    def setFlash(self, color, alpha: float):
+        self.effectFlash = (*color, int(alpha))
+
+    def showBanner(self, text: pygame.Surface, center):
+        self.effectBanner = (text, center)
+
+    def clearEffects(self):
+        if self.effectFlash:
+            dirtyRects.invalidate()  # the flash covered the whole screen, repaint all of it once
+        self.effectFlash = None
+        self.effectBanner = None
+
+    def drawEffects(self):
+        if self.effectFlash:
+            renderQuality.drawTint(self.screen, self.effectFlash[:3], self.effectFlash[3])
+            dirtyRects.invalidate()
+        if self.effectBanner:
+            text, center = self.effectBanner
+            text_rect = text.get_rect(center=center)
+            bg_rect = text_rect.inflate(20, 10)
+            bg_surface = surfacePool.get("effectBanner", bg_rect.size)
+            pygame.draw.rect(bg_surface, (0, 0, 0, 200), bg_surface.get_rect(), border_radius=8)
+            dirtyRects.add(self.screen.blit(bg_surface, bg_rect))
+            self.screen.blit(text, text_rect)
+
+
+    # DONE (TASK 4) - Discard the selected cards, refill the hand back to 8 cards, then reset selections,
+    #   clear the display text / tracking lists and update the visual layout of the player's hand.
+    #   (This used to recurse once per card; it is now one transaction, see applyHandChanges)
     def discardCards(self, removeFromHand: bool):
-        if removeFromHand:  # Recursive cases
-            if len(self.cardsSelectedList) > 0:  # If it isn't an empty hand, keep removing a card from the hand
-                card_to_remove = self.cardsSelectedList.pop()
-                card_to_remove.isSelected = False
-                if card_to_remove in self.hand:
-                    self.hand.remove(card_to_remove)
-                    self.used.append(card_to_remove)
-                    self.discardCards(removeFromHand=True)
-
-            self.discardCards(False) # If the hand is now empty, go into the next part of the loop
-
-        if (len(self.hand) < 8) and (len(self.deck) > 0):  # Alternate recursive case: fill the deck back up
-            new_card = self.deck.pop()
-            self.hand.append(new_card)
-            self.discardCards(removeFromHand=False)
+        discard = []
+        if removeFromHand:
+            # Selected cards leave in the same order the old recursion popped them (last selected first)
+            discard = self.cardsSelectedList[::-1]
+            self.cardsSelectedList.clear()
+        self.applyHandChanges(discard, HAND_SIZE)
+
+    def applyHandChanges(self, discard=(), drawUpTo: int = HAND_SIZE) -> list:
+        """
+        Hand mutation transaction: moves every card of 'discard' that is in the hand to the used pile,
+        draws from the deck until the hand has 'drawUpTo' cards, then sorts and lays the hand out once.
+        Returns the cards that were drawn.
+        """
+        inHand = set(self.hand)
+        discarded = []
+        for card in discard:
+            self.cardsSelectedList.discard(card)
+            if card in inHand:
+                inHand.discard(card)
+                discarded.append(card)
+        if discarded:
+            self.hand = [card for card in self.hand if card in inHand]
+            self.used.extend(discarded)
+            self.deck.composition.moveAll(discarded, "used")
+
+        drawn = self.deck.drawCards(drawUpTo - len(self.hand))
+        self.insertDrawnCards(drawn)
 
-        # Base case
         self.cardsSelectedRect = {}
         self.playedHandNameList = ['']
-        self.SortCards(self.sorting)
         self.updateCards(400, 520, self.cards, self.hand, scale=1.2)
+        return drawn
 
 
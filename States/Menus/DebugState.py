@@ -1,6 +1,10 @@
 import pygame
 from States.Core.StateClass import State
 from Levels.SubLevel import Blind
+from Assets.AssetManager import assetManager
+from Assets.TextCache import textCache
+from Engine.RenderQuality import renderQuality
+from Engine.SurfacePool import surfacePool
 
 
 #---------- Debug Overlay State ----------
@@ -11,10 +15,10 @@ class DebugState(State):
         self.visible = False  # Whether the debug UI is shown
 
         # === Fonts and overlay setup ===
-        self.font = pygame.font.Font("graphics/Text/m6x11.ttf", 24)
-        self.smallFont = pygame.font.Font("graphics/Text/m6x11.ttf", 18)
+        self.font = assetManager.getFont("graphics/Text/m6x11.ttf", 24)
+        self.smallFont = assetManager.getFont("graphics/Text/m6x11.ttf", 18)
 
-        self.bg_surface = pygame.Surface((400, 250), pygame.SRCALPHA)
+        self.bg_surface = pygame.Surface((400, 350), pygame.SRCALPHA)
         self.bg_surface.fill((10, 10, 10, 200))  # semi-transparent dark background
 
         # === Menu Text ===
@@ -28,6 +32,10 @@ class DebugState(State):
             "Player money:",
             "Current level:",
             "Time since start:",
+            "Asset cache:",
+            "Text cache:",
+            "Render quality:",
+            "Surface allocs:",
         ]
 
     # ==============================
@@ -56,7 +64,7 @@ class DebugState(State):
         y = overlay_y + 20
         for line in self.lines[:6]:  # draw menu header & controls
             color = (255, 255, 100) if "===" in line else (255, 255, 255)
-            txt = self.smallFont.render(line, True, color)
+            txt = textCache.render(self.smallFont, line, True, color)
             screen.blit(txt, (overlay_x + 20, y))
             y += 25
 
@@ -68,8 +76,8 @@ class DebugState(State):
         money = 0
         if self.game_state and hasattr(self.game_state, "playerInfo"):
             money = getattr(self.game_state.playerInfo, "playerMoney", 0)
-        txt_money_label = self.smallFont.render("Player money:", True, (255, 255, 255))
-        txt_money_value = self.smallFont.render(f"{money}$", True, (0, 255, 0))
+        txt_money_label = textCache.render(self.smallFont, "Player money:", True, (255, 255, 255))
+        txt_money_value = textCache.render(self.smallFont, f"{money}$", True, (0, 255, 0))
         screen.blit(txt_money_label, (label_x, y))
         screen.blit(txt_money_value, (value_x, y))
         y += 25
@@ -90,18 +98,53 @@ class DebugState(State):
                         current_level = subLevel.blind.name
                         if current_level is not None:
                             current_level = current_level.capitalize()
-        txt_level_label = self.smallFont.render("Current level:", True, (255, 255, 255))
-        txt_level_value = self.smallFont.render(str(current_level), True, (180, 180, 255))
+        txt_level_label = textCache.render(self.smallFont, "Current level:", True, (255, 255, 255))
+        txt_level_value = textCache.render(self.smallFont, str(current_level), True, (180, 180, 255))
         screen.blit(txt_level_label, (label_x, y))
         screen.blit(txt_level_value, (value_x, y))
         y += 25
 
         # === Time since start ===
         seconds = int(pygame.time.get_ticks() / 1000)
-        txt_time_label = self.smallFont.render("Time since start:", True, (255, 255, 255))
-        txt_time_value = self.smallFont.render(f"{seconds}s", True, (180, 180, 255))
+        txt_time_label = textCache.render(self.smallFont, "Time since start:", True, (255, 255, 255))
+        txt_time_value = textCache.render(self.smallFont, f"{seconds}s", True, (180, 180, 255))
         screen.blit(txt_time_label, (label_x, y))
         screen.blit(txt_time_value, (value_x, y))
+        y += 25
+
+        # === Asset cache (hits / disk loads / live fonts) ===
+        stats = assetManager.stats()
+        txt_assets_label = textCache.render(self.smallFont, "Asset cache:", True, (255, 255, 255))
+        txt_assets_value = textCache.render(self.smallFont, f"{stats['hits']}h / {stats['diskLoads']}d / {assetManager.liveFonts()} fonts", True, (180, 180, 255))
+        screen.blit(txt_assets_label, (label_x, y))
+        screen.blit(txt_assets_value, (value_x, y))
+        y += 25
+
+        # === Text cache (hit rate / surfaces kept) ===
+        textStats = textCache.stats()
+        txt_text_label = textCache.render(self.smallFont, "Text cache:", True, (255, 255, 255))
+        txt_text_value = textCache.render(self.smallFont, f"{textStats['hitRate']:.0%} hit / {textStats['entries']}", True, (180, 180, 255))
+        screen.blit(txt_text_label, (label_x, y))
+        screen.blit(txt_text_value, (value_x, y))
+        y += 25
+
+        # === Render quality (current level / adaptive frame time and level changes so far) ===
+        quality = renderQuality
+        qualityText = quality.level
+        if quality.adaptive:
+            qualityText = f"{quality.level} ({quality.avgFrameMs:.1f} ms, {quality.changes} changes)"
+        txt_quality_label = textCache.render(self.smallFont, "Render quality:", True, (255, 255, 255))
+        txt_quality_value = textCache.render(self.smallFont, qualityText, True, (180, 180, 255))
+        screen.blit(txt_quality_label, (label_x, y))
+        screen.blit(txt_quality_value, (value_x, y))
+        y += 25
+
+        # === Surface pool (surfaces created last frame, 0 once warmed up / pooled) ===
+        pool = surfacePool
+        txt_pool_label = textCache.render(self.smallFont, "Surface allocs:", True, (255, 255, 255))
+        txt_pool_value = textCache.render(self.smallFont, f"{pool.lastFrameAllocations}/frame / {len(pool.surfaces)}", True, (180, 180, 255))
+        screen.blit(txt_pool_label, (label_x, y))
+        screen.blit(txt_pool_value, (value_x, y))
 
     # ==============================
     # Input Handling
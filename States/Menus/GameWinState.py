@@ -1,13 +1,17 @@
 import pygame
 from States.Core.StateClass import State
+from Assets.AssetManager import assetManager
+from Assets.TextCache import textCache
+from Engine.RenderQuality import renderQuality
+from Engine.SurfacePool import surfacePool
 
 
 class GameWinState(State):
     def __init__(self, nextState: str = ""):
         super().__init__(nextState)
         # Fonts
-        self.title_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 48)
-        self.btn_font = pygame.font.Font('Graphics/Text/m6x11.ttf', 28)
+        self.title_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 48)
+        self.btn_font = assetManager.getFont('Graphics/Text/m6x11.ttf', 28)
 
         # Buttons (centered)
         self.restart_rect = pygame.Rect(0, 0, 240, 64)
@@ -18,11 +22,9 @@ class GameWinState(State):
         self.quit_rect.center = (self.screen_center[0], self.screen_center[1] + 110)
 
         # Background image (optional)
-        self.bg = pygame.image.load('Graphics/Backgrounds/gameplayBG.jpg')
-        self.bg = pygame.transform.scale(self.bg, (1300, 750))
+        self.bg = assetManager.getScaledImage('Graphics/Backgrounds/gameplayBG.jpg', (1300, 750), alpha=False)
         # TV overlay (CRT filter)
-        self.tvOverlay = pygame.image.load('Graphics/Backgrounds/CRT.png').convert_alpha()
-        self.tvOverlay = pygame.transform.scale(self.tvOverlay, (1300, 750))
+        self.tvOverlay = assetManager.getScaledImage('Graphics/Backgrounds/CRT.png', (1300, 750))
 
     def update(self):
         # nothing to update statically here
@@ -42,19 +44,17 @@ class GameWinState(State):
         panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
 
         # Shadow
-        shadow = pygame.Surface((panel_w + 8, panel_h + 8), pygame.SRCALPHA)
-        shadow.fill((0, 0, 0, 180))
+        shadow = surfacePool.get("winShadow", (panel_w + 8, panel_h + 8), fill=(0, 0, 0, 180))
         self.screen.blit(shadow, (panel_x + 6, panel_y + 6))
 
         # Panel background and border
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        panel_surf.fill((18, 18, 28, 240))
+        panel_surf = surfacePool.get("winPanel", (panel_w, panel_h), fill=(18, 18, 28, 240))
         pygame.draw.rect(panel_surf, (255, 215, 0), pygame.Rect(0, 0, panel_w, 6))
         pygame.draw.rect(panel_surf, (100, 100, 100), panel_surf.get_rect(), 2, border_radius=8)
         self.screen.blit(panel_surf, (panel_x, panel_y))
 
         # Title inside panel
-        title_surf = self.title_font.render('YOU WIN!', True, (255, 215, 0))
+        title_surf = textCache.render(self.title_font, 'YOU WIN!', True, (255, 215, 0))
         title_rect = title_surf.get_rect(center=(self.screen_center[0], panel_y + 56))
         self.screen.blit(title_surf, title_rect)
 
@@ -69,7 +69,7 @@ class GameWinState(State):
             pygame.draw.rect(self.screen, (30, 200, 30), self.restart_rect, border_radius=8)
         else:
             pygame.draw.rect(self.screen, (20, 160, 20), self.restart_rect, border_radius=8)
-        restart_label = self.btn_font.render('Restart', True, 'white')
+        restart_label = textCache.render(self.btn_font, 'Restart', True, 'white')
         self.screen.blit(restart_label, restart_label.get_rect(center=self.restart_rect.center))
 
         # Quit button (calls exit when clicked)
@@ -77,12 +77,12 @@ class GameWinState(State):
             pygame.draw.rect(self.screen, (200, 30, 30), self.quit_rect, border_radius=8)
         else:
             pygame.draw.rect(self.screen, (160, 20, 20), self.quit_rect, border_radius=8)
-        quit_label = self.btn_font.render('Quit', True, 'white')
+        quit_label = textCache.render(self.btn_font, 'Quit', True, 'white')
         self.screen.blit(quit_label, quit_label.get_rect(center=self.quit_rect.center))
 
         # TV overlay filter (on top)
         if self.tvOverlay:
-            self.screen.blit(self.tvOverlay, (0, 0))
+            renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
     def userInput(self, events):
         if events.type == pygame.QUIT:
@@ -2,6 +2,11 @@ import pygame
 from Deck.DeckManager import DeckManager
 from States.Core.StateClass import State
 from States.Core.PlayerInfo import PlayerInfo
+from Assets.AssetManager import assetManager
+from Assets.ScaledSurfaceCache import scaledSurfaces
+from Assets.TextCache import textCache
+from Engine.RenderQuality import renderQuality
+from Engine.SurfacePool import surfacePool
 
 
 class LevelSelectState(State):
@@ -14,14 +19,13 @@ class LevelSelectState(State):
         self.deckManager = deckManager # DeckManager object
 
         # -------------------Load CRT Overlay-------------------------------------
-        self.tvOverlay = pygame.image.load('Graphics/Backgrounds/CRT.png').convert_alpha()
-        self.tvOverlay = pygame.transform.scale(self.tvOverlay, (1300, 750))
+        self.tvOverlay = assetManager.getScaledImage('Graphics/Backgrounds/CRT.png', (1300, 750))
 
         # -------------------------Fonts used in the UI---------------------------
-        self.font = pygame.font.Font('Graphics/Text/m6x11.ttf', 30)
-        self.font2 = pygame.font.Font('Graphics/Text/m6x11.ttf', 22)
-        self.font3 = pygame.font.Font('Graphics/Text/m6x11.ttf', 60)
-        self.font4 = pygame.font.Font('Graphics/Text/m6x11.ttf', 40)
+        self.font = assetManager.getFont('Graphics/Text/m6x11.ttf', 30)
+        self.font2 = assetManager.getFont('Graphics/Text/m6x11.ttf', 22)
+        self.font3 = assetManager.getFont('Graphics/Text/m6x11.ttf', 60)
+        self.font4 = assetManager.getFont('Graphics/Text/m6x11.ttf', 40)
 
         #----------- Layout for multiple sublevel Cards ---------------------------
         self.cardWidth = 280
@@ -46,16 +50,14 @@ class LevelSelectState(State):
             self.screen.blit(self.bg, (0, 0))
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((1300, 750), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        renderQuality.drawTint(self.screen, (0, 0, 0), 180)
 
         # Draw level Cards and continue button
         self.drawLevelCards()
         self.drawContinueButton()
 
         # CRT overlay effect
-        self.screen.blit(self.tvOverlay, (0, 0))
+        renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
     """This function handles user input for the LevelSelectState,
     when the player press CONTINUE button, it updates the player's stats.
@@ -158,7 +160,7 @@ class LevelSelectState(State):
             cardX = self.cardsStartX + i * (self.cardWidth + self.cardSpacing)
             cardY = self.cardsStartY
 
-            cardSurface = pygame.Surface((self.cardWidth, self.cardHeight), pygame.SRCALPHA)
+            cardSurface = surfacePool.get("levelCard", (self.cardWidth, self.cardHeight))
 
             cardRect = pygame.Rect(cardX, cardY, self.cardWidth, self.cardHeight)
             self.sublevelCards.append({
@@ -197,21 +199,21 @@ class LevelSelectState(State):
 
             # Header Text
             if sublevel.bossLevel:
-                headerText = self.font.render(f"BOSS: {sublevel.bossLevel.upper()}", False, (255, 255, 255))
+                headerText = textCache.render(self.font, f"BOSS: {sublevel.bossLevel.upper()}", False, (255, 255, 255))
             else:
-                headerText = self.font.render(f"{sublevel.blind.name} BLIND", False, (255, 255, 255))
+                headerText = textCache.render(self.font, f"{sublevel.blind.name} BLIND", False, (255, 255, 255))
             headerTextRect = headerText.get_rect(center=headerRect.center)
             cardSurface.blit(headerText, headerTextRect)
 
             # Blind image
             if sublevel.image:
-                scaledImage = pygame.transform.scale(sublevel.image, (140, 120))
+                scaledImage = scaledSurfaces.get(sublevel.image, (140, 120))
                 imageRect = scaledImage.get_rect(center=blindImageRect.center)
                 cardSurface.blit(scaledImage, imageRect)
 
             # Score requirement
-            scoreLabel = self.font2.render("Score at least", False, (200, 200, 200))
-            scoreValue = self.font3.render(str(sublevel.score), False, (255, 0, 0))
+            scoreLabel = textCache.render(self.font2, "Score at least", False, (200, 200, 200))
+            scoreValue = textCache.render(self.font3, str(sublevel.score), False, (255, 0, 0))
             scoreLabelRect = scoreLabel.get_rect(centerx=scoreRect.centerx, top=scoreRect.top + 12)
             scoreValueRect = scoreValue.get_rect(centerx=scoreRect.centerx, top=scoreRect.top + 40)
             cardSurface.blit(scoreLabel, scoreLabelRect)
@@ -226,39 +228,36 @@ class LevelSelectState(State):
 
             if sublevel.finished:
                 # COMPLETED
-                statusText = self.font4.render("COMPLETED", False, (100, 255, 100))
+                statusText = textCache.render(self.font4, "COMPLETED", False, (100, 255, 100))
                 statusTextRect = statusText.get_rect(center=statusRect.center)
                 cardSurface.blit(statusText, statusTextRect)
 
-                darkOverlay = pygame.Surface((self.cardWidth, self.cardHeight), pygame.SRCALPHA)
-                darkOverlay.fill((0, 0, 0, 160))
+                darkOverlay = surfacePool.get("levelCardShade", (self.cardWidth, self.cardHeight), fill=(0, 0, 0, 160))
                 cardSurface.blit(darkOverlay, (0, 0))
             elif nextUnfinished and nextUnfinished == sublevel:
                 # ACTIVE
-                statusText = self.font4.render("ACTIVE", False, (255, 200, 100))
+                statusText = textCache.render(self.font4, "ACTIVE", False, (255, 200, 100))
                 statusTextRect = statusText.get_rect(center=statusRect.center)
                 cardSurface.blit(statusText, statusTextRect)
             else:
                 # LOCKED
-                statusText = self.font4.render("LOCKED", False, (150, 150, 150))
+                statusText = textCache.render(self.font4, "LOCKED", False, (150, 150, 150))
                 statusTextRect = statusText.get_rect(center=statusRect.center)
                 cardSurface.blit(statusText, statusTextRect)
 
-                lockOverlay = pygame.Surface((self.cardWidth, self.cardHeight), pygame.SRCALPHA)
-                lockOverlay.fill((0, 0, 0, 80))
+                lockOverlay = surfacePool.get("levelCardShade", (self.cardWidth, self.cardHeight), fill=(0, 0, 0, 80))
                 cardSurface.blit(lockOverlay, (0, 0))
 
             # Boss ability description
             if ability_text:
                 abilityFont = self.font
-                abilitySurf = abilityFont.render(ability_text, False, (245, 245, 245))
+                abilitySurf = textCache.render(abilityFont, ability_text, False, (245, 245, 245))
                 # place just below the status rect
                 abilityRect = abilitySurf.get_rect(centerx=scoreRect.centerx, top=statusRect.top + statusRect.height + 8)
                 pad_x, pad_y = 12, 8
                 bg_rect = abilityRect.inflate(pad_x * 2, pad_y * 2)
-                panel = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
                 panel_color = (header_color[0], header_color[1], header_color[2], 200)
-                panel.fill(panel_color)
+                panel = surfacePool.get("levelCardAbility", bg_rect.size, fill=panel_color)
                 cardSurface.blit(panel, bg_rect.topleft)
                 cardSurface.blit(abilitySurf, abilityRect)
 
@@ -288,6 +287,6 @@ class LevelSelectState(State):
 
         pygame.draw.rect(self.screen, buttonColor, self.continueButtonRect, border_radius=10)
 
-        continueText = self.font.render("CONTINUE", False, (255, 255, 255))
+        continueText = textCache.render(self.font, "CONTINUE", False, (255, 255, 255))
         continueTextRect = continueText.get_rect(center=self.continueButtonRect.center)
         self.screen.blit(continueText, continueTextRect)
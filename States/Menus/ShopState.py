@@ -6,6 +6,10 @@ from Cards.Tarots import TAROTS, TarotCard
 from Cards.Jokers import Jokers
 from States.GameState import HAND_SCORES
 from States.Core.StateClass import State
+from Assets.AssetManager import assetManager
+from Assets.ScaledSurfaceCache import scaledSurfaces
+from Assets.TextCache import textCache
+from Engine.RenderQuality import renderQuality
 
 class ShopState(State):
 
@@ -25,10 +29,10 @@ class ShopState(State):
         self.background = State.screenshot
 
         # --- CRT overlay ---
-        self.tvOverlay_raw = pygame.image.load('Graphics/backgrounds/CRT.png').convert_alpha()
-        self.buy_sound = pygame.mixer.Sound("Graphics/Sounds/buySFX.wav")
+        self.buy_sound = assetManager.getSound("Graphics/Sounds/buySFX.wav")
         self.buy_sound.set_volume(1.0)
-        self.tvOverlay = pygame.transform.scale(self.tvOverlay_raw, (1300, 750))
+        # copy: the shop changes the overlay alpha and the cached one is shared with the other states
+        self.tvOverlay = assetManager.getScaledImage('Graphics/backgrounds/CRT.png', (1300, 750)).copy()
         self.tvOverlay.set_alpha(160)
 
         # --- main shop surface ---
@@ -42,8 +46,8 @@ class ShopState(State):
         self.rerollbuttondisp = pygame.Surface((200, 70), pygame.SRCALPHA)
         self.rerollbuttondisp_rect = pygame.Rect(25, 135, 200, 70)
 
-        self.shopFont = pygame.font.Font('graphics/text/m6x11.ttf', 30)
-        self.smallFont = pygame.font.Font('graphics/text/m6x11.ttf', 20)
+        self.shopFont = assetManager.getFont('graphics/text/m6x11.ttf', 30)
+        self.smallFont = assetManager.getFont('graphics/text/m6x11.ttf', 20)
         # Position where self.shopSurface is blitted to the main screen
         self.shopPos = (350, 250)
 
@@ -95,7 +99,7 @@ class ShopState(State):
         for file in os.listdir(folder):
             if file.startswith("Planet") and file.endswith(".png"):
                 name = os.path.splitext(file)[0]
-                image = pygame.image.load(os.path.join(folder, file)).convert_alpha()
+                image = assetManager.getImage(os.path.join(folder, file))
                 key = name[6:]
                 # Attach image back into PLANETS and3 keep reference
                 if key in PLANETS:
@@ -112,7 +116,7 @@ class ShopState(State):
         for file in os.listdir(folder):
             if file.startswith("Tarot") and file.endswith(".png"):
                 name = os.path.splitext(file)[0]
-                image = pygame.image.load(os.path.join(folder, file)).convert_alpha()
+                image = assetManager.getImage(os.path.join(folder, file))
                 key = name[5:]
                 # Attach image back into TAROTS and3 keep reference
                 if key in TAROTS:
@@ -162,7 +166,7 @@ class ShopState(State):
 
         if not self.selected_info:
             hint = "Click a Joker or Planet to see details here."
-            hint_surf = self.smallFont.render(hint, True, (160, 160, 160))
+            hint_surf = textCache.render(self.smallFont, hint, True, (160, 160, 160))
             self.shopSurface.blit(hint_surf, (inner.x, inner.y))
             return
 
@@ -171,20 +175,20 @@ class ShopState(State):
         price = self.selected_info.get('price', None)
         usable = self.selected_info.get('usable', False)
 
-        title = self.shopFont.render(name, True, (255, 255, 255))
+        title = textCache.render(self.shopFont, name, True, (255, 255, 255))
         self.shopSurface.blit(title, (inner.x, inner.y))
 
         lines = self._wrap_lines(desc, self.smallFont, inner.width)
         y = inner.y + title.get_height() + 8
         for line in lines:
-            txt = self.smallFont.render(line, True, (220, 220, 220))
+            txt = textCache.render(self.smallFont, line, True, (220, 220, 220))
             self.shopSurface.blit(txt, (inner.x, y))
             y += txt.get_height() + 4
 
         # Price + Buy button only when the selected item is a shop offer
         # DONE (BONUS): Buy-and-use rect
         if price is not None and self.selected_info.get('can_buy', False):
-            price_txt = self.smallFont.render(f"Price: {price}$", True, (255, 215, 0))
+            price_txt = textCache.render(self.smallFont, f"Price: {price}$", True, (255, 215, 0))
             self.shopSurface.blit(price_txt, (inner.x, y + 10))
 
             buy_w, buy_h = 120, 45
@@ -197,14 +201,14 @@ class ShopState(State):
             local_buy_use_rect = pygame.Rect(buy_use_x, buy_use_y, buy_use_w, buy_use_h) if usable else None
 
             pygame.draw.rect(self.shopSurface, (200, 150, 0), local_buy_rect, border_radius=8)
-            text = self.shopFont.render("Buy", True, (255, 255, 255))
+            text = textCache.render(self.shopFont, "Buy", True, (255, 255, 255))
             text_rect = text.get_rect(center=local_buy_rect.center)
             self.shopSurface.blit(text, text_rect)
             self.buy_rect = local_buy_rect.move(self.shopPos[0], self.shopPos[1])
 
             if local_buy_use_rect:
                 pygame.draw.rect(self.shopSurface, (200, 0, 0), local_buy_use_rect, border_radius=8)
-                text = self.shopFont.render("Buy and Use", True, (255, 255, 255))
+                text = textCache.render(self.shopFont, "Buy and Use", True, (255, 255, 255))
                 text_rect = text.get_rect(center=local_buy_use_rect.center)
                 self.shopSurface.blit(text, text_rect)
                 self.buy_use_rect = local_buy_use_rect.move(self.shopPos[0], self.shopPos[1])
@@ -242,11 +246,11 @@ class ShopState(State):
         self.shopSurface.blit(self.skipbuttondisp, (25, 25))
         self.shopSurface.blit(self.rerollbuttondisp, (25, 135))
 
-        next_text = self.shopFont.render("Next Round", True, (255, 255, 255))
+        next_text = textCache.render(self.shopFont, "Next Round", True, (255, 255, 255))
         next_rect = next_text.get_rect(center=self.skipbuttondisp_rect.center)
         self.shopSurface.blit(next_text, next_rect)
 
-        reroll_text = self.shopFont.render("Reroll (3$)", True, (255, 255, 255))
+        reroll_text = textCache.render(self.shopFont, "Reroll (3$)", True, (255, 255, 255))
         reroll_rect = reroll_text.get_rect(center=self.rerollbuttondisp_rect.center)
         self.shopSurface.blit(reroll_text, reroll_rect)
 
@@ -284,25 +288,25 @@ class ShopState(State):
             # money display
             if self.playerInfo:
                 # Draw money counter
-                money_font = pygame.font.Font('graphics/text/m6x11.ttf', 48)
+                money_font = assetManager.getFont('graphics/text/m6x11.ttf', 48)
                 money_text = f"${self.playerInfo.playerMoney}"
 
                 # Shadow effect
-                money_shadow = money_font.render(money_text, True, (0, 0, 0))
+                money_shadow = textCache.render(money_font, money_text, True, (0, 0, 0))
                 self.screen.blit(money_shadow, (37, 37))
 
                 # Main text (green)
-                money_surface = money_font.render(money_text, True, (100, 255, 100))
+                money_surface = textCache.render(money_font, money_text, True, (100, 255, 100))
                 self.screen.blit(money_surface, (35, 130))
 
                 # Money label
-                label_font = pygame.font.Font('graphics/text/m6x11.ttf', 50)
-                label = label_font.render("DABLOONS:", True, (255, 215, 0))
+                label_font = assetManager.getFont('graphics/text/m6x11.ttf', 50)
+                label = textCache.render(label_font, "DABLOONS:", True, (255, 215, 0))
                 self.screen.blit(label, (35, 85))
 
             # Add boss rush title
-            title_font = pygame.font.Font('graphics/text/m6x11.ttf', 40)
-            title_text = title_font.render(boss_rush_text, True, (255, 215, 0))
+            title_font = assetManager.getFont('graphics/text/m6x11.ttf', 40)
+            title_text = textCache.render(title_font, boss_rush_text, True, (255, 215, 0))
             self.screen.blit(title_text, (650 - title_text.get_width() // 2, 150))
 
             # Show next boss info if available
@@ -312,14 +316,14 @@ class ShopState(State):
                     from States.BossRushState import BOSS_RUSH_BOSSES
                     if next_boss_index < len(BOSS_RUSH_BOSSES):
                         boss = BOSS_RUSH_BOSSES[next_boss_index]
-                        boss_font = pygame.font.Font('graphics/text/m6x11.ttf', 30)
-                        boss_text = boss_font.render(f"Next: {boss['name']}", True, (255, 100, 100))
+                        boss_font = assetManager.getFont('graphics/text/m6x11.ttf', 30)
+                        boss_text = textCache.render(boss_font, f"Next: {boss['name']}", True, (255, 100, 100))
                         self.screen.blit(boss_text, (650 - boss_text.get_width() // 2, 200))
 
                         # Show boss description if available
                         if 'description' in boss:
-                            desc_font = pygame.font.Font('graphics/text/m6x11.ttf', 20)
-                            desc_text = desc_font.render(f"{boss['description']}", True, (200, 200, 200))
+                            desc_font = assetManager.getFont('graphics/text/m6x11.ttf', 20)
+                            desc_text = textCache.render(desc_font, f"{boss['description']}", True, (200, 200, 200))
                             self.screen.blit(desc_text, (650 - desc_text.get_width() // 2, 240))
                 except ImportError:
                     pass  # Skip if can't import
@@ -353,11 +357,11 @@ class ShopState(State):
             if is_boss_rush:
                 # Lighter overlay for boss rush (optional - can remove if too dark)
                 self.tvOverlay.set_alpha(100)
-                self.screen.blit(self.tvOverlay, (0, 0))
+                renderQuality.drawOverlay(self.screen, self.tvOverlay)
                 self.tvOverlay.set_alpha(160)  # Reset
             else:
                 # Normal overlay for regular game
-                self.screen.blit(self.tvOverlay, (0, 0))
+                renderQuality.drawOverlay(self.screen, self.tvOverlay)
 
     # ---------- Draw cards ----------
     def drawRandomJokers(self):
@@ -382,7 +386,7 @@ class ShopState(State):
 
             h = 140
             w = int(img.get_width() * (h / img.get_height()))
-            scaled = pygame.transform.scale(img, (w, h))
+            scaled = scaledSurfaces.get(img, (w, h))
             pos_x = start_x + i * spacing
             self.shopSurface.blit(scaled, (pos_x, pos_y))
 
@@ -397,7 +401,7 @@ class ShopState(State):
 
         joker_obj, joker_rect = self.joker_for_sell
         text = f"Sell : {joker_obj.sellPrice()}$"
-        txt_surf = self.smallFont.render(text, True, (255, 255, 255))
+        txt_surf = textCache.render(self.smallFont, text, True, (255, 255, 255))
         pad_x, pad_y = 10, 6
         box_w = txt_surf.get_width() + pad_x * 2
         box_h = txt_surf.get_height() + pad_y * 2
@@ -415,7 +419,7 @@ class ShopState(State):
 
         joker_obj, joker_rect = self.joker_for_use
         text = f"Use"
-        txt_surf = self.smallFont.render(text, True, (255, 255, 255))
+        txt_surf = textCache.render(self.smallFont, text, True, (255, 255, 255))
         pad_x, pad_y = 10, 6
         box_w = txt_surf.get_width() + pad_x * 2
         box_h = txt_surf.get_height() + pad_y * 3
@@ -439,7 +443,7 @@ class ShopState(State):
         p = self.selected_consumable
         candidates = []
         for j in self.game_state.jokerDeck:
-            if j.name in self.game_state.playerJokers:
+            if j.id in self.game_state.playerJokers:
                 continue
             if j.name == "_":
                 continue
@@ -523,10 +527,10 @@ class ShopState(State):
                     return
 
                 joker_obj, _ = self.joker_for_sell
-                if joker_obj.name in self.game_state.playerJokers:
-                    self.game_state.playerJokers.remove(joker_obj.name)
-                elif joker_obj.name in self.game_state.playerConsumables:
-                    self.game_state.playerConsumables.remove(joker_obj.name)
+                if joker_obj.id in self.game_state.playerJokers:
+                    self.game_state.playerJokers.remove(joker_obj.id)
+                elif joker_obj.id in self.game_state.playerConsumables:
+                    self.game_state.playerConsumables.remove(joker_obj.id)
                 else:
                     print(f"[SHOP] sell: {joker_obj.name} not in playerJokers")
 
@@ -600,7 +604,7 @@ class ShopState(State):
                                 elif result["effect"] == "recreate_last_used":
                                     self.game_state.handleFoolEffect()
                     else:
-                        self.game_state.playerConsumables.append(joker_obj.name)
+                        self.game_state.playerConsumables.append(joker_obj.id)
                     # print(f"DEBUG: After activation - One Pair level: {HAND_SCORES['One Pair']['level']}")
                     # print(f"DEBUG: After activation - Flush level: {HAND_SCORES['Flush']['level']}")
                     if joker_obj is not None and joker_obj.name:
@@ -608,7 +612,7 @@ class ShopState(State):
 
                 elif isinstance(joker_obj, Jokers):
                     if self.playerInfo.playerMoney >= price and len(self.game_state.playerJokers) < self.game_state.max_jokers:
-                        self.game_state.playerJokers.append(joker_obj.name)
+                        self.game_state.playerJokers.append(joker_obj.id)
                         self.playerInfo.playerMoney -= price
                         if joker_obj in self.shop_random_jokers:
                             self.shop_random_jokers.remove(joker_obj)
@@ -640,7 +644,7 @@ class ShopState(State):
                     self.selected_info = None
                     return
                 joker_obj, _ = self.joker_for_use
-                if joker_obj.name in self.game_state.playerConsumables:
+                if joker_obj.id in self.game_state.playerConsumables:
                     if (joker_obj.name in PLANETS) and isinstance(joker_obj, PlanetCard):
                         joker_obj.activatePlanet(HAND_SCORES)
                     elif (joker_obj.name in TAROTS) and (joker_obj.name in valid_use_tarots) and isinstance(joker_obj, TarotCard):
@@ -652,7 +656,7 @@ class ShopState(State):
                                 self.game_state.handleEmperorEffect(result.get("count", 2))
                             elif result["effect"] == "recreate_last_used":
                                 self.game_state.handleFoolEffect()
-                    self.game_state.playerConsumables.remove(joker_obj.name)
+                    self.game_state.playerConsumables.remove(joker_obj.id)
                 else:
                     print(f"[SHOP] use: {joker_obj.name} not in playerJokers")
 
@@ -674,35 +678,37 @@ class ShopState(State):
                     self.game_state.drawJokers()
                 if not self.game_state.consumables:
                     self.game_state.drawConsumables()
-                for joker_obj, joker_rect in self.game_state.jokers.items():
-                    if joker_rect.collidepoint(mousePos):
-                        desc_text = self._pretty_joker_description(joker_obj)
-                        if joker_obj is not None:
-                            price = joker_obj.price
-                        else:
-                            price = None
-                        self.joker_for_sell = (joker_obj, joker_rect)
-                        self.selected_info = {'name': joker_obj.name, 'desc': desc_text, 'price': price,
-                                              'can_buy': False}
-                        return
+                hit = self.game_state.jokerSlots.at(mousePos)
+                if hit is not None:
+                    joker_obj, joker_rect = hit
+                    desc_text = self._pretty_joker_description(joker_obj)
+                    if joker_obj is not None:
+                        price = joker_obj.price
+                    else:
+                        price = None
+                    self.joker_for_sell = (joker_obj, joker_rect)
+                    self.selected_info = {'name': joker_obj.name, 'desc': desc_text, 'price': price,
+                                          'can_buy': False}
+                    return
 
             # Owned consumables: check positions rendered by GameState
             if self.game_state is not None:
                 if not self.game_state.consumables:
                     self.game_state.drawConsumables()
-                for joker_obj, joker_rect in self.game_state.consumables.items():
-                    if joker_rect.collidepoint(mousePos):
-                        desc_text = joker_obj.description
-                        price = joker_obj.price
-                        name = joker_obj.name
-                        usable = True if isinstance(joker_obj, PlanetCard) or \
-                                         (isinstance(joker_obj, TarotCard) and joker_obj.name in valid_use_tarots) \
-                                                                                                     else False
-                        self.joker_for_sell = (joker_obj, joker_rect)
-                        self.joker_for_use = (joker_obj, joker_rect) if usable else None
-                        self.selected_info = {'name': name, 'desc': desc_text, 'price': price,
-                                              'can_buy': False, 'usable': usable}
-                        return
+                hit = self.game_state.consumableSlots.at(mousePos)
+                if hit is not None:
+                    joker_obj, joker_rect = hit
+                    desc_text = joker_obj.description
+                    price = joker_obj.price
+                    name = joker_obj.name
+                    usable = True if isinstance(joker_obj, PlanetCard) or \
+                                     (isinstance(joker_obj, TarotCard) and joker_obj.name in valid_use_tarots) \
+                                                                                                 else False
+                    self.joker_for_sell = (joker_obj, joker_rect)
+                    self.joker_for_use = (joker_obj, joker_rect) if usable else None
+                    self.selected_info = {'name': name, 'desc': desc_text, 'price': price,
+                                          'can_buy': False, 'usable': usable}
+                    return
 
             # Shop offers
             for idx, rect in enumerate(self.shop_random_joker_rects):
@@ -1,17 +1,20 @@
 import pygame
 from States.Core.StateClass import State
 import math
+from Assets.AssetManager import assetManager
+from Assets.SpriteFrameCache import spriteFrames
+from Assets.TextCache import textCache
+from Engine.RenderQuality import renderQuality
 
 class StartState(State):
     def __init__(self, nextState: str = ""):
         super().__init__(nextState)
         # ----------------------------- Background --------------------------------
-        self.backgroundImage = pygame.image.load('Graphics/Backgrounds/introBackground.jpeg')
-        self.background = pygame.transform.scale(self.backgroundImage, (1300, 750))
+        self.background = assetManager.getScaledImage('Graphics/Backgrounds/introBackground.jpeg', (1300, 750), alpha=False)
         self.backgroundRect = self.background.get_rect(topleft=(0, 0))
 
         # ----------------------------- Title -------------------------------------
-        self.titleImage = pygame.image.load('Graphics/Backgrounds/balatroTitle.png')
+        self.titleImage = assetManager.getImage('Graphics/Backgrounds/balatroTitle.png')
         original_width, original_height = self.titleImage.get_size()
         scale_factor = 700 / original_width
         new_width = int(original_width * scale_factor)
@@ -24,19 +27,19 @@ class StartState(State):
         self.breathAmplitude = 10  # pixels (not directly used, just for reference)
         self.breathSpeed = 0.005   # smaller = slower breathing
         self.breathTime = 0
+        spriteFrames.precomputeScale(self.titleImage, self.baseTitleSize, 0.95, 1.05)
 
         # ----------------------------- Text --------------------------------------
-        self.textFont1 = pygame.font.Font('Graphics/Text/m6x11.ttf', 50)
-        self.textFont2 = pygame.font.Font('Graphics/Text/m6x11.ttf', 40)
-        self.textPlay = self.textFont1.render("PLAY", True, 'white')
-        self.textInstructions = self.textFont2.render("HELP", True, 'white')
-        self.textQuit = self.textFont1.render("QUIT", True, 'white')
-        self.textBossRush = self.textFont1.render("BOSS RUSH", True, 'white')
+        self.textFont1 = assetManager.getFont('Graphics/Text/m6x11.ttf', 50)
+        self.textFont2 = assetManager.getFont('Graphics/Text/m6x11.ttf', 40)
+        self.textPlay = textCache.render(self.textFont1, "PLAY", True, 'white')
+        self.textInstructions = textCache.render(self.textFont2, "HELP", True, 'white')
+        self.textQuit = textCache.render(self.textFont1, "QUIT", True, 'white')
+        self.textBossRush = textCache.render(self.textFont1, "BOSS RUSH", True, 'white')
 
         # ----------------------------- Title Card --------------------------------
-        self.titleCardImage = pygame.image.load('Graphics/Backgrounds/titleCard.png')
         self.baseCardSize = (150, 220)
-        self.titleCard = pygame.transform.scale(self.titleCardImage, self.baseCardSize)
+        self.titleCard = assetManager.getScaledImage('Graphics/Backgrounds/titleCard.png', self.baseCardSize)
         self.titleCardRect = self.titleCard.get_rect(topleft=(575, 150))
         self.mouseDragging = False
         self.isMouseInCard = False
@@ -68,12 +71,11 @@ class StartState(State):
         self.buttonQuit.topleft = (x, (self.buttonBar.height - self.buttonQuit.height) // 2)
 
         # ----------------------------- TV Overlay --------------------------------
-        self.tvOverlay = pygame.image.load('Graphics/Backgrounds/CRT.png').convert_alpha()
-        self.tvOverlay = pygame.transform.scale(self.tvOverlay, (1300, 750))
+        self.tvOverlay = assetManager.getScaledImage('Graphics/Backgrounds/CRT.png', (1300, 750))
 
         # ----------------------------- Help Screen --------------------------------
         self.showHelpScreen = False
-        self.helpFont = pygame.font.Font('Graphics/Text/m6x11.ttf', 30)
+        self.helpFont = assetManager.getFont('Graphics/Text/m6x11.ttf', 30)
         self.helpText = [
             "Welcome to Balatro!",
             "Goal: Play the best hand and win the game.",
@@ -108,7 +110,7 @@ class StartState(State):
         State.screen.blit(self.buttonBarSurface, self.buttonBar)
 
         # Draw CRT overlay on top
-        State.screen.blit(self.tvOverlay, (0, 0))
+        renderQuality.drawOverlay(State.screen, self.tvOverlay)
 
         # Draw Help Screen Overlay if active
         if self.showHelpScreen:
@@ -116,9 +118,7 @@ class StartState(State):
 
     # ----------------------------- Help Screen --------------------------------
     def drawHelpScreen(self):
-        overlay = pygame.Surface((1300, 750), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))  # semi-transparent dark overlay
-        State.screen.blit(overlay, (0, 0))
+        renderQuality.drawTint(State.screen, (0, 0, 0), 200)  # semi-transparent dark overlay
 
         # Better formatting
         wrapped_lines = []
@@ -146,11 +146,11 @@ class StartState(State):
         line_height = 40
 
         for i, line in enumerate(wrapped_lines):
-            text_surf = self.helpFont.render(line, True, 'white')
+            text_surf = textCache.render(self.helpFont, line, True, 'white')
             text_rect = text_surf.get_rect(center=(650, start_y + i * line_height))
             State.screen.blit(text_surf, text_rect)
 
-        closeText = self.helpFont.render("Click anywhere to close", True, 'yellow')
+        closeText = textCache.render(self.helpFont, "Click anywhere to close", True, 'yellow')
         closeRect = closeText.get_rect(center=(650, 700))
         State.screen.blit(closeText, closeRect)
 
@@ -180,9 +180,7 @@ class StartState(State):
     # ----------------------------- Breathing Animation for Title ------------------------
     def updateBreathTitle(self):
         scale = 1 + math.sin(self.breathTime) * 0.05  # 5% scaling
-        newWidth = int(self.baseTitleSize[0] * scale)
-        newHeight = int(self.baseTitleSize[1] * scale)
-        self.title = pygame.transform.scale(self.titleImage, (newWidth, newHeight))
+        self.title = spriteFrames.scaled(self.titleImage, self.baseTitleSize, scale)
         self.titleRect = self.title.get_rect(midtop=self.titleRect.midtop)
 
     # ----------------------------- User Input --------------------------------
@@ -1,5 +1,11 @@
+import atexit
 import pygame
+from Assets.AssetManager import assetManager
 from States.Core.StateClass import State
+from Engine.FrameClock import frameClock
+from Engine.DirtyRects import dirtyRects
+from Engine.RenderQuality import renderQuality
+from Engine.SurfacePool import surfacePool
 from States.Menus.TitleState import StartState
 from States.GameState import GameState
 from States.Menus.GameWinState import GameWinState
@@ -27,9 +33,23 @@ if __name__ == "__main__":
     gameScreen = GameState(player=player)
     curScreen = startScreen
     bossRushScreen = None
+    assetManager.diskCache.flush()                 # Write the disk cache index once for everything the first states loaded
+    atexit.register(assetManager.diskCache.flush)  # and again at exit for assets loaded later
+
+    if "--dirty-rects" in sys.argv:
+        dirtyRects.enabled = True       # Only push the regions that changed (opt-in, for software renderers)
+    if "--quality" in sys.argv[:-1]:
+        renderQuality.setLevel(sys.argv[sys.argv.index("--quality") + 1])  # high / medium / low
+    if "--adaptive-quality" in sys.argv:
+        renderQuality.adaptive = True   # Drop full-screen effects when frames go over budget
+    if "--fps" in sys.argv[:-1]:
+        frameClock.setFrameCap(int(sys.argv[sys.argv.index("--fps") + 1]))  # Frame cap, 0 = uncapped (logic keeps its fixed tick rate)
 
     # --- Main loop ---
+    shownScreen = None
     while True:
+        steps = frameClock.tick()                   # Caps the frame rate and returns the fixed logic steps to run
+        renderQuality.sample(frameClock.workMs)
         events = pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
@@ -81,6 +101,14 @@ if __name__ == "__main__":
             else:
                 exit()
 
+        fixedUpdate = getattr(curScreen, "fixedUpdate", None)  # frame-rate independent logic, for states that have it
+        if fixedUpdate is not None:
+            for _ in range(steps):
+                fixedUpdate(frameClock.step)
+        if curScreen is not shownScreen:              # State transition: push the whole new frame
+            dirtyRects.invalidate()
+            shownScreen = curScreen
         curScreen.update()
-        pygame.display.update()
+        dirtyRects.present(curScreen)
+        surfacePool.endFrame()
          
\ No newline at end of file
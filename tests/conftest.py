@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The game packages are plain directories at the repository root (no install step), like when running main.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,139 @@
+"""
+score_hand as it was before the joker pipeline (one if-block per joker), kept as the reference
+the compiled pipeline (Deck/JokerEffects.py) must score the same as.
+"""
+import random
+from Cards.Card import Card, Rank, Enhancement
+from Deck.HandEvaluator import score_kernel
+from Deck.HandScoring import ScoreResult
+
+
+def score_hand(selected: list[Card], held: list[Card], jokers, hand_levels: dict, heat: int = 0, rng=random,
+               joker_count: int | None = None, hands_played: int = 0) -> ScoreResult:
+    """
+    Scores a played hand without touching the game: no pygame, no player state, no global RNG.
+      selected     : cards played, held: cards left in hand
+      jokers       : names of the jokers that apply (disabled ones already removed)
+      hand_levels  : HAND_SCORES-like table {hand name: {"chips", "multiplier"}}
+      heat         : active heat level (0 if heat is not active)
+      rng          : anything with randint (random.Random(seed) for reproducible runs)
+      joker_count  : jokers owned, including disabled ones (Ogre), defaults to len(jokers)
+      hands_played : hands already played this round (Straw Hat)
+    """
+    owned = set(jokers)
+    if joker_count is None:
+        joker_count = len(owned)
+
+    hand_name, _, scoring = score_kernel(selected)
+    result = ScoreResult(hand_name, [selected[i] for i in scoring])
+
+    # Base values from the hand levels
+    score_info = hand_levels.get(hand_name, {"chips": 0, "multiplier": 1})
+    hand_chips = score_info.get("chips", 0)
+    hand_mult = score_info.get("multiplier", 1)
+    result.hand_chips = hand_chips
+
+    # ----------------- Card Enhancements (scored cards) -----------------
+    card_chips_sum = 0
+    for c in result.scoring_cards:
+        if c.enhancement == Enhancement.STONE:
+            card_chips_sum += 50  # Stone cards have no rank, just a flat +50
+            continue
+        card_chips_sum += c.chips
+        match c.enhancement:
+            case Enhancement.BONUS:
+                card_chips_sum += 30
+            case Enhancement.MULT:
+                hand_mult += 4
+            case Enhancement.GLASS:
+                hand_mult *= 2
+                if rng.randint(1, 4) == 1:
+                    result.destroyed.append(c)
+            case Enhancement.LUCKY:
+                if rng.randint(1, 5) == 1:
+                    hand_mult += 20
+                if rng.randint(1, 15) == 1:
+                    result.money += 20
+    result.card_chips = card_chips_sum
+    total_chips = hand_chips + card_chips_sum
+
+    # ------------------ Effects for Held Cards ------------------------
+    for c in held:
+        match c.enhancement:
+            case Enhancement.STEEL:
+                hand_mult *= 1.5
+
+    # ------------------- Joker effects -------------------
+    activated = result.activated_jokers
+    bonus_802 = False
+
+    if "The Joker" in owned:
+        hand_mult += 4
+        activated.append("The Joker")
+
+    if "Michael Myers" in owned:
+        hand_mult += rng.randint(0, 23)
+        activated.append("Michael Myers")
+
+    if "Fibonacci" in owned:
+        funny_cards = [Rank.TWO, Rank.THREE, Rank.FIVE, Rank.EIGHT, Rank.ACE]
+        used = False
+        for card in selected:
+            if card.rank in funny_cards:
+                hand_mult += 8
+                used = True
+        if used:
+            activated.append("Fibonacci")
+
+    if "Gauntlet" in owned:
+        total_chips += 250
+        result.hands -= 2
+        activated.append("Gauntlet")
+
+    if "Ogre" in owned:
+        hand_mult += joker_count * 3
+        activated.append("Ogre")
+
+    if "Straw Hat" in owned:
+        total_chips += max(0, 100 - (5 * hands_played))
+        activated.append("Straw Hat")
+
+    if "Hog Rider" in owned:
+        if hand_name == "Straight":
+            total_chips += 100
+        activated.append("Hog Rider")
+
+    if "? Block" in owned and len(selected) == 4:
+        total_chips += 4
+        activated.append("? Block")
+
+    if "Hogwarts" in owned:
+        used = False
+        for card in selected:
+            if card.rank == Rank.ACE:
+                hand_mult += 4
+                total_chips += 20
+        if used:
+            activated.append("Hogwarts")
+
+    if "802" in owned:
+        bonus_802 = True
+        activated.append("802")
+
+    # -------------------  HEAT EFFECTS  -------------------
+    if heat == 1:
+        hand_mult *= 2
+    elif heat == 2:
+        hand_mult = int(hand_mult * 1.2)
+        total_chips += 40
+    elif heat == 3:
+        hand_mult = int(hand_mult * 1.8)
+        total_chips += 80
+
+    # ------------------ Finalize ------------------
+    result.chips = total_chips
+    result.mult = hand_mult
+    result.score = total_chips * hand_mult
+    if bonus_802:
+        result.score *= 2
+    return result
@@ -0,0 +1,73 @@
+import os
+import pygame
+import pytest
+from Assets import AssetDiskCache as diskCacheModule
+from Assets.AssetDiskCache import AssetDiskCache, INDEX_FILE
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    # load() converts to the display format, so it needs a (headless) display
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((8, 8))
+    yield
+    pygame.display.quit()
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "sprite.png"
+    path.write_bytes(b"not really a png, only its hash matters")
+    return str(path)
+
+
+def sprite(color=(10, 20, 30, 200)) -> pygame.Surface:
+    surface = pygame.Surface((5, 3), pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+
+def test_round_trip(tmp_path, source):
+    cache = AssetDiskCache(str(tmp_path / "cache"))
+    cache.store(source, "joker:0:v1", sprite())
+    cache.flush()
+    surface = AssetDiskCache(str(tmp_path / "cache")).load(source, "joker:0:v1")
+    assert surface.get_size() == (5, 3)
+    assert surface.get_at((2, 1)) == (10, 20, 30, 200)
+    opaque = AssetDiskCache(str(tmp_path / "cache")).load(source, "joker:0:v1", alpha=False)
+    assert opaque.get_at((2, 1))[:3] == (10, 20, 30)
+
+
+def test_index_is_written_once_per_flush(tmp_path, source, monkeypatch):
+    cache = AssetDiskCache(str(tmp_path / "cache"))
+    writes = []
+    save = cache._saveIndex
+    monkeypatch.setattr(cache, "_saveIndex", lambda: (writes.append(1), save()))
+    for i in range(20):
+        cache.store(source, f"joker:{i}:v1", sprite())
+    assert writes == []
+    assert not os.path.exists(tmp_path / "cache" / INDEX_FILE)
+    cache.flush()
+    cache.flush()
+    assert writes == [1]
+    assert len(AssetDiskCache(str(tmp_path / "cache")).index) == 20
+
+
+def test_unflushed_entries_are_not_loaded_by_the_next_launch(tmp_path, source):
+    AssetDiskCache(str(tmp_path / "cache")).store(source, "joker:0:v1", sprite())
+    assert AssetDiskCache(str(tmp_path / "cache")).load(source, "joker:0:v1") is None
+
+
+def test_stale_source_version_and_layout(tmp_path, source, monkeypatch):
+    cache = AssetDiskCache(str(tmp_path / "cache"))
+    cache.store(source, "joker:0:v1", sprite())
+    cache.flush()
+    # New processing code uses a new op version, the old pixels are never matched
+    assert AssetDiskCache(str(tmp_path / "cache")).load(source, "joker:0:v2") is None
+    monkeypatch.setattr(diskCacheModule, "CACHE_VERSION", diskCacheModule.CACHE_VERSION + 1)
+    assert AssetDiskCache(str(tmp_path / "cache")).index == {}
+    monkeypatch.undo()
+    with open(source, "ab") as f:
+        f.write(b" edited")
+    assert AssetDiskCache(str(tmp_path / "cache")).load(source, "joker:0:v1") is None
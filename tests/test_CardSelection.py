@@ -0,0 +1,76 @@
+import random
+import pytest
+from Cards.Card import Card, Suit, Rank
+from Deck.CardSelection import CardSelection
+
+
+def hand() -> list[Card]:
+    return [Card(Suit.HEARTS, rank) for rank in list(Rank)[:8]]
+
+
+def test_add_and_discard_own_is_selected():
+    cards = hand()
+    selection = CardSelection()
+    assert selection.add(cards[2]) is True
+    assert selection.add(cards[2]) is False
+    assert cards[2].isSelected and cards[2] in selection
+    assert selection.discard(cards[2]) is True
+    assert selection.discard(cards[2]) is False
+    assert not cards[2].isSelected and cards[2] not in selection
+    assert len(selection) == 0
+
+
+def test_selection_order_and_indexing():
+    cards = hand()
+    selection = CardSelection([cards[5], cards[1], cards[3]])
+    assert selection.toList() == [cards[5], cards[1], cards[3]]
+    assert selection[0] is cards[5]
+    assert selection[-1] is cards[3]
+    assert selection[:2] == [cards[5], cards[1]]
+    # Reselecting a card puts it at the end
+    selection.discard(cards[5])
+    selection.add(cards[5])
+    assert list(selection) == [cards[1], cards[3], cards[5]]
+
+
+def test_deselect_while_iterating():
+    cards = hand()
+    selection = CardSelection(cards)
+    for card in selection:
+        if card.rank.value % 2 == 0:
+            selection.discard(card)
+    assert [card.rank.value for card in selection] == [3, 5, 7, 9]
+    assert [card.isSelected for card in cards] == [False, True] * 4
+
+
+def test_clear_and_copy():
+    cards = hand()
+    selection = CardSelection(cards[:3])
+    clone = selection.copy()
+    selection.clear()
+    assert len(selection) == 0
+    assert not any(card.isSelected for card in cards)
+    assert clone.toList() == cards[:3]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_is_selected_always_matches_the_selection(seed):
+    rng = random.Random(seed)
+    cards = hand()
+    selection = CardSelection()
+    model = []
+    for _ in range(500):
+        card = rng.choice(cards)
+        if rng.random() < 0.5:
+            assert selection.add(card) is (card not in model)
+            if card not in model:
+                model.append(card)
+        elif rng.random() < 0.95:
+            assert selection.discard(card) is (card in model)
+            if card in model:
+                model.remove(card)
+        else:
+            selection.clear()
+            model = []
+        assert selection.toList() == model
+        assert [card.isSelected for card in cards] == [card in model for card in cards]
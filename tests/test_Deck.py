@@ -0,0 +1,167 @@
+import random
+import pytest
+from Cards.Card import Card, Suit, Rank, Enhancement
+from Deck.Deck import Deck
+from Deck.DeckComposition import ZONES
+
+
+def full_deck() -> list[Card]:
+    return [Card(suit, rank) for suit in Suit for rank in Rank]
+
+
+def test_draw_takes_from_the_top_in_order():
+    cards = full_deck()
+    deck = Deck(cards)
+    assert deck.draw() is cards[0]
+    assert deck.drawCards(3) == cards[1:4]
+    assert len(deck) == 48
+    assert deck.toList() == cards[4:]
+    assert list(deck) == cards[4:]
+    assert cards[0] not in deck and cards[4] in deck
+
+
+def test_drawing_an_empty_deck():
+    deck = Deck(full_deck()[:2])
+    assert deck.drawCards(5) == deck.cards[:2]
+    assert deck.draw() is None
+    assert deck.drawCards(1) == []
+    assert deck.drawCards(-1) == []
+    assert len(deck) == 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_deck_behaves_like_a_list(seed):
+    """Random draws, bottom puts and removals must leave the same pile as plain list operations."""
+    rng = random.Random(seed)
+    cards = full_deck()
+    deck = Deck(cards)
+    model = list(cards)
+    spare = [Card(rng.choice(list(Suit)), rng.choice(list(Rank))) for _ in range(200)]
+    for _ in range(400):
+        op = rng.random()
+        if op < 0.35:
+            assert deck.draw() is (model.pop(0) if model else None)
+        elif op < 0.55:
+            n = rng.randint(0, 8)
+            drawn, model = model[:n], model[n:]
+            assert deck.drawCards(n) == drawn
+        elif op < 0.85:
+            card = spare.pop() if spare and rng.random() < 0.5 else Card(Suit.SPADES, Rank.TWO)
+            deck.putBottom(card)
+            model.append(card)
+        elif model:
+            card = rng.choice(model)
+            deck.remove(card)
+            model.remove(card)
+        assert len(deck) == len(model)
+        assert deck.toList() == model
+    assert all(card in deck for card in model)
+
+
+def test_remove_ignores_drawn_cards():
+    cards = full_deck()
+    deck = Deck(cards)
+    deck.draw()
+    with pytest.raises(ValueError):
+        deck.remove(cards[0])
+
+
+def test_shuffle_only_moves_the_remaining_cards():
+    cards = full_deck()
+    deck = Deck(cards, rng=random.Random(3))
+    drawn = deck.drawCards(10)
+    deck.shuffle()
+    assert len(deck) == 42
+    assert not any(card in drawn for card in deck)
+    assert sorted(map(id, deck.toList() + drawn)) == sorted(map(id, cards))
+
+
+def test_reshuffle_puts_cards_back():
+    cards = full_deck()
+    deck = Deck(cards, rng=random.Random(4))
+    hand = deck.drawCards(8)
+    deck.reshuffle(hand)
+    assert len(deck) == 52
+    assert sorted(map(id, deck)) == sorted(map(id, cards))
+
+
+def test_shuffles_are_reproducible_with_a_seeded_rng():
+    first = Deck(full_deck(), rng=random.Random(7))
+    second = Deck(list(first.cards), rng=random.Random(7))
+    first.shuffle()
+    second.shuffle()
+    assert first.toList() == second.toList()
+
+
+def test_copy_is_independent():
+    deck = Deck(full_deck())
+    deck.drawCards(5)
+    clone = deck.copy()
+    assert clone.toList() == deck.toList()
+    clone.draw()
+    assert len(clone) == len(deck) - 1
+
+
+# ---------- Composition ----------
+def recount(composition, zones: dict) -> None:
+    """Checks every running count against a recount of the cards in each zone."""
+    assert composition.total == sum(len(cards) for cards in zones.values())
+    for zone in ZONES:
+        cards = zones.get(zone, [])
+        assert composition.zoneCount(zone) == len(cards)
+        for rank in Rank:
+            assert composition.rankCount(rank, zone) == sum(c.rank == rank for c in cards)
+        for suit in Suit:
+            assert composition.suitCount(suit, zone) == sum(c.suit == suit for c in cards)
+        for enhancement in Enhancement:
+            assert composition.enhancementCount(enhancement, zone) == sum(c.enhancement == enhancement for c in cards)
+        for card in cards:
+            assert composition.zoneOf(card) == zone
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_composition_follows_the_cards(seed):
+    rng = random.Random(seed)
+    deck = Deck(full_deck(), rng=rng)
+    deck.shuffle()
+    hand, used = [], []
+    for _ in range(60):
+        op = rng.random()
+        if op < 0.4:
+            hand += deck.drawCards(rng.randint(1, 5))
+        elif op < 0.6 and hand:
+            card = hand.pop(rng.randrange(len(hand)))
+            used.append(card)
+            deck.composition.move(card, "used")
+        elif op < 0.7 and hand:
+            # Tarots change cards in place
+            card = rng.choice(hand)
+            card.update_enhancement(rng.choice(list(Enhancement)))
+            deck.composition.refresh(card)
+        elif op < 0.8 and len(deck):
+            deck.remove(rng.choice(deck.toList()))
+        elif op < 0.9 and hand:
+            deck.putBottom(hand.pop())
+        else:
+            deck.reshuffle(hand + used)
+            hand, used = [], []
+        recount(deck.composition, {"deck": deck.toList(), "hand": hand, "used": used})
+
+
+def test_draw_chance():
+    deck = Deck(full_deck())
+    assert deck.composition.drawChance(rank=Rank.ACE) == pytest.approx(4 / 52)
+    assert deck.composition.drawChance(suit=Suit.HEARTS) == pytest.approx(13 / 52)
+    deck.drawCards(52)
+    assert deck.composition.drawChance(rank=Rank.ACE) == 0.0
+
+
+def test_suit_rows_are_rebuilt_after_changes():
+    deck = Deck(full_deck())
+    composition = deck.composition
+    rows = composition.suitRows(list(Suit))
+    assert [len(row) for row in rows] == [13] * 4
+    assert rows[0][0].rank == Rank.ACE
+    assert composition.suitRows(list(Suit)) is rows
+    deck.remove(deck.toList()[0])
+    assert sum(len(row) for row in composition.suitRows(list(Suit))) == 51
@@ -0,0 +1,60 @@
+from Cards.EntityRegistry import EntityRegistry, entityRegistry
+from Deck.DeckManager import DeckManager
+
+
+class Entity:
+    def __init__(self, name: str):
+        self.name = name
+        self.id = None
+
+
+def test_ids_come_from_names():
+    registry = EntityRegistry()
+    first, second = Entity("Ogre"), Entity("802")
+    assert registry.register(first) == 0 == first.id
+    assert registry.register(second) == 1 == second.id
+    assert registry.idOf("802") == 1 and registry.idOf("Nope") is None
+    assert registry.nameOf(0) == "Ogre" and registry.nameOf(5) is None and registry.nameOf(-1) is None
+    assert registry.namesOf([1, 0]) == ["802", "Ogre"]
+
+
+def test_register_repoints_the_id_at_the_newest_object():
+    registry = EntityRegistry()
+    old, new = Entity("Ogre"), Entity("Ogre")
+    registry.register(old)
+    registry.register(new)
+    assert old.id == new.id
+    assert registry.get(old.id) is new
+
+
+def test_assign_keeps_the_registered_object():
+    registry = EntityRegistry()
+    shared, copy = Entity("Ogre"), Entity("Ogre")
+    registry.register(shared)
+    assert registry.assign(copy) == shared.id == copy.id
+    assert registry.get(copy.id) is shared
+    # An assigned-only name has an ID but no shared object
+    loose = Entity("Gauntlet")
+    registry.assign(loose)
+    assert registry.get(loose.id) is None
+
+
+def test_resolve_keeps_order_and_skips_unknown_ids():
+    registry = EntityRegistry()
+    entities = [Entity(name) for name in ("a", "b", "c")]
+    registry.registerAll(entities)
+    assert registry.resolve([2, 7, 0]) == [entities[2], entities[0]]
+
+
+def test_joker_decks_keep_their_own_objects(monkeypatch):
+    """Every GameState builds its own joker deck: same IDs, separate objects (isActive is per state)."""
+    manager = DeckManager()
+    # Only the joker names matter here, skip loading the sprite sheet
+    monkeypatch.setattr(manager, "loadJokerImages", lambda: {"The Joker": None, "Ogre": None, "802": None})
+    first = manager.createJokerDeck()
+    second = manager.createJokerDeck()
+    assert [joker.id for joker in first] == [joker.id for joker in second]
+    assert all(a is not b for a, b in zip(first, second))
+    assert all(entityRegistry.get(joker.id) is None for joker in first + second)
+    second[0].isActive = True
+    assert not first[0].isActive
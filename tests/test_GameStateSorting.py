@@ -0,0 +1,88 @@
+import random
+from types import SimpleNamespace
+import pytest
+from Cards.Card import Card, Suit, Rank
+from States.GameState import GameState, SORT_KEYS, SUIT_ORDER
+
+
+def legacy_sort(hand: list[Card], sort_by: str) -> list[Card]:
+    """SortCards before the key sorts: move-to-back loop by rank, then regroup by suit."""
+    buffer = list(hand)
+    done = False
+    while not done:
+        done = True
+        for i in range(len(buffer)):
+            if any(buffer[i].rank.value < other.rank.value for other in buffer[i:]):
+                buffer.append(buffer.pop(i))
+                done = False
+                break
+    if sort_by == "rank":
+        return buffer
+    return [card for suit in SUIT_ORDER for card in buffer if card.suit == suit]
+
+
+def random_cards(rng: random.Random, count: int) -> list[Card]:
+    return [Card(rng.choice(list(Suit)), rng.choice(list(Rank))) for _ in range(count)]
+
+
+def faces(cards: list[Card]) -> list[tuple[Suit, Rank]]:
+    return [(card.suit, card.rank) for card in cards]
+
+
+def insert(hand: list[Card], drawn: list[Card], mode: str) -> list[Card]:
+    # insertDrawnCards only uses 'hand' and 'sorting', no need to build a whole GameState
+    state = SimpleNamespace(hand=list(hand), sorting=mode)
+    GameState.insertDrawnCards(state, drawn)
+    return state.hand
+
+
+@pytest.mark.parametrize("mode", ["suit", "rank"])
+@pytest.mark.parametrize("seed", range(3))
+def test_insert_drawn_cards_matches_a_full_sort(mode, seed):
+    rng = random.Random(seed)
+    key = SORT_KEYS[mode]
+    for _ in range(300):
+        hand = sorted(random_cards(rng, rng.randint(0, 10)), key=key)
+        drawn = random_cards(rng, rng.randint(0, 8))
+        assert insert(hand, drawn, mode) == sorted(hand + drawn, key=key)
+
+
+@pytest.mark.parametrize("mode", ["suit", "rank"])
+def test_insert_after_a_tarot_changed_a_card(mode):
+    rng = random.Random(7)
+    key = SORT_KEYS[mode]
+    for _ in range(300):
+        hand = sorted(random_cards(rng, rng.randint(2, 10)), key=key)
+        # Death 13 / Star Platinum style change in place, the hand is no longer in key order
+        changed = rng.choice(hand)
+        changed.rank = rng.choice(list(Rank))
+        changed.suit = rng.choice(list(Suit))
+        drawn = random_cards(rng, rng.randint(0, 8))
+        assert insert(hand, drawn, mode) == sorted(hand + drawn, key=key)
+
+
+def test_insert_keeps_equal_cards_in_draw_order():
+    hand = [Card(Suit.HEARTS, Rank.KING), Card(Suit.HEARTS, Rank.TWO)]
+    first, second = Card(Suit.HEARTS, Rank.FIVE), Card(Suit.HEARTS, Rank.FIVE)
+    result = insert(hand, [first, second], "suit")
+    assert [id(card) for card in result] == [id(hand[0]), id(first), id(second), id(hand[1])]
+
+
+def test_unsorted_mode_appends():
+    hand = [Card(Suit.SPADES, Rank.TWO), Card(Suit.HEARTS, Rank.ACE)]
+    drawn = [Card(Suit.CLUBS, Rank.NINE)]
+    assert insert(hand, drawn, "") == hand + drawn
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_sort_keys_match_the_old_sort(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        hand = random_cards(rng, rng.randint(0, 12))
+        assert faces(sorted(hand, key=SORT_KEYS["suit"])) == faces(legacy_sort(hand, "suit"))
+        # Rank mode keeps the old rank order; equal ranks are now ordered by suit (the old loop left them arbitrary)
+        byRank = sorted(hand, key=SORT_KEYS["rank"])
+        assert [card.rank for card in byRank] == [card.rank for card in legacy_sort(hand, "rank")]
+        for a, b in zip(byRank, byRank[1:]):
+            if a.rank == b.rank:
+                assert SUIT_ORDER[a.suit] <= SUIT_ORDER[b.suit]
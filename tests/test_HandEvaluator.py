@@ -0,0 +1,180 @@
+import random
+import numpy as np
+import pytest
+from Cards.Card import Card, Suit, Rank, Enhancement
+from Deck.HandEvaluator import (HAND_TYPES, evaluate_hand, evaluate_hand_bits, hand_contains, score_kernel,
+                                encode_hands, score_hands_batch)
+import legacy_hand_evaluator
+
+RANKS = list(Rank)
+SUITS = list(Suit)
+ENHANCEMENTS = list(Enhancement)
+# Narrow rank pools make pairs, straights and flushes common enough to be checked thousands of times
+RANK_POOLS = [RANKS, RANKS[:4] + [Rank.ACE], RANKS[8:], RANKS[:3]]
+# Same shape as GameState.HAND_SCORES, without importing the game state
+HAND_SCORES = {
+    "Flush Five": {"chips": 160, "multiplier": 16},
+    "Flush House": {"chips": 140, "multiplier": 14},
+    "Five of a Kind": {"chips": 120, "multiplier": 12},
+    "Straight Flush": {"chips": 100, "multiplier": 8},
+    "Four of a Kind": {"chips": 60, "multiplier": 7},
+    "Full House": {"chips": 40, "multiplier": 4},
+    "Flush": {"chips": 35, "multiplier": 4},
+    "Straight": {"chips": 30, "multiplier": 4},
+    "Three of a Kind": {"chips": 30, "multiplier": 3},
+    "Two Pair": {"chips": 20, "multiplier": 2},
+    "One Pair": {"chips": 10, "multiplier": 2},
+    "High Card": {"chips": 5, "multiplier": 1},
+}
+
+
+def random_hand(rng: random.Random) -> list[Card]:
+    size = rng.choice([0, 1, 2, 3, 4, 5, 5, 5, 5, 6, 7, 8])
+    pool = rng.choice(RANK_POOLS)
+    suits = rng.choice([SUITS, SUITS[:1], SUITS[:2]])
+    return [Card(rng.choice(suits), rng.choice(pool),
+                 enhancement=rng.choice(ENHANCEMENTS) if rng.random() < 0.3 else Enhancement.BASIC)
+            for _ in range(size)]
+
+
+def cards(*specs, enhancement=Enhancement.BASIC) -> list[Card]:
+    return [Card(suit, rank, enhancement=enhancement) for rank, suit in specs]
+
+
+# ---------- evaluate_hand ----------
+@pytest.mark.parametrize("seed", range(4))
+def test_evaluate_hand_matches_legacy_evaluator(seed):
+    rng = random.Random(seed)
+    for _ in range(20000):
+        hand = random_hand(rng)
+        assert evaluate_hand(hand) == legacy_hand_evaluator.evaluate_hand(hand), [f"{c} {c.enhancement.name}" for c in hand]
+
+
+@pytest.mark.parametrize("hand, expected", [
+    ([], "High Card"),
+    (cards((Rank.ACE, Suit.SPADES)), "High Card"),
+    (cards((Rank.TWO, Suit.SPADES), (Rank.TWO, Suit.HEARTS), (Rank.NINE, Suit.CLUBS)), "One Pair"),
+    (cards((Rank.TWO, Suit.SPADES), (Rank.TWO, Suit.HEARTS), (Rank.NINE, Suit.CLUBS), (Rank.NINE, Suit.HEARTS)), "Two Pair"),
+    (cards((Rank.ACE, Suit.SPADES), (Rank.TWO, Suit.HEARTS), (Rank.THREE, Suit.CLUBS), (Rank.FOUR, Suit.HEARTS), (Rank.FIVE, Suit.DIAMONDS)), "Straight"),
+    (cards((Rank.TEN, Suit.SPADES), (Rank.JACK, Suit.SPADES), (Rank.QUEEN, Suit.SPADES), (Rank.KING, Suit.SPADES), (Rank.ACE, Suit.SPADES)), "Royal Flush"),
+    (cards((Rank.SIX, Suit.SPADES), (Rank.SIX, Suit.HEARTS), (Rank.SIX, Suit.CLUBS), (Rank.KING, Suit.HEARTS), (Rank.KING, Suit.DIAMONDS)), "Full House"),
+    (cards(*[(Rank.SEVEN, Suit.HEARTS)] * 5), "Flush Five"),
+    (cards((Rank.TWO, Suit.SPADES), (Rank.FOUR, Suit.HEARTS), (Rank.SIX, Suit.CLUBS), (Rank.EIGHT, Suit.HEARTS), (Rank.TEN, Suit.DIAMONDS),
+           enhancement=Enhancement.WILD), "Flush"),
+])
+def test_evaluate_hand_known_hands(hand, expected):
+    assert evaluate_hand(hand) == expected
+    assert legacy_hand_evaluator.evaluate_hand(hand) == expected
+
+
+def test_hand_bits_contain_the_best_hand_and_its_parts():
+    hand = cards((Rank.SIX, Suit.SPADES), (Rank.SIX, Suit.HEARTS), (Rank.SIX, Suit.CLUBS), (Rank.KING, Suit.HEARTS), (Rank.KING, Suit.DIAMONDS))
+    name, mask = evaluate_hand_bits(hand)
+    assert name == "Full House"
+    assert mask.bit_length() - 1 == HAND_TYPES.index("Full House")
+    for part in ("One Pair", "Three of a Kind", "Full House"):
+        assert hand_contains(mask, part)
+    for missing in ("Flush", "Straight", "Four of a Kind"):
+        assert not hand_contains(mask, missing)
+
+
+# ---------- score_kernel ----------
+@pytest.mark.parametrize("seed", range(2))
+def test_score_kernel_agrees_with_evaluator(seed):
+    rng = random.Random(100 + seed)
+    for _ in range(20000):
+        hand = random_hand(rng)
+        name, mask, scoring = score_kernel(hand)
+        assert (name, mask) == evaluate_hand_bits(hand)
+        assert scoring == sorted(set(scoring))
+        assert all(0 <= i < len(hand) for i in scoring)
+        # Stone cards always score, the other scoring cards come from the best hand
+        # (Stone cards keep their rank for the evaluator, so they can also complete it)
+        stones = [i for i, c in enumerate(hand) if c.enhancement == Enhancement.STONE]
+        assert set(stones) <= set(scoring)
+        ranked = [hand[i] for i in scoring if i not in stones]
+        if hand:
+            assert ranked or stones
+        if name == "High Card":
+            assert len(ranked) <= 1
+        elif name in ("One Pair", "Three of a Kind", "Four of a Kind", "Five of a Kind"):
+            assert len({c.rank for c in ranked}) <= 1
+        elif name == "Two Pair":
+            assert len({c.rank for c in ranked}) <= 2
+        elif name == "Straight":
+            # One card per rank (the evaluator's straights span every distinct rank)
+            assert len(ranked) == len({c.rank for c in ranked})
+            assert {hand[i].rank for i in scoring} == {c.rank for c in hand}
+        elif name == "Royal Flush":
+            assert len(ranked) == len({c.rank for c in ranked})
+        elif name == "Flush":
+            assert len(ranked) <= 5
+
+
+@pytest.mark.parametrize("hand, expected", [
+    ([], []),
+    (cards((Rank.FOUR, Suit.SPADES), (Rank.KING, Suit.HEARTS), (Rank.NINE, Suit.CLUBS)), [1]),
+    (cards((Rank.TWO, Suit.SPADES), (Rank.NINE, Suit.HEARTS), (Rank.TWO, Suit.CLUBS), (Rank.KING, Suit.HEARTS)), [0, 2]),
+    (cards((Rank.TWO, Suit.SPADES), (Rank.TWO, Suit.HEARTS), (Rank.NINE, Suit.CLUBS), (Rank.NINE, Suit.HEARTS), (Rank.FOUR, Suit.HEARTS)), [0, 1, 2, 3]),
+    (cards((Rank.ACE, Suit.SPADES), (Rank.TWO, Suit.HEARTS), (Rank.THREE, Suit.CLUBS), (Rank.THREE, Suit.HEARTS),
+           (Rank.FOUR, Suit.HEARTS), (Rank.FIVE, Suit.DIAMONDS)), [0, 1, 2, 4, 5]),
+])
+def test_score_kernel_scoring_cards(hand, expected):
+    assert score_kernel(hand)[2] == expected
+
+
+def test_score_kernel_stone_cards_always_score():
+    hand = cards((Rank.TWO, Suit.SPADES), (Rank.TWO, Suit.HEARTS), (Rank.NINE, Suit.CLUBS))
+    hand.append(Card(Suit.CLUBS, Rank.FOUR, enhancement=Enhancement.STONE))
+    assert score_kernel(hand) == ("One Pair", evaluate_hand_bits(hand)[1], [0, 1, 3])
+
+
+# ---------- score_hands_batch ----------
+def kernel_score(hand: list[Card]) -> tuple[str, int, float]:
+    """What score_hands_batch must return for one hand: score_kernel plus the non-random enhancements."""
+    name, _, scoring = score_kernel(hand)
+    info = HAND_SCORES.get(name, {"chips": 0, "multiplier": 1})
+    chips, mult = info["chips"], info["multiplier"]
+    for i in scoring:
+        card = hand[i]
+        if card.enhancement == Enhancement.STONE:
+            chips += 50
+            continue
+        chips += card.chips
+        if card.enhancement == Enhancement.BONUS:
+            chips += 30
+        elif card.enhancement == Enhancement.MULT:
+            mult += 4
+        elif card.enhancement == Enhancement.GLASS:
+            mult *= 2
+    return name, chips, mult
+
+
+@pytest.mark.parametrize("size", [1, 3, 5, 7, 8])
+def test_score_hands_batch_matches_kernel(size):
+    rng = random.Random(size)
+    hands = []
+    for _ in range(3000):
+        pool = rng.choice(RANK_POOLS)
+        hands.append([Card(rng.choice(SUITS), rng.choice(pool),
+                           enhancement=rng.choice(ENHANCEMENTS) if rng.random() < 0.3 else Enhancement.BASIC)
+                      for _ in range(size)])
+    types, chips, mult = score_hands_batch(*encode_hands(hands), HAND_SCORES)
+    for hand, t, c, m in zip(hands, types, chips, mult):
+        assert (HAND_TYPES[t], c, m) == kernel_score(hand)
+
+
+def test_score_hands_batch_without_enhancements():
+    rng = np.random.default_rng(0)
+    codes = np.array([rng.choice(52, size=5, replace=False) for _ in range(500)], dtype=np.int16)
+    types, chips, mult = score_hands_batch(codes, None, HAND_SCORES)
+    for row, t, c, m in zip(codes, types, chips, mult):
+        hand = [Card(SUITS[code // 13], RANKS[code % 13]) for code in row]
+        assert (HAND_TYPES[t], c, m) == kernel_score(hand)
+
+
+def test_score_hands_batch_rejects_bad_shapes():
+    with pytest.raises(ValueError):
+        score_hands_batch(np.zeros(5, dtype=np.int16), None, HAND_SCORES)
+    with pytest.raises(ValueError):
+        score_hands_batch(np.zeros((2, 5), dtype=np.int16), np.zeros((2, 4), dtype=np.int8), HAND_SCORES)
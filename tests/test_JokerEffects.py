@@ -0,0 +1,153 @@
+import random
+import pytest
+from Cards.Card import Card, Suit, Rank
+from Deck import JokerEffects
+from Deck.HandScoring import score_hand
+from Deck.JokerEffects import (Bonus, JokerPipeline, compile_jokers, joker_bonus, joker_effect, rank_mask,
+                               HELD_CARD, ON_HAND, SCORED_CARD)
+
+HAND_LEVELS = {"One Pair": {"chips": 10, "multiplier": 2}, "Straight": {"chips": 30, "multiplier": 4},
+               "High Card": {"chips": 5, "multiplier": 1}}
+PAIR = [Card(Suit.SPADES, Rank.KING), Card(Suit.HEARTS, Rank.KING), Card(Suit.CLUBS, Rank.FOUR)]  # 30 chips x 2
+
+
+class FixedRoll:
+    """rng stand-in whose randint always returns 'value' (clamped to the asked range)."""
+    def __init__(self, value: int):
+        self.value = value
+
+    def randint(self, low: int, high: int) -> int:
+        return min(max(self.value, low), high)
+
+
+def score(selected, jokers, **kwargs):
+    kwargs.setdefault("rng", random.Random(0))
+    return score_hand(selected, kwargs.pop("held", []), jokers, HAND_LEVELS, **kwargs)
+
+
+# ---------- Catalog ----------
+@pytest.mark.parametrize("joker, chips, mult", [
+    ("The Joker", 30, 6),
+    ("Gauntlet", 280, 2),
+    ("Ogre", 30, 5),
+    ("Straw Hat", 130, 2),
+    ("Hog Rider", 30, 2),
+])
+def test_on_hand_jokers(joker, chips, mult):
+    result = score(PAIR, [joker])
+    assert (result.chips, result.mult, result.score) == (chips, mult, chips * mult)
+    assert result.activated_jokers == [joker]
+
+
+def test_gauntlet_costs_two_hands():
+    assert score(PAIR, ["Gauntlet"]).hands == -2
+
+
+def test_michael_myers_rolls_the_mult():
+    assert score(PAIR, ["Michael Myers"], rng=FixedRoll(17)).mult == 19
+    assert score(PAIR, ["Michael Myers"], rng=FixedRoll(99)).mult == 25
+
+
+def test_ogre_counts_every_owned_joker():
+    assert score(PAIR, ["Ogre", "The Joker", "Plain Joker"]).mult == 2 + 4 + 9
+    # Disabled jokers are left out of 'jokers' but still owned
+    assert score(PAIR, ["Ogre"], joker_count=4).mult == 2 + 12
+
+
+def test_straw_hat_shrinks_with_hands_played():
+    assert score(PAIR, ["Straw Hat"], hands_played=3).chips == 30 + 85
+    assert score(PAIR, ["Straw Hat"], hands_played=40).chips == 30
+
+
+def test_hog_rider_pays_on_straights():
+    straight = [Card(Suit.SPADES, rank) for rank in (Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE)] + [Card(Suit.HEARTS, Rank.SIX)]
+    result = score(straight, ["Hog Rider"])
+    assert result.hand_name == "Straight"
+    assert result.chips == 30 + 2 + 3 + 4 + 5 + 6 + 100
+
+
+def test_question_block_needs_four_played_cards():
+    four = PAIR + [Card(Suit.CLUBS, Rank.NINE)]
+    assert score(four, ["? Block"]).chips == 34
+    assert score(four, ["? Block"]).activated_jokers == ["? Block"]
+    assert score(PAIR, ["? Block"]).chips == 30
+    assert score(PAIR, ["? Block"]).activated_jokers == []
+
+
+def test_fibonacci_counts_every_played_card():
+    # Only the Kings score, but the Two and the Ace were played too
+    selected = PAIR + [Card(Suit.CLUBS, Rank.TWO), Card(Suit.DIAMONDS, Rank.ACE)]
+    assert score(selected, ["Fibonacci"]).mult == 2 + 16
+    assert score(PAIR, ["Fibonacci"]).mult == 2
+    assert score(PAIR, ["Fibonacci"]).activated_jokers == []
+
+
+def test_hogwarts_per_played_ace():
+    selected = [Card(Suit.SPADES, Rank.ACE), Card(Suit.HEARTS, Rank.ACE), Card(Suit.CLUBS, Rank.FOUR)]
+    result = score(selected, ["Hogwarts"])
+    assert (result.chips, result.mult) == (10 + 22 + 40, 2 + 8)
+    assert result.activated_jokers == ["Hogwarts"]
+    assert score(PAIR, ["Hogwarts"]).activated_jokers == []
+
+
+def test_802_doubles_the_final_score():
+    result = score(PAIR, ["802", "The Joker"])
+    assert (result.chips, result.mult, result.score) == (30, 6, 360)
+
+
+def test_activated_jokers_follow_catalog_order():
+    result = score(PAIR, ["802", "Straw Hat", "The Joker", "Plain Joker"])
+    assert result.activated_jokers == ["The Joker", "Straw Hat", "802"]
+
+
+# ---------- Pipeline ----------
+def test_compile_jokers_is_cached_per_inventory():
+    pipeline = compile_jokers(["The Joker", "Ogre"])
+    assert compile_jokers(["Ogre", "The Joker", "Ogre"]) is pipeline
+    assert compile_jokers(["Ogre"]) is not pipeline
+
+
+def test_pipeline_counts_unknown_jokers_and_folds_fixed_bonuses():
+    pipeline = JokerPipeline(["The Joker", "Gauntlet", "Ogre", "Plain Joker"])
+    assert len(pipeline) == 4
+    assert pipeline.order == ("The Joker", "Gauntlet", "Ogre")
+    names, total, dynamic = pipeline.hand
+    assert names == ("The Joker", "Gauntlet")
+    assert total == Bonus(chips=250, mult=4, hands=-2)
+    assert [name for name, _ in dynamic] == ["Ogre"]
+    assert pipeline.played == {} and pipeline.end is None
+
+
+def test_card_phase_steps_only_exist_for_matching_ranks():
+    pipeline = JokerPipeline(["Fibonacci", "Hogwarts"])
+    assert set(pipeline.played) == {rank.bit for rank in (Rank.TWO, Rank.THREE, Rank.FIVE, Rank.EIGHT, Rank.ACE)}
+    assert pipeline.played[Rank.ACE.bit][1] == Bonus(chips=20, mult=12)
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    """A private copy of the catalog, so test jokers don't leak into the game's."""
+    monkeypatch.setattr(JokerEffects, "JOKER_EFFECTS", dict(JokerEffects.JOKER_EFFECTS))
+    return JokerEffects.JOKER_EFFECTS
+
+
+def test_scored_and_held_card_phases(catalog):
+    joker_bonus("Test Scored King", SCORED_CARD, Bonus(chips=7), ranks=rank_mask(Rank.KING))
+
+    @joker_effect("Test Held", HELD_CARD)
+    def held(card, ctx):
+        return Bonus(mult=card.rank.value) if card.rank == Rank.TWO else None
+
+    pipeline = JokerPipeline(["Test Scored King", "Test Held"])
+    held_cards = [Card(Suit.CLUBS, Rank.TWO), Card(Suit.CLUBS, Rank.NINE)]
+    result = score_hand(PAIR, held_cards, pipeline, HAND_LEVELS, rng=random.Random(0))
+    assert (result.chips, result.mult) == (30 + 14, 2 + 2)
+    assert result.activated_jokers == ["Test Scored King", "Test Held"]
+
+
+def test_register_rejects_bad_phases(catalog):
+    with pytest.raises(ValueError):
+        joker_bonus("Test Bad Phase", "whenever", Bonus(mult=1))
+    with pytest.raises(ValueError):
+        joker_bonus("Test Ranked Hand", ON_HAND, Bonus(mult=1), ranks=rank_mask(Rank.ACE))
+    assert "Test Bad Phase" not in catalog and "Test Ranked Hand" not in catalog
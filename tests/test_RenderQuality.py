@@ -0,0 +1,40 @@
+import pytest
+from Engine.DirtyRects import dirtyRects
+from Engine.RenderQuality import ADAPT_COOLDOWN, RAISE_AFTER, RenderQuality
+
+
+def run(quality: RenderQuality, workMs: float, frames: int):
+    for _ in range(frames):
+        quality.sample(workMs)
+
+
+def test_adaptive_steps_down_then_back_up_quietly(capsys):
+    quality = RenderQuality("high", adaptive=True, budgetMs=10)
+    run(quality, 20, 40)
+    assert quality.level == "medium" and quality.changes == 1
+    run(quality, 20, ADAPT_COOLDOWN + 1)
+    assert quality.level == "low" and quality.changes == 2
+    # Never below low, never above the level the player picked
+    run(quality, 0, ADAPT_COOLDOWN + 2 * RAISE_AFTER + 200)
+    assert quality.level == "high"
+    run(quality, 0, RAISE_AFTER * 2)
+    assert quality.level == "high" and quality.changes == 4
+    assert capsys.readouterr().out == ""
+
+
+def test_level_changes_invalidate_the_frame():
+    quality = RenderQuality("high", adaptive=True, budgetMs=10)
+    dirtyRects.full = False
+    run(quality, 20, 40)
+    assert quality.level == "medium" and dirtyRects.full
+    dirtyRects.full = False
+    quality.setLevel("low")
+    assert dirtyRects.full
+
+
+def test_fixed_mode_ignores_frame_times():
+    quality = RenderQuality("medium")
+    run(quality, 100, 500)
+    assert quality.level == "medium" and quality.changes == 0
+    with pytest.raises(ValueError):
+        quality.setLevel("ultra")
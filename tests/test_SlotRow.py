@@ -0,0 +1,49 @@
+import pygame
+from Engine.SlotRow import SlotRow
+
+
+def row_of(count: int, originX: int = 100, pitch: int = 60, width: int = 50) -> SlotRow:
+    row = SlotRow()
+    row.reset(originX, pitch, count)
+    for i in range(count):
+        row.place(i, f"slot{i}", pygame.Rect(originX + i * pitch, 10, width, 80))
+    return row
+
+
+def brute_force(row: SlotRow, pos):
+    for entry in row.entries:
+        if entry is not None and entry[1].collidepoint(pos):
+            return entry
+    return None
+
+
+def test_hits_the_slot_under_the_point():
+    row = row_of(5)
+    assert row.at((100, 50))[0] == "slot0"
+    assert row.at((100 + 4 * 60 + 49, 89))[0] == "slot4"
+    assert row.at((155, 50)) is None   # gap between two slots
+    assert row.at((120, 5)) is None    # above the row
+    assert row.at((50, 50)) is None    # left of the row
+    assert row.at((1000, 50)) is None  # right of the row
+
+
+def test_rects_drawn_outside_their_slot_still_hit():
+    row = row_of(3)
+    # Activated jokers are drawn lifted and shifted a few pixels
+    row.place(1, "lifted", pygame.Rect(100 + 60 - 8, 0, 50, 80))
+    assert row.at((153, 20))[0] == "lifted"
+
+
+def test_empty_slots_and_reset():
+    row = row_of(3)
+    row.reset(100, 60, 3)
+    assert row.at((110, 50)) is None
+    row.reset(0, 0, 0)  # a zero pitch must not divide by zero
+    assert row.at((10, 10)) is None
+
+
+def test_matches_a_linear_scan():
+    row = row_of(6, originX=37, pitch=71, width=64)
+    for x in range(0, 520, 3):
+        for y in (9, 10, 50, 89, 90):
+            assert row.at((x, y)) == brute_force(row, (x, y))
@@ -0,0 +1,107 @@
+import pytest
+from Engine.Timeline import Animator, Timeline, easeOut, linear
+
+
+def test_easings():
+    assert [linear(t) for t in (0, 0.5, 1)] == [0, 0.5, 1]
+    assert [easeOut(t) for t in (0, 0.5, 1)] == [0, 0.75, 1]
+
+
+def test_tween_reaches_its_end_value():
+    values = []
+    timeline = Timeline().tween(1.0, values.append, 0, 100)
+    assert timeline.advance(0.25) is False
+    assert timeline.advance(0.5) is False
+    assert timeline.advance(0.5) is True
+    assert values == [25, 75, 100]
+
+
+def test_steps_run_in_order_and_carry_leftover_time():
+    log = []
+    timeline = (Timeline()
+                .tween(0.2, lambda v: log.append(("fade", v)), 0, 10)
+                .wait(0.3)
+                .call(lambda: log.append("done")))
+    timeline.advance(0.1)
+    assert log == [("fade", 5)]
+    # 0.1 finishes the tween, the extra 0.2 goes into the wait
+    timeline.advance(0.3)
+    assert log[-1] == ("fade", 10)
+    assert "done" not in log
+    assert timeline.advance(0.1) is True
+    assert log[-1] == "done"
+    assert log.count("done") == 1
+
+
+def test_one_long_frame_runs_the_whole_sequence():
+    log = []
+    timeline = Timeline().wait(0.5).call(lambda: log.append(1)).wait(0.5).call(lambda: log.append(2))
+    assert timeline.advance(5.0) is True
+    assert log == [1, 2]
+    # A finished timeline stays finished
+    assert timeline.advance(1.0) is True
+    assert log == [1, 2]
+
+
+def test_same_total_time_whatever_the_step_size():
+    for dt in (1 / 30, 1 / 60, 1 / 144):
+        timeline = Timeline().tween(0.5, lambda v: None, 0, 1).wait(0.5)
+        steps = 0
+        while not timeline.advance(dt):
+            steps += 1
+        assert (steps + 1) * dt == pytest.approx(1.0, abs=dt)
+
+
+# ---------- Animator ----------
+def test_animator_drops_finished_timelines():
+    animator = Animator()
+    animator.play(Timeline("a").wait(0.1))
+    animator.play(Timeline("b").wait(0.3))
+    assert animator.isPlaying() and animator.isPlaying("a")
+    animator.update(0.2)
+    assert not animator.isPlaying("a") and animator.isPlaying("b")
+    animator.update(0.2)
+    assert not animator.isPlaying()
+
+
+def test_playing_a_name_again_replaces_it():
+    values = []
+    animator = Animator()
+    animator.play(Timeline("flash").tween(1.0, values.append, 0, 10))
+    animator.play(Timeline("flash").tween(1.0, values.append, 100, 110))
+    animator.update(0.5)
+    assert values == [105]
+    assert len(animator.timelines) == 1
+
+
+def test_unnamed_timelines_run_side_by_side():
+    animator = Animator()
+    animator.play(Timeline().wait(1.0))
+    animator.play(Timeline().wait(1.0))
+    assert len(animator.timelines) == 2
+
+
+def test_cancel_and_clear():
+    animator = Animator()
+    animator.play(Timeline("a").wait(1.0))
+    animator.play(Timeline("b").wait(1.0))
+    animator.cancel("a")
+    assert not animator.isPlaying("a") and animator.isPlaying("b")
+    animator.clear()
+    assert not animator.isPlaying()
+
+
+def test_steps_may_play_and_cancel_timelines():
+    log = []
+    animator = Animator()
+    follow = Timeline("follow").call(lambda: log.append("follow"))
+    animator.play(Timeline("first").call(lambda: animator.play(follow)))
+    animator.play(Timeline("killer").call(lambda: animator.cancel("victim")))
+    animator.play(Timeline("victim").call(lambda: log.append("victim")))
+    animator.update(0.0)
+    # The timeline played during the update starts on the next one, the cancelled one never runs
+    assert log == []
+    assert animator.isPlaying("follow") and not animator.isPlaying("victim")
+    animator.update(0.0)
+    assert log == ["follow"]
+    assert not animator.isPlaying()